@@ -29,5 +29,126 @@ from windactionsAU.aerodynamic_shape_factors import(
     ext_pressure_coeff_roof_shallow,
     ext_pressure_coeff_roof_steep,
     area_reduction_factor,
-    tributary_area
-)
\ No newline at end of file
+    tributary_area,
+    action_combination_factor,
+    int_pressure_coeff_permeable,
+    int_pressure_coeff_dominant_opening,
+)
+
+from windactionsAU.batch import(
+    average_recurrence_interval_batch,
+    regional_wind_speed_batch,
+    site_wind_speed_batch,
+    design_wind_speed_batch,
+    sector_maximum_batch,
+    wind_direction_multiplier_batch,
+    climate_change_multiplier_batch,
+    shielding_multiplier_batch,
+    topographic_multiplier_batch,
+    terrain_height_multiplier_batch,
+    ext_pressure_coeff_windward_wall_batch,
+    ext_pressure_coeff_leeward_wall_batch,
+    ext_pressure_coeff_roof_steep_batch,
+    ext_pressure_coeff_all_directions_batch,
+    ext_pressure_coeff_roof_shallow_batch,
+    int_pressure_coeff_batch,
+    action_combination_factor_batch,
+    net_pressure_batch,
+)
+
+from windactionsAU.topography import(
+    ElevationRaster,
+    hill_parameters_from_dem,
+    topographic_multipliers_from_dem,
+)
+
+from windactionsAU.storey_loads import(
+    storey_wind_loads,
+)
+
+from windactionsAU.dynamic_response import(
+    turbulence_intensity,
+    dynamic_response_factor,
+)
+
+from windactionsAU.cache import(
+    ResultCache,
+    make_key,
+)
+
+from windactionsAU.envelope import(
+    governing_pressures,
+)
+
+from windactionsAU.zones import(
+    side_wall_cpe_at,
+    side_wall_cpe_span_average,
+    roof_cpe_at,
+    roof_cpe_span_average,
+)
+
+from windactionsAU.validation import(
+    validate_inputs,
+    validation_report,
+    decode_errors,
+    parse_boolean,
+)
+
+from windactionsAU.pipeline import(
+    BatchResult,
+    evaluate_sites,
+    precision_report,
+    update_sites,
+)
+
+from windactionsAU.anemometer import(
+    implied_ari,
+    read_gust_records,
+    annual_maxima,
+    peaks_over_threshold,
+    compare_to_design,
+)
+
+from windactionsAU.hazard import(
+    ari_grid,
+    hazard_curve,
+    lognormal_fragility,
+    expected_annual_loss,
+)
+
+from windactionsAU.facades import(
+    facade_normals,
+    footprint_dimensions,
+    facade_wind_actions,
+)
+
+from windactionsAU.trace import(
+    decode_trace,
+    trace_report,
+)
+
+from windactionsAU.frames import(
+    portal_frame_loads,
+    frame_load_table,
+)
+
+from windactionsAU.raster import(
+    site_wind_speed_map,
+)
+
+from windactionsAU.micro_batch import(
+    MicroBatcher,
+    AsyncWindActions,
+)
+
+from windactionsAU.sensitivity import(
+    terrain_height_multiplier_slope,
+    topographic_multiplier_slopes,
+    design_pressure_sensitivities,
+)
+
+from windactionsAU.shadow import(
+    scalar_site_results,
+    scalar_pressure_coefficients,
+    ShadowChecker,
+)
@@ -2,6 +2,25 @@ import numpy as np
 
 from windactionsAU.utils import str_to_float
 
+
+# Table 5.1(B) coefficients (a_min, b_min, a_max, b_max), C_pi = a + b * C_pe
+DOMINANT_OPENING_RATIOS = np.array([0.5, 1.0, 2.0, 3.0, 6.0])
+DOMINANT_OPENING_WINDWARD = np.array([
+    [-0.3, 0.0, 0.0, 0.0],
+    [-0.1, 0.0, 0.2, 0.0],
+    [0.0, 0.7, 0.0, 0.7],
+    [0.0, 0.85, 0.0, 0.85],
+    [0.0, 1.0, 0.0, 1.0],
+])
+DOMINANT_OPENING_OTHER = np.array([
+    [-0.3, 0.0, 0.0, 0.0],
+    [-0.3, 0.0, 0.0, 0.0],
+    [0.0, 1.0, 0.0, 1.0],
+    [0.0, 1.0, 0.0, 1.0],
+    [0.0, 1.0, 0.0, 1.0],
+])
+
+
 def ext_pressure_coeff_windward_wall(h: float, vary_with_height: bool=False) -> float:
     """
     Calculates the windward wall external pressure coefficient for a rectangular 
@@ -96,7 +115,7 @@ def ext_pressure_coeff_roof_shallow(h: float, d: float, alpha: float):
             }
         elif height_depth_ratio >= 1.0:
             C_pe = {
-                "0 to 0.5h": [-1.3, 0.6],
+                "0 to 0.5h": [-1.3, -0.6],
                 "0.5h to 1h": [-0.7, -0.3],
                 "1h to 2h": [-0.7, -0.3],
                 "2h to 3h": [0.0, 0.0],
@@ -268,6 +287,85 @@ def area_reduction_factor(trib_area: float, surface_parameter: str) -> float:
     return K_a
 
 
+def int_pressure_coeff_permeable(permeability: str) -> list:
+    """
+    Calculates the internal pressure coefficients for enclosed buildings
+    with permeable walls and without dominant openings per AS/NZS
+    1170.2:2021 Table 5.1(A).
+
+    Args:
+        permeability: the permeability condition of the building. The input
+            shall be either:
+            {
+                "One wall permeable, windward": only the windward wall is
+                    permeable, the other walls are impermeable.
+                "One wall permeable, non-windward": one wall other than the
+                    windward wall is permeable.
+                "Two or three walls permeable, windward": two or three walls
+                    are equally permeable, including the windward wall.
+                "Two or three walls permeable, non-windward": two or three
+                    walls are equally permeable, the windward wall is
+                    impermeable.
+                "All walls permeable": all walls are equally permeable.
+                "Sealed": effectively sealed building with non-opening
+                    windows.
+            }
+
+    Returns:
+        Internal pressure coefficients, C_pi, as [minimum, maximum].
+    """
+    C_pi = {
+        "One wall permeable, windward": [0.6, 0.6],
+        "One wall permeable, non-windward": [-0.3, -0.3],
+        "Two or three walls permeable, windward": [-0.1, 0.2],
+        "Two or three walls permeable, non-windward": [-0.3, -0.3],
+        "All walls permeable": [-0.3, 0.0],
+        "Sealed": [-0.2, 0.0],
+    }
+    try:
+        return C_pi[permeability]
+    except KeyError:
+        raise KeyError(f"The permeability condition '{permeability}' is invalid. Please input a valid condition.")
+
+
+def int_pressure_coeff_dominant_opening(
+        opening_ratio: float,
+        opening_surface: str,
+        C_pe: float=0.0
+) -> list:
+    """
+    Calculates the internal pressure coefficients for enclosed buildings
+    with a dominant opening per AS/NZS 1170.2:2021 Table 5.1(B). Ratios
+    between the tabulated values are linearly interpolated.
+
+    Args:
+        opening_ratio: ratio of the dominant opening area to the total open
+            area (including permeability) of the other wall and roof surfaces.
+        opening_surface: the surface containing the dominant opening. The
+            input shall be either 'Windward Wall', 'Leeward Wall', 'Side Wall'
+            or 'Roof'.
+        C_pe: the external pressure coefficient at the location of the
+            dominant opening; default is 0.0.
+
+    Returns:
+        Internal pressure coefficients, C_pi, as [minimum, maximum].
+    """
+    surface_lowercase = str.lower(opening_surface)
+    # Each row gives C_pi = a + b * C_pe for the [minimum, maximum] cases
+    if surface_lowercase == "windward wall":
+        coeffs = DOMINANT_OPENING_WINDWARD
+    elif surface_lowercase in ("leeward wall", "side wall", "roof"):
+        coeffs = DOMINANT_OPENING_OTHER
+    else:
+        raise KeyError(f"The opening surface '{opening_surface}' is invalid. Please input a valid surface.")
+    a_min, b_min, a_max, b_max = [
+        np.interp(opening_ratio, DOMINANT_OPENING_RATIOS, coeffs[:, i]) for i in range(4)
+    ]
+    C_pi_1 = a_min + b_min * C_pe
+    C_pi_2 = a_max + b_max * C_pe
+    return [min(C_pi_1, C_pi_2), max(C_pi_1, C_pi_2)]
+
+
 def action_combination_factor(C_pi: float, framing_type: str="Case z") -> float:
     """
     Calculates the action combination factor for walls and roofs of enclosed
@@ -308,23 +406,23 @@ def action_combination_factor(C_pi: float, framing_type: str="Case z") -> float:
 
     if framing_type == "Type 1" and abs(C_pi) < 0.4:
         design_case = "Case a"
-    elif design_case == "Type 1" and abs(C_pi) >= 0.4:
+    elif framing_type == "Type 1" and abs(C_pi) >= 0.4:
         design_case = "Case b"
     elif framing_type == "Type 2" and abs(C_pi) < 0.4:
         design_case = "Case c"
-    elif design_case == "Type 2" and abs(C_pi) >= 0.4:
+    elif framing_type == "Type 2" and abs(C_pi) >= 0.4:
         design_case = "Case d"
     elif framing_type == "Type 3" and abs(C_pi) < 0.4:
         design_case = "Case e"
-    elif design_case == "Type 3" and abs(C_pi) >= 0.4:
+    elif framing_type == "Type 3" and abs(C_pi) >= 0.4:
         design_case = "Case f"
     elif framing_type == "Type 4" and abs(C_pi) < 0.4:
         design_case = "Case g"
     elif framing_type == "Type 4" and abs(C_pi) >= 0.4:
         design_case = "Case h"
-    elif design_case == "Type 5" and abs(C_pi) < 0.4:
+    elif framing_type == "Type 5" and abs(C_pi) < 0.4:
         design_case = "Case h"
-    elif design_case == "Type 5" and abs(C_pi) >= 0.4:
+    else:
         design_case = "Case z"
 
     K_ce = action_combination_factors[design_case]["External"]
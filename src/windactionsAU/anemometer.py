@@ -0,0 +1,212 @@
+"""
+Streaming analysis of local anemometer gust records against the regional
+wind speed relationship V_R = a - b R^-0.1 of AS/NZS 1170.2:2021 Table 3.1.
+
+Gust records are read in chunks, so memory use is bounded by the chunk size
+and the number of extracted events rather than the length of the record.
+The gusts should already be standardised to the regional wind speed basis
+(3 s gust at 10 m height in TC2 terrain).
+"""
+
+import numpy as np
+import pandas as pd
+
+from windactionsAU.batch import REGIONAL_WIND_SPEED_COEFFS
+
+
+def implied_ari(gust, wind_region) -> np.ndarray:
+    """
+    Calculates the Average Recurrence Interval implied by gust speeds by
+    inverting the regional wind speed relationship, R = ((a - V) / b)^-10.
+
+    Args:
+        gust: array of gust speeds (m/s).
+        wind_region: the wind region, e.g. 'A2', or an array of regions.
+
+    Returns:
+        Array of implied ARIs (years); gusts at or above the asymptote a are
+        returned as infinity.
+    """
+    gust, wind_region = np.broadcast_arrays(
+        np.asarray(gust, dtype=float), np.asarray(wind_region)
+    )
+    a = np.empty(gust.shape)
+    b = np.empty(gust.shape)
+    for region in np.unique(wind_region):
+        try:
+            a_region, b_region = REGIONAL_WIND_SPEED_COEFFS[region]
+        except KeyError:
+            raise KeyError(f"The wind region '{region}' is invalid. Please input a valid region.")
+        mask = wind_region == region
+        a[mask] = a_region
+        b[mask] = b_region
+    ratio = (a - gust) / b
+    with np.errstate(divide='ignore'):
+        return np.where(ratio > 0, np.abs(ratio) ** -10.0, np.inf)
+
+
+def read_gust_records(
+        path,
+        time_column: str='time',
+        gust_column: str='gust',
+        chunksize: int=1_000_000,
+        **kwargs
+):
+    """
+    Reads a csv file of gust records in chunks.
+
+    Args:
+        path: location of the csv file.
+        time_column: name of the timestamp column; default is 'time'.
+        gust_column: name of the gust speed column (m/s); default is 'gust'.
+        chunksize: number of rows per chunk; default is 1,000,000.
+        **kwargs: passed to `pandas.read_csv`.
+
+    Yields:
+        Pandas DataFrames with the columns 'time' and 'gust'.
+    """
+    reader = pd.read_csv(
+        path, usecols=[time_column, gust_column], chunksize=chunksize, **kwargs
+    )
+    for chunk in reader:
+        yield pd.DataFrame({
+            'time': pd.to_datetime(chunk[time_column]),
+            'gust': pd.to_numeric(chunk[gust_column], errors='coerce'),
+        })
+
+
+def annual_maxima(chunks) -> pd.DataFrame:
+    """
+    Extracts the annual maximum gusts from a stream of gust records.
+
+    Args:
+        chunks: iterable of DataFrames with the columns 'time' and 'gust'.
+
+    Returns:
+        Pandas DataFrame indexed by year with the columns 'time' and 'gust'.
+    """
+    maxima = {}
+    for chunk in chunks:
+        chunk = chunk.dropna(subset=['gust'])
+        if chunk.empty:
+            continue
+        years = chunk['time'].dt.year
+        rows = chunk.loc[chunk['gust'].groupby(years).idxmax()]
+        for year, time, gust in zip(rows['time'].dt.year, rows['time'], rows['gust']):
+            if year not in maxima or gust > maxima[year][1]:
+                maxima[year] = (time, gust)
+    maxima_df = pd.DataFrame.from_dict(maxima, orient='index', columns=['time', 'gust'])
+    maxima_df.index.name = 'year'
+    return maxima_df.sort_index()
+
+
+def peaks_over_threshold(
+        chunks,
+        threshold: float,
+        separation: str='48h'
+) -> tuple:
+    """
+    Extracts independent storm peaks above a threshold from a stream of gust
+    records. Exceedances closer together than the separation period are
+    treated as a single storm, represented by its peak.
+
+    Args:
+        chunks: iterable of DataFrames with the columns 'time' and 'gust', in
+            time order.
+        threshold: gust threshold (m/s).
+        separation: minimum time between independent storms; default is
+            '48h'.
+
+    Returns:
+        Tuple of (peaks, years), where peaks is a Pandas DataFrame with the
+        columns 'time' and 'gust' and years is the length of the record
+        (years).
+    """
+    gap = pd.Timedelta(separation).to_timedelta64()
+    peaks = []
+    open_peak = None  # (time of last exceedance, peak time, peak gust)
+    first_time = None
+    last_time = None
+
+    for chunk in chunks:
+        chunk = chunk.dropna(subset=['gust'])
+        if chunk.empty:
+            continue
+        if first_time is None:
+            first_time = chunk['time'].iloc[0]
+        last_time = chunk['time'].iloc[-1]
+
+        exceed = chunk.loc[chunk['gust'] > threshold]
+        if exceed.empty:
+            continue
+        times = exceed['time'].to_numpy()
+        gusts = exceed['gust'].to_numpy()
+
+        previous = np.empty(times.shape, dtype=times.dtype)
+        previous[1:] = times[:-1]
+        previous[0] = open_peak[0] if open_peak is not None else times[0] - 2 * gap
+        new_storm = (times - previous) > gap
+        storm = np.cumsum(new_storm) - (1 if new_storm[0] else 0)
+
+        for i in range(storm[-1] + 1):
+            mask = storm == i
+            j = np.argmax(gusts[mask])
+            peak = (times[mask][-1], times[mask][j], gusts[mask][j])
+            if i == 0 and not new_storm[0]:
+                # Continues the open storm from the previous chunk
+                if open_peak[2] >= peak[2]:
+                    peak = (peak[0], open_peak[1], open_peak[2])
+            elif open_peak is not None:
+                peaks.append(open_peak[1:])
+            open_peak = peak
+
+    if open_peak is not None:
+        peaks.append(open_peak[1:])
+    years = 0.0 if first_time is None else (last_time - first_time) / pd.Timedelta(days=365.25)
+    return pd.DataFrame(data=peaks, columns=['time', 'gust']), years
+
+
+def compare_to_design(
+        events: pd.DataFrame,
+        wind_region: str,
+        years: float=None
+) -> pd.DataFrame:
+    """
+    Compares the empirical exceedance rates of measured gust events with the
+    rates implied by the regional design curve. For annual maxima the
+    Weibull plotting position p = rank / (n + 1) is an annual exceedance
+    probability, converted to the rate -ln(1 - p).
+
+    Args:
+        events: DataFrame with a 'gust' column of annual maxima or storm
+            peaks (m/s).
+        wind_region: the wind region of the anemometer site.
+        years: length of the record (years) for storm peaks; for annual
+            maxima leave as None.
+
+    Returns:
+        Pandas DataFrame of the events sorted in descending order with the
+        columns 'gust', 'implied_ari' (years), 'empirical_rate' and
+        'design_rate' (exceedances per year), and 'rate_ratio' (empirical /
+        design).
+    """
+    gust = np.sort(events['gust'].to_numpy(dtype=float))[::-1]
+    rank = np.arange(1, gust.size + 1)
+    if years is None:
+        # Weibull plotting position of the annual maxima, an annual
+        # exceedance probability, converted to a Poisson rate
+        probability = rank / (gust.size + 1)
+        empirical_rate = -np.log1p(-probability)
+    else:
+        empirical_rate = rank / years
+    R = implied_ari(gust, wind_region)
+    design_rate = 1 / R
+    with np.errstate(divide='ignore'):
+        rate_ratio = empirical_rate / design_rate
+    return pd.DataFrame({
+        'gust': gust,
+        'implied_ari': R,
+        'empirical_rate': empirical_rate,
+        'design_rate': design_rate,
+        'rate_ratio': rate_ratio,
+    })
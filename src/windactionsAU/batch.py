@@ -0,0 +1,890 @@
+"""
+Vectorised (array based) equivalents of the scalar calculations in
+`wind_speed`, `wind_pressure` and `aerodynamic_shape_factors`, intended for
+evaluating large batches of sites or buildings in a single call.
+
+Unless noted otherwise, directional results are returned with a trailing axis
+of length 8 ordered as `DIRECTIONS`.
+"""
+
+import hashlib
+
+import numpy as np
+
+from windactionsAU.aerodynamic_shape_factors import (
+    DOMINANT_OPENING_RATIOS,
+    DOMINANT_OPENING_WINDWARD,
+    DOMINANT_OPENING_OTHER,
+)
+from windactionsAU import trace as T
+
+DIRECTIONS = ['N', 'NE', 'E', 'SE', 'S', 'SW', 'W', 'NW']
+DIRECTION_ANGLES = np.arange(0, 360, 45)
+ORTHOGONAL_ANGLES = np.array([0, 90, 180, 270])
+
+# AS/NZS 1170.0 Appendix F annual probabilities of exceedance; the '50 Years',
+# Importance Level 1 entry of 0 is replaced by 100 (non-cyclonic) or 200
+# (cyclonic) years, and entries of 0 elsewhere are not defined
+ARI_DESIGN_LIVES = ['Construction Equipment', '5 Years', '25 Years', '50 Years', '100 Years']
+ARI_TABLE = np.array([
+    [100, 100, 100, 100],
+    [25, 50, 100, 0],
+    [100, 200, 500, 1000],
+    [0, 500, 1000, 2500],
+    [500, 1000, 2500, 0],
+])
+
+# Table 3.1 regional wind speed V_R = a - b * R^-0.1, as (a, b)
+REGIONAL_WIND_SPEED_COEFFS = {
+    'A0': (67, 41), 'A1': (67, 41), 'A2': (67, 41), 'A3': (67, 41),
+    'A4': (67, 41), 'A5': (67, 41), 'B1': (106, 92), 'B2': (106, 92),
+    'C': (122, 104), 'D': (156, 142), 'NZ1': (61, 30), 'NZ2': (61, 30),
+    'NZ3': (71, 34), 'NZ4': (63, 25),
+}
+
+# Table 3.2 wind direction multipliers, ordered as DIRECTIONS
+M_D_TABLE = {
+    'A0': np.array([0.90, 0.85, 0.85, 0.90, 0.90, 0.95, 1.00, 0.95]),
+    'A1': np.array([0.90, 0.85, 0.85, 0.80, 0.80, 0.95, 1.00, 0.95]),
+    'A2': np.array([0.85, 0.75, 0.85, 0.95, 0.95, 0.95, 1.00, 0.95]),
+    'A3': np.array([0.90, 0.75, 0.75, 0.90, 0.90, 0.95, 1.00, 0.95]),
+    'A4': np.array([0.85, 0.75, 0.75, 0.80, 0.80, 0.90, 1.00, 1.00]),
+    'A5': np.array([0.95, 0.80, 0.80, 0.80, 0.80, 0.95, 1.00, 0.95]),
+    'B1': np.array([0.75, 0.75, 0.85, 0.90, 0.95, 0.95, 0.95, 0.90]),
+    'B2': np.array([0.90, 0.90, 0.90, 0.90, 0.90, 0.90, 0.90, 0.90]),
+    'C': np.array([0.90, 0.90, 0.90, 0.90, 0.90, 0.90, 0.90, 0.90]),
+    'D': np.array([0.90, 0.90, 0.90, 0.90, 0.90, 0.90, 0.90, 0.90]),
+}
+# Regions with M_d = 1.0 for cladding and a climate change multiplier of 1.05
+CYCLONIC_REGIONS = ['B2', 'C', 'D']
+
+# Clause 4.3 shielding multiplier against the shielding parameter, s
+SHIELDING_PARAMETERS = np.array([1.5, 3.0, 6.0, 12.0])
+SHIELDING_MULTIPLIERS = np.array([0.7, 0.8, 0.9, 1.0])
+
+# Table 4.1 terrain/height multipliers, built once at import
+M_ZCAT_HEIGHTS = np.array([3, 5, 10, 15, 20, 30, 40, 50, 75, 100, 150, 200], dtype=float)
+M_ZCAT_TABLE = {
+    'TC1': np.array([0.97, 1.01, 1.08, 1.12, 1.14, 1.18, 1.21, 1.23, 1.27, 1.31, 1.36, 1.39]),
+    'TC2': np.array([0.91, 0.91, 1.00, 1.05, 1.08, 1.12, 1.16, 1.19, 1.22, 1.24, 1.27, 1.29]),
+    'TC2.5': np.array([0.87, 0.87, 0.92, 0.97, 1.01, 1.06, 1.10, 1.13, 1.17, 1.20, 1.24, 1.27]),
+    'TC3': np.array([0.83, 0.83, 0.83, 0.89, 0.94, 1.00, 1.04, 1.07, 1.12, 1.16, 1.21, 1.24]),
+    'TC4': np.array([0.75, 0.75, 0.75, 0.75, 0.75, 0.80, 0.85, 0.90, 0.98, 1.03, 1.11, 1.16]),
+}
+M_ZCAT_A0 = np.array([0.91, 0.91, 1.00, 1.05, 1.08, 1.12, 1.16, 1.18, 1.22, 1.24, 1.24, 1.24])
+
+# Table 5.5 action combination factors (K_ce, K_ci) for |C_pi| < 0.4 and
+# |C_pi| >= 0.4 for each framing type
+ACTION_COMBINATION_FACTORS = {
+    'Type 1': ((0.8, 1.0), (0.8, 0.8)),
+    'Type 2': ((0.8, 1.0), (0.8, 0.8)),
+    'Type 3': ((1.0, 1.0), (0.9, 0.9)),
+    'Type 4': ((0.9, 1.0), (0.9, 0.9)),
+    'Type 5': ((0.9, 0.9), (1.0, 1.0)),
+}
+
+# Table 5.2(C) side wall and Table 5.3(A) roof zones, with zone edges given as
+# multiples of the average roof height, h, from the windward edge
+SIDE_WALL_EDGES = np.array([1.0, 2.0, 3.0])
+SIDE_WALL_CPE = np.array([-0.65, -0.5, -0.3, -0.2])
+ROOF_SHALLOW_EDGES = np.array([0.5, 1.0, 2.0, 3.0])
+ROOF_SHALLOW_CPE_LOW = np.array([
+    [-0.9, -0.4], [-0.9, -0.4], [-0.5, 0.0], [-0.3, 0.1], [-0.2, 0.2]
+])  # h/d <= 0.5
+ROOF_SHALLOW_CPE_HIGH = np.array([
+    [-1.3, -0.6], [-0.7, -0.3], [-0.7, -0.3], [0.0, 0.0], [0.0, 0.0]
+])  # h/d >= 1.0
+ROOF_STEEP_RATIOS = np.array([0.25, 0.5, 1.0])  # h/d
+ROOF_STEEP_PITCHES_A = np.array([10, 15, 20, 25, 30, 35, 45], dtype=float)
+ROOF_STEEP_UPWIND_A = np.array([
+    [-0.7, -0.5, -0.3, -0.2, -0.2, 0.0, 0.0],
+    [-0.9, -0.7, -0.4, -0.3, -0.2, -0.2, 0.0],
+    [-1.3, -1.0, -0.7, -0.5, -0.3, -0.2, 0.0],
+])
+ROOF_STEEP_PITCHES_B = np.array([10, 15, 20, 25, 30, 35, 45, 50, 60], dtype=float)
+ROOF_STEEP_UPWIND_B = np.array([
+    [-0.3, 0.0, 0.2, 0.3, 0.4, 0.5, 0.57, 0.61, 0.69],
+    [-0.4, -0.3, 0.0, 0.2, 0.3, 0.4, 0.57, 0.61, 0.69],
+    [-0.6, -0.5, -0.3, 0.0, 0.2, 0.3, 0.57, 0.61, 0.69],
+])
+ROOF_STEEP_PITCHES_DOWNWIND = np.array([10, 15, 20], dtype=float)
+ROOF_STEEP_DOWNWIND = np.array([
+    [-0.3, -0.5, -0.6],
+    [-0.5, -0.5, -0.6],
+    [-0.7, -0.6, -0.6],
+])  # to 20 degrees, then to the b/d dependent value at 25 degrees
+
+# Surfaces of `ext_pressure_coeff_all_directions_batch`
+SURFACES = (
+    ['windward', 'leeward']
+    + ['side_wall_' + zone for zone in ['0 to 1h', '1h to 2h', '2h to 3h', '> 3h']]
+    + ['roof_' + zone for zone in ['0 to 0.5h', '0.5h to 1h', '1h to 2h', '2h to 3h', '> 3h']]
+    + ['roof_upwind', 'roof_downwind']
+)
+
+
+def _tables() -> dict:
+    """Returns the lookup tables used by the batch calculations by name."""
+    tables = {
+        'ARI': ARI_TABLE,
+        'M_zcat_heights': M_ZCAT_HEIGHTS,
+        'M_zcat_A0': M_ZCAT_A0,
+        'M_s_parameters': SHIELDING_PARAMETERS,
+        'M_s': SHIELDING_MULTIPLIERS,
+    }
+    tables.update({'V_R_' + region: np.array(values) for region, values in REGIONAL_WIND_SPEED_COEFFS.items()})
+    tables.update({'M_d_' + region: values for region, values in M_D_TABLE.items()})
+    tables.update({'M_zcat_' + category: values for category, values in M_ZCAT_TABLE.items()})
+    tables.update({'K_c_' + framing: np.array(values) for framing, values in ACTION_COMBINATION_FACTORS.items()})
+    tables.update({
+        'side_wall_edges': SIDE_WALL_EDGES,
+        'side_wall_C_pe': SIDE_WALL_CPE,
+        'roof_shallow_edges': ROOF_SHALLOW_EDGES,
+        'roof_shallow_C_pe_low': ROOF_SHALLOW_CPE_LOW,
+        'roof_shallow_C_pe_high': ROOF_SHALLOW_CPE_HIGH,
+        'roof_steep_ratios': ROOF_STEEP_RATIOS,
+        'roof_steep_pitches_a': ROOF_STEEP_PITCHES_A,
+        'roof_steep_upwind_a': ROOF_STEEP_UPWIND_A,
+        'roof_steep_pitches_b': ROOF_STEEP_PITCHES_B,
+        'roof_steep_upwind_b': ROOF_STEEP_UPWIND_B,
+        'roof_steep_pitches_downwind': ROOF_STEEP_PITCHES_DOWNWIND,
+        'roof_steep_downwind': ROOF_STEEP_DOWNWIND,
+        'C_pi_ratios': DOMINANT_OPENING_RATIOS,
+        'C_pi_windward': DOMINANT_OPENING_WINDWARD,
+        'C_pi_other': DOMINANT_OPENING_OTHER,
+    })
+    return tables
+
+
+def table_version() -> str:
+    """
+    Returns a short hash of the lookup tables used by the batch calculations.
+    The tag changes whenever any table value changes, which allows stored
+    results to be invalidated.
+    """
+    digest = hashlib.sha256()
+    for name, values in sorted(_tables().items()):
+        digest.update(name.encode())
+        digest.update(np.ascontiguousarray(values, dtype=float).tobytes())
+    return digest.hexdigest()[:16]
+
+
+def table_fingerprints() -> dict:
+    """
+    Returns a short hash of each lookup table used by the batch calculations
+    by table name (refer to `_tables`), so that the tables that changed
+    between two runs can be identified.
+    """
+    return {
+        name: hashlib.sha256(np.ascontiguousarray(values, dtype=float).tobytes()).hexdigest()[:16]
+        for name, values in _tables().items()
+    }
+
+
+def _lookup_index(values, keys: list, name: str) -> np.ndarray:
+    """
+    Returns the position of each value in keys, raising a KeyError naming the
+    first invalid value.
+    """
+    values = np.asarray(values)
+    index = np.full(values.shape, -1, dtype=np.int64)
+    for i, key in enumerate(keys):
+        index[values == key] = i
+    if np.any(index < 0):
+        raise KeyError(f"The {name} '{values[index < 0].ravel()[0]}' is invalid. Please input a valid {name}.")
+    return index
+
+
+def average_recurrence_interval_batch(
+        design_life='50 Years',
+        importance_level=2,
+        cyclonic=False,
+        trace: bool=False
+):
+    """
+    Calculates the Average Recurrence Interval (ARI) in accordance with
+    AS/NZS 1170.0:2002(+A5) Appendix F for arrays of structures. Mirrors
+    `wind_speed.average_recurrence_interval`.
+
+    Args:
+        design_life: array of design working lives, e.g. '50 Years'.
+        importance_level: array of importance levels, 1 to 4.
+        cyclonic: boolean array, True for structures in cyclonic areas.
+        trace: if True, also returns the trace codes of the branches taken
+            (refer to `trace.TRACE_CLAUSES`); default is False.
+
+    Returns:
+        Array of Average Recurrence Intervals (years), or a tuple of the
+        array and the trace codes where trace is True.
+    """
+    design_life, importance_level, cyclonic = np.broadcast_arrays(
+        np.asarray(design_life),
+        np.asarray(importance_level),
+        np.asarray(cyclonic, dtype=bool)
+    )
+    life = _lookup_index(design_life, ARI_DESIGN_LIVES, 'design life')
+    level = _lookup_index(importance_level.astype(int), [1, 2, 3, 4], 'importance level')
+    ari = ARI_TABLE[life, level].astype(float)
+    il1_50 = (life == 3) & (level == 0)
+    ari = np.where(il1_50, np.where(cyclonic, 200.0, 100.0), ari)
+    if np.any(ari == 0):
+        raise ValueError("Importance Level 4 structures with a design working life of 5 or 100"
+                         " years are not covered by AS/NZS 1170.0 Table F2.")
+    if trace:
+        return ari, T.trace_codes(
+            [~il1_50, il1_50 & ~cyclonic, il1_50 & cyclonic],
+            [T.ARI_TABLE_F2, T.ARI_IL1_NON_CYCLONIC, T.ARI_IL1_CYCLONIC]
+        )
+    return ari
+
+
+def regional_wind_speed_batch(wind_region, R, rounded: bool=True, dtype=np.float64) -> np.ndarray:
+    """
+    Calculates the regional wind speed for arrays of regions and Average
+    Recurrence Intervals. Mirrors `wind_speed.regional_wind_speed`.
+
+    Args:
+        wind_region: array of wind regions, e.g. 'A0', 'B2', 'C'.
+        R: array of Average Recurrence Intervals (years).
+        rounded: rounds to the nearest 1 m/s as per the scalar calculation;
+            default is True.
+        dtype: floating point type of the calculation; default is float64.
+
+    Returns:
+        Array of regional wind speeds (m/s).
+    """
+    wind_region, R = np.broadcast_arrays(np.asarray(wind_region), np.asarray(R, dtype=dtype))
+    regions = list(REGIONAL_WIND_SPEED_COEFFS)
+    coeffs = np.array([REGIONAL_WIND_SPEED_COEFFS[region] for region in regions], dtype=dtype)
+    index = _lookup_index(wind_region, regions, 'wind region')
+    wind_speed = coeffs[index, 0] - coeffs[index, 1] * R ** dtype(-0.1)
+    return np.round(wind_speed) if rounded else wind_speed
+
+
+def site_wind_speed_batch(V_R, M_c, M_d, M_zcat, M_s, M_t, dtype=np.float64) -> np.ndarray:
+    """
+    Calculates the site wind speeds in the 8 cardinal directions for arrays
+    of sites. Mirrors `wind_speed.site_wind_speed`.
+
+    Args:
+        V_R: regional wind speed (m/s), shape (sites,).
+        M_c: climate change multiplier, shape (sites,).
+        M_d: wind direction multipliers, shape (sites, 8).
+        M_zcat: terrain/height multiplier, shape (sites,).
+        M_s: shielding multiplier, shape (sites,).
+        M_t: topographic multiplier, shape (sites,) or (sites, 8).
+        dtype: floating point type of the calculation; default is float64.
+
+    Returns:
+        Site wind speeds (m/s), shape (sites, 8).
+    """
+    def column(value):
+        value = np.asarray(value, dtype=dtype)
+        return value[..., None] if value.ndim == 1 else value
+
+    return column(V_R) * column(M_c) * np.asarray(M_d, dtype=dtype) * (
+        column(M_zcat) * column(M_s) * column(M_t)
+    )
+
+
+# 5 degree grid used to find the design wind speed within +/- 45 degrees of
+# each orthogonal direction (orientations of 0 to 90 degrees)
+_DESIGN_GRID = np.arange(-45, 410, 5)
+
+
+def design_wind_speed_batch(orientation_angle, V_sit_beta) -> np.ndarray:
+    """
+    Calculates the building orthogonal design wind speeds for arrays of
+    sites. Mirrors `wind_speed.design_wind_speed`: the site wind speeds are
+    interpolated to a 5 degree grid (rounded to 2 decimal places) and the
+    maximum within +/- 45 degrees of each orthogonal direction is taken, with
+    a minimum of 30 m/s.
+
+    Args:
+        orientation_angle: building orientation relative to true North,
+            between 0 and 90 degrees, shape (sites,).
+        V_sit_beta: site wind speeds, shape (sites, 8).
+
+    Returns:
+        Design wind speeds (m/s), shape (sites, 4), ordered 0, 90, 180 and
+        270 degrees, with the floating point type of V_sit_beta.
+    """
+    V_sit_beta = np.atleast_2d(np.asarray(V_sit_beta))
+    orientation_angle = np.broadcast_to(
+        np.asarray(orientation_angle, dtype=float), V_sit_beta.shape[:1]
+    )
+    if np.any((orientation_angle < 0) | (orientation_angle > 90)):
+        raise ValueError("The building orientation angles shall be between 0 and 90 degrees.")
+    return sector_maximum_batch(orientation_angle[:, None] + ORTHOGONAL_ANGLES, V_sit_beta)
+
+
+def sector_maximum_batch(theta, V_sit_beta) -> np.ndarray:
+    """
+    Returns the maximum site wind speed within +/- 45 degrees of arbitrary
+    directions, evaluated on the 5 degree grid of `design_wind_speed_batch`
+    (interpolated and rounded to 2 decimal places), with a minimum of 30 m/s.
+
+    Args:
+        theta: directions (degrees clockwise from North), shape (sites, k).
+        V_sit_beta: site wind speeds, shape (sites, 8).
+
+    Returns:
+        Sector maximum wind speeds (m/s), shape (sites, k), with the floating
+        point type of V_sit_beta.
+    """
+    V_sit_beta = np.atleast_2d(np.asarray(V_sit_beta))
+    if not np.issubdtype(V_sit_beta.dtype, np.floating):
+        V_sit_beta = V_sit_beta.astype(float)
+    theta = np.asarray(theta, dtype=float) % 360
+
+    wrapped = _DESIGN_GRID % 360
+    lower = wrapped // 45
+    fraction = ((wrapped % 45) / 45).astype(V_sit_beta.dtype)
+    grid = np.round(
+        V_sit_beta[:, lower] * (1 - fraction) + V_sit_beta[:, (lower + 1) % 8] * fraction,
+        2
+    )
+
+    # Grid points within +/- 45 degrees of each direction
+    first = np.ceil((theta - 45 - _DESIGN_GRID[0]) / 5).astype(np.int64)
+    last = np.floor((theta + 45 - _DESIGN_GRID[0]) / 5).astype(np.int64)
+    offsets = np.arange(19)
+    index = first[..., None] + offsets
+    in_sector = index <= last[..., None]
+    index = np.minimum(index, _DESIGN_GRID.size - 1)
+    values = np.take_along_axis(grid[:, None, :], index, axis=-1)
+    values = np.where(in_sector, values, V_sit_beta.dtype.type(-np.inf))
+    return np.maximum(values.max(axis=-1), V_sit_beta.dtype.type(30))
+
+
+def wind_direction_multiplier_batch(wind_region, modifier=False) -> tuple:
+    """
+    Calculates the wind direction multipliers in the 8 cardinal directions
+    for arrays of sites. Mirrors `wind_speed.wind_direction_multiplier`.
+
+    Args:
+        wind_region: array of wind regions, 'A0' to 'D'.
+        modifier: boolean array, True for chimneys, tanks and poles with a
+            circular or polygonal cross-section; default is False.
+
+    Returns:
+        Tuple of arrays (M_d, M_d_cladding), each of shape (sites, 8).
+    """
+    wind_region, modifier = np.broadcast_arrays(
+        np.atleast_1d(np.asarray(wind_region)),
+        np.asarray(modifier, dtype=bool)
+    )
+    regions = list(M_D_TABLE)
+    table = np.stack([M_D_TABLE[region] for region in regions])
+    M_d = table[_lookup_index(wind_region, regions, 'wind region')]
+    M_d = np.where(modifier[..., None], 1.0, M_d)
+    M_d_cladding = np.where(np.isin(wind_region, CYCLONIC_REGIONS)[..., None], 1.0, M_d)
+    return M_d, M_d_cladding
+
+
+def climate_change_multiplier_batch(wind_region) -> np.ndarray:
+    """
+    Calculates the climate change multiplier for arrays of sites. Mirrors
+    `wind_speed.climate_change_multiplier`.
+    """
+    return np.where(np.isin(np.asarray(wind_region), CYCLONIC_REGIONS), 1.05, 1.0)
+
+
+def topographic_multiplier_batch(
+        wind_region,
+        z,
+        hill_height,
+        L_u,
+        x,
+        escarpment=False,
+        E=0.0,
+        trace: bool=False
+):
+    """
+    Calculates the topographic multiplier per Clause 4.4 for arrays of sites.
+    Mirrors `wind_speed.topographic_multiplier`; all arguments are broadcast
+    against each other.
+
+    Args:
+        wind_region: array of wind regions, e.g. 'A0', 'A4', 'C'.
+        z: reference height of the structure above average local ground
+            level (m).
+        hill_height: height of the hill, ridge or escarpment (m).
+        L_u: horizontal distance upwind from the crest of the hill, ridge or
+            escarpment to a level half the height below the crest (m).
+        x: horizontal distance upwind or downwind of the structure to the crest
+            of the hill, ridge or escarpment (m).
+        escarpment: boolean array, True where the feature is an escarpment;
+            default is False.
+        E: site elevation about mean sea level (m).
+        trace: if True, also returns the trace codes of the branches taken
+            (refer to `trace.TRACE_CLAUSES`); default is False.
+
+    Returns:
+        Array of topographic multipliers, M_t, or a tuple of the array and
+        the trace codes where trace is True.
+    """
+    wind_region = np.asarray(wind_region)
+    z = np.asarray(z, dtype=float)
+    hill_height = np.asarray(hill_height, dtype=float)
+    L_u = np.asarray(L_u, dtype=float)
+    x = np.asarray(x, dtype=float)
+    escarpment = np.asarray(escarpment, dtype=bool)
+    E = np.asarray(E, dtype=float)
+
+    # Flat ground (H = 0 or L_u = 0) is treated as having no upwind slope
+    with np.errstate(divide='ignore', invalid='ignore'):
+        upwind_slope = np.where(L_u > 0, hill_height / (2 * L_u), 0.0)
+    L_1 = np.maximum(0.36 * L_u, 0.4 * hill_height)
+    L_2 = np.where(escarpment, 10 * L_1, 4 * L_1)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        decay = np.where(L_2 > 0, 1 - np.abs(x) / L_2, 0.0)
+        M_h_general = 1 + (hill_height / (3.5 * (z + L_1))) * decay
+    M_h_steep = 1 + 0.71 * decay
+    steep = (upwind_slope > 0.45) & (x >= 0) & (x <= hill_height / 4)
+
+    flat = upwind_slope < 0.05
+    M_h = np.where(
+        flat,
+        1.0,
+        np.where(steep, M_h_steep, M_h_general)
+    )
+
+    M_lee = 1.0  # Does not deal with sites in New Zealand
+
+    region_A0 = wind_region == 'A0'
+    elevated_A4 = (wind_region == 'A4') & (E >= 500)
+    M_t = np.where(
+        region_A0,
+        0.5 + 0.5 * M_h,
+        np.where(
+            elevated_A4,
+            M_h * M_lee * (1 + 0.00015 * E),
+            np.maximum(M_h, M_lee)
+        )
+    )
+    if trace:
+        return M_t, T.trace_codes(
+            [flat, ~flat & steep, ~flat & ~steep, ~flat & escarpment,
+             region_A0, ~region_A0 & elevated_A4, ~region_A0 & ~elevated_A4],
+            [T.M_H_FLAT, T.M_H_STEEP, T.M_H_GENERAL, T.M_H_ESCARPMENT,
+             T.M_T_A0, T.M_T_A4_ELEVATION, T.M_T_GENERAL]
+        )
+    return M_t
+
+
+def terrain_height_multiplier_batch(terrain_category, wind_region, height, dtype=np.float64) -> np.ndarray:
+    """
+    Calculates the terrain/height multiplier per Clause 4.2.2 for arrays of
+    sites and/or heights. Mirrors `wind_speed.terrain_height_multiplier`; all
+    arguments are broadcast against each other.
+
+    Args:
+        terrain_category: array of terrain categories, e.g. 'TC2', 'TC2.5'.
+        wind_region: array of wind regions, e.g. 'A0', 'C'.
+        height: array of heights (m).
+        dtype: floating point type of the returned array; default is
+            float64 (the interpolation itself is in float64).
+
+    Returns:
+        Array of terrain height multipliers, M_z,cat.
+    """
+    terrain_category, wind_region, height = np.broadcast_arrays(
+        np.asarray(terrain_category),
+        np.asarray(wind_region),
+        np.asarray(height, dtype=float)
+    )
+    M_zcat = np.empty(height.shape, dtype=dtype)
+
+    region_A0 = wind_region == 'A0'
+    M_zcat[region_A0] = np.interp(height[region_A0], M_ZCAT_HEIGHTS, M_ZCAT_A0)
+    for category in np.unique(terrain_category[~region_A0]):
+        try:
+            values = M_ZCAT_TABLE[category]
+        except KeyError:
+            raise KeyError(f"The terrain category '{category}' is invalid. Please input a valid terrain category.")
+        mask = (terrain_category == category) & ~region_A0
+        M_zcat[mask] = np.interp(height[mask], M_ZCAT_HEIGHTS, values)
+    return M_zcat
+
+
+def shielding_multiplier_batch(height, h_s, b_s, n_s, trace: bool=False):
+    """
+    Calculates the shielding multiplier per Clause 4.3 for arrays of sites.
+    Mirrors `wind_speed.shielding_multiplier`; inputs are assumed to have
+    been validated (refer to `validation.validate_inputs`).
+
+    Args:
+        height: average roof height of the structure being shielded (m).
+        h_s: average roof height of shielding buildings (m).
+        b_s: average breadth of shielding buildings (m).
+        n_s: number of upwind shielding buildings within a 45 degree sector;
+            0 where the site is not shielded, for which s is infinite and
+            M_s = 1.0.
+        trace: if True, also returns the trace codes of the branches taken
+            (refer to `trace.TRACE_CLAUSES`); default is False.
+
+    Returns:
+        Array of shielding multipliers, M_s, or a tuple of the array and the
+        trace codes where trace is True.
+    """
+    height, h_s, b_s, n_s = np.broadcast_arrays(
+        np.asarray(height, dtype=float),
+        np.asarray(h_s, dtype=float),
+        np.asarray(b_s, dtype=float),
+        np.asarray(n_s, dtype=float)
+    )
+    shielded = n_s > 0
+    l_s = height * (10 / np.where(shielded, n_s, 1.0) + 5)
+    s = np.where(shielded, l_s / np.sqrt(np.where(shielded, h_s * b_s, 1.0)), np.inf)
+    M_s = np.where(
+        (s >= 12.0) | (height > 25),
+        1.0,
+        np.interp(s, SHIELDING_PARAMETERS, SHIELDING_MULTIPLIERS)
+    )
+    if trace:
+        tall = height > 25
+        return M_s, T.trace_codes(
+            [tall, ~tall & (s >= 12.0), ~tall & (s <= 1.5), ~tall & (s > 1.5) & (s < 12.0)],
+            [T.M_S_HEIGHT, T.M_S_SPACING, T.M_S_CLOSE, T.M_S_INTERPOLATED]
+        )
+    return M_s
+
+
+def ext_pressure_coeff_windward_wall_batch(h, vary_with_height=False) -> np.ndarray:
+    """
+    Calculates the windward wall external pressure coefficient per AS/NZS
+    1170.2:2021 Table 5.2(A) for arrays of buildings. Mirrors
+    `aerodynamic_shape_factors.ext_pressure_coeff_windward_wall`.
+
+    Args:
+        h: the average roof height (m).
+        vary_with_height: boolean array, True where the wind speed varies
+            with height; default is False.
+
+    Returns:
+        Array of windward wall external pressure coefficients, C_pe
+    """
+    h = np.asarray(h, dtype=float)
+    return np.where((h < 25) & ~np.asarray(vary_with_height, dtype=bool), 0.7, 0.8)
+
+
+def _leeward_wall_cpe(depth_width_ratio: np.ndarray, roof_pitch: np.ndarray) -> np.ndarray:
+    """Table 5.2(B) leeward wall C_pe from the ratio d/b and the roof pitch."""
+    C_pe_flat = np.interp(depth_width_ratio, [1, 2, 4], [-0.5, -0.3, -0.2])
+    C_pe_mid = np.interp(roof_pitch, [10, 15, 20], [-0.3, -0.3, -0.4])
+    C_pe_25 = np.interp(depth_width_ratio, [0.1, 0.3], [-0.75, -0.5])
+    C_pe_transition = -0.4 + (roof_pitch - 20) / 5 * (C_pe_25 + 0.4)
+    conditions = [roof_pitch < 10, roof_pitch < 20, roof_pitch < 25]
+    return np.select(conditions, [C_pe_flat, C_pe_mid, C_pe_transition], default=C_pe_25)
+
+
+def ext_pressure_coeff_leeward_wall_batch(d, b, roof_pitch, trace: bool=False):
+    """
+    Calculates the leeward wall external pressure coefficient per AS/NZS
+    1170.2:2021 Table 5.2(B) for arrays of buildings. Mirrors
+    `aerodynamic_shape_factors.ext_pressure_coeff_leeward_wall`.
+
+    Args:
+        d: building depth, parallel with the wind direction (m).
+        b: building width, perpendicular to the wind direction (m).
+        roof_pitch: angle of the roof pitch (degrees).
+        trace: if True, also returns the trace codes of the branches taken
+            (refer to `trace.TRACE_CLAUSES`); default is False.
+
+    Returns:
+        Array of leeward wall external pressure coefficients, C_pe, or a
+        tuple of the array and the trace codes where trace is True.
+    """
+    d, b, roof_pitch = np.broadcast_arrays(
+        np.asarray(d, dtype=float),
+        np.asarray(b, dtype=float),
+        np.asarray(roof_pitch, dtype=float)
+    )
+    C_pe = _leeward_wall_cpe(d / b, roof_pitch)
+    if trace:
+        conditions = [roof_pitch < 10, roof_pitch < 20, roof_pitch < 25]
+        return C_pe, T.trace_codes(
+            [conditions[0], ~conditions[0] & conditions[1], ~conditions[1] & conditions[2], ~conditions[2]],
+            [T.C_PE_LEEWARD_FLAT, T.C_PE_LEEWARD_MID, T.C_PE_LEEWARD_TRANSITION, T.C_PE_LEEWARD_STEEP]
+        )
+    return C_pe
+
+
+def ext_pressure_coeff_roof_shallow_batch(h, d) -> np.ndarray:
+    """
+    Calculates the roof external pressure coefficients for rectangular
+    enclosed buildings with a roof pitch of less than 10 degrees per AS/NZS
+    1170.2:2021 Table 5.3(A) for arrays of buildings. Mirrors
+    `aerodynamic_shape_factors.ext_pressure_coeff_roof_shallow`.
+
+    Args:
+        h: average roof height (m).
+        d: building depth, parallel with the wind direction (m).
+
+    Returns:
+        Array of C_pe with shape (..., 5, 2) holding the two values of each
+        zone ('0 to 0.5h', '0.5h to 1h', '1h to 2h', '2h to 3h', '> 3h'),
+        with the zone edges given by ROOF_SHALLOW_EDGES * h.
+    """
+    return _roof_shallow_cpe(np.asarray(h, dtype=float) / np.asarray(d, dtype=float))
+
+
+def _roof_shallow_cpe(height_depth_ratio: np.ndarray) -> np.ndarray:
+    """Table 5.3(A) roof C_pe, shape (..., 5, 2), from the ratio h/d."""
+    weight = np.clip((height_depth_ratio - 0.5) / 0.5, 0.0, 1.0)[..., None, None]
+    return ROOF_SHALLOW_CPE_LOW * (1 - weight) + ROOF_SHALLOW_CPE_HIGH * weight
+
+
+def _interp_rows(x, xp: np.ndarray, fp: np.ndarray) -> np.ndarray:
+    """
+    Linearly interpolates each row of fp at x, returning an array with shape
+    (rows,) + x.shape.
+    """
+    return np.stack([np.interp(x, xp, row) for row in fp])
+
+
+def _interp_ratio(ratio, values: np.ndarray) -> np.ndarray:
+    """
+    Interpolates values tabulated at h/d of 0.25, 0.5 and 1.0 (leading axis)
+    at the h/d ratios, holding the end values beyond the table.
+    """
+    w_low = np.clip((ratio - ROOF_STEEP_RATIOS[0]) / (ROOF_STEEP_RATIOS[1] - ROOF_STEEP_RATIOS[0]), 0.0, 1.0)
+    w_high = np.clip((ratio - ROOF_STEEP_RATIOS[1]) / (ROOF_STEEP_RATIOS[2] - ROOF_STEEP_RATIOS[1]), 0.0, 1.0)
+    return values[0] + (values[1] - values[0]) * w_low + (values[2] - values[1]) * w_high
+
+
+def ext_pressure_coeff_roof_steep_batch(h, d, b, roof_pitch) -> np.ndarray:
+    """
+    Calculates the roof external pressure coefficients for rectangular
+    enclosed buildings with a roof pitch of 10 degrees or more, for wind
+    normal to the ridge, per AS/NZS 1170.2:2021 Table 5.3(B) and Table 5.3(C)
+    for arrays of buildings. Mirrors
+    `aerodynamic_shape_factors.ext_pressure_coeff_roof_steep`.
+
+    Args:
+        h: average roof height (m).
+        d: building depth, parallel with the wind direction (m).
+        b: building width, perpendicular to the wind direction (m).
+        roof_pitch: roof pitch (degrees).
+
+    Returns:
+        Array of C_pe with shape (..., 2, 2) holding the two values of the
+        upwind and downwind slopes; NaN where the roof pitch is less than 10
+        degrees.
+    """
+    h, d, b, roof_pitch = np.broadcast_arrays(
+        np.asarray(h, dtype=float),
+        np.asarray(d, dtype=float),
+        np.asarray(b, dtype=float),
+        np.asarray(roof_pitch, dtype=float)
+    )
+    return _roof_steep_cpe(h / d, b / d, roof_pitch)
+
+
+def _roof_steep_cpe(height_depth_ratio: np.ndarray, width_depth_ratio: np.ndarray, roof_pitch: np.ndarray) -> np.ndarray:
+    """
+    Table 5.3(B) and 5.3(C) roof C_pe, shape (..., 2, 2), from the ratios h/d
+    and b/d and the roof pitch.
+    """
+    C_pe_Ua = _interp_ratio(height_depth_ratio, _interp_rows(roof_pitch, ROOF_STEEP_PITCHES_A, ROOF_STEEP_UPWIND_A))
+    C_pe_Ub = _interp_ratio(height_depth_ratio, _interp_rows(roof_pitch, ROOF_STEEP_PITCHES_B, ROOF_STEEP_UPWIND_B))
+
+    C_pe_25 = np.select(
+        [width_depth_ratio <= 3, width_depth_ratio < 8],
+        [-0.6, -0.06 * (7 + width_depth_ratio)],
+        default=-0.9
+    )
+    weight = np.clip((roof_pitch - 20) / 5, 0.0, 1.0)
+    C_pe_D = _interp_rows(roof_pitch, ROOF_STEEP_PITCHES_DOWNWIND, ROOF_STEEP_DOWNWIND) * (1 - weight) + C_pe_25 * weight
+    C_pe_D = _interp_ratio(height_depth_ratio, C_pe_D)
+
+    C_pe = np.stack([
+        np.stack([C_pe_Ua, C_pe_Ub], axis=-1),
+        np.stack([C_pe_D, C_pe_D], axis=-1),
+    ], axis=-2)
+    return np.where((roof_pitch >= 10)[..., None, None], C_pe, np.nan)
+
+
+def ext_pressure_coeff_all_directions_batch(h, d, b, roof_pitch=0.0, vary_with_height=False) -> np.ndarray:
+    """
+    Calculates the external pressure coefficients of all surfaces of
+    rectangular enclosed buildings for wind in the 4 orthogonal directions,
+    per AS/NZS 1170.2:2021 Tables 5.2(A) to 5.2(C) and 5.3(A) to 5.3(C).
+
+    The building depth d is parallel with the wind at 0 and 180 degrees and
+    the ridge is perpendicular to it, so that for 90 and 270 degrees d and b
+    are swapped, the wind is parallel to the ridge and the roof and leeward
+    wall are taken from Table 5.3(A) and the flat roof values of Table
+    5.2(B). Opposite directions are symmetric, so the coefficients are
+    calculated for 0 and 90 degrees only, with the ratios h/d, h/b, d/b and
+    b/d calculated once and shared by the leeward wall and roof tables.
+
+    Args:
+        h: average roof height (m), shape (buildings,).
+        d: building depth for wind at 0 degrees (m), shape (buildings,).
+        b: building width for wind at 0 degrees (m), shape (buildings,).
+        roof_pitch: roof pitch (degrees); default is 0.
+        vary_with_height: boolean, True where the windward wall wind speed
+            varies with height; default is False.
+
+    Returns:
+        Array of C_pe with shape (buildings, 4, len(SURFACES), 2), with the
+        directions ordered as ORTHOGONAL_ANGLES, the surfaces ordered as
+        SURFACES and the trailing axis holding the (min, max) values. Side
+        wall zones are at multiples of h from the windward edge (refer to
+        SIDE_WALL_EDGES) and shallow roof zones at ROOF_SHALLOW_EDGES * h.
+        Surfaces that do not apply (the shallow roof zones for roof pitches
+        of 10 degrees or more with wind normal to the ridge, and the steep
+        roof slopes otherwise) are NaN.
+    """
+    h, d, b, roof_pitch, vary_with_height = (
+        array.ravel() for array in np.broadcast_arrays(
+            np.atleast_1d(np.asarray(h, dtype=float)),
+            np.asarray(d, dtype=float),
+            np.asarray(b, dtype=float),
+            np.asarray(roof_pitch, dtype=float),
+            np.asarray(vary_with_height, dtype=bool)
+        )
+    )
+    n = h.size
+
+    # Ratios for wind at 0 and 90 degrees (d and b swapped), shape (buildings, 2)
+    height_b = h / b
+    height_d = h / d
+    depth_width = d / b
+    width_depth = b / d
+    height_depth_ratio = np.stack([height_d, height_b], axis=-1)
+    depth_width_ratio = np.stack([depth_width, width_depth], axis=-1)
+    width_depth_ratio = np.stack([width_depth, depth_width], axis=-1)
+    pitch = np.stack([roof_pitch, np.zeros(n)], axis=-1)
+    steep = pitch >= 10
+
+    C_pe = np.full((n, 2, len(SURFACES)), np.nan)
+    C_pe[..., 0] = ext_pressure_coeff_windward_wall_batch(h[:, None], vary_with_height[:, None])
+    C_pe[..., 1] = _leeward_wall_cpe(depth_width_ratio, pitch)
+    C_pe[..., 2:6] = SIDE_WALL_CPE
+    C_pe = np.repeat(C_pe[..., None], 2, axis=-1)
+
+    shallow = _roof_shallow_cpe(height_depth_ratio)
+    C_pe[..., 6:11, :] = np.where(steep[..., None, None], np.nan, np.sort(shallow, axis=-1))
+    roof_steep = _roof_steep_cpe(height_depth_ratio, width_depth_ratio, np.where(steep, pitch, np.nan))
+    C_pe[..., 11:13, :] = np.sort(roof_steep, axis=-1)
+
+    return C_pe[:, [0, 1, 0, 1]]
+
+
+def int_pressure_coeff_batch(opening_ratio, opening_surface, C_pe=0.0) -> tuple:
+    """
+    Calculates the internal pressure coefficients for enclosed buildings with
+    a dominant opening per AS/NZS 1170.2:2021 Table 5.1(B) for arrays of
+    opening scenarios. Mirrors
+    `aerodynamic_shape_factors.int_pressure_coeff_dominant_opening`.
+
+    Args:
+        opening_ratio: ratio of the dominant opening area to the total open
+            area of the other wall and roof surfaces.
+        opening_surface: the surface containing the dominant opening, either
+            'Windward Wall', 'Leeward Wall', 'Side Wall' or 'Roof'.
+        C_pe: the external pressure coefficient at the dominant opening.
+
+    Returns:
+        Tuple of arrays (C_pi_min, C_pi_max).
+    """
+    opening_ratio, opening_surface, C_pe = np.broadcast_arrays(
+        np.asarray(opening_ratio, dtype=float),
+        np.char.lower(np.asarray(opening_surface, dtype=str)),
+        np.asarray(C_pe, dtype=float)
+    )
+    windward = opening_surface == 'windward wall'
+    other = np.isin(opening_surface, ['leeward wall', 'side wall', 'roof'])
+    if not np.all(windward | other):
+        invalid = np.unique(opening_surface[~(windward | other)])
+        raise KeyError(f"The opening surface(s) {list(invalid)} are invalid. Please input a valid surface.")
+
+    coeffs = [
+        np.where(
+            windward,
+            np.interp(opening_ratio, DOMINANT_OPENING_RATIOS, DOMINANT_OPENING_WINDWARD[:, i]),
+            np.interp(opening_ratio, DOMINANT_OPENING_RATIOS, DOMINANT_OPENING_OTHER[:, i])
+        )
+        for i in range(4)
+    ]
+    C_pi_1 = coeffs[0] + coeffs[1] * C_pe
+    C_pi_2 = coeffs[2] + coeffs[3] * C_pe
+    return np.minimum(C_pi_1, C_pi_2), np.maximum(C_pi_1, C_pi_2)
+
+
+def action_combination_factor_batch(C_pi, framing_type='Case z') -> tuple:
+    """
+    Calculates the action combination factors per AS/NZS 1170.2:2021 Table
+    5.5 for arrays of internal pressure coefficients and framing types.
+    Mirrors `aerodynamic_shape_factors.action_combination_factor`; framing
+    types other than 'Type 1' to 'Type 5' return 1.0.
+
+    Args:
+        C_pi: the internal pressure coefficients.
+        framing_type: the framing arrangement types, 'Type 1' to 'Type 5'.
+
+    Returns:
+        Tuple of arrays (K_ce, K_ci).
+    """
+    C_pi, framing_type = np.broadcast_arrays(
+        np.asarray(C_pi, dtype=float),
+        np.asarray(framing_type)
+    )
+    K_ce = np.ones(C_pi.shape)
+    K_ci = np.ones(C_pi.shape)
+    high = np.abs(C_pi) >= 0.4
+    for framing, (low_case, high_case) in ACTION_COMBINATION_FACTORS.items():
+        mask = framing_type == framing
+        K_ce[mask] = np.where(high[mask], high_case[0], low_case[0])
+        K_ci[mask] = np.where(high[mask], high_case[1], low_case[1])
+    return K_ce, K_ci
+
+
+def net_pressure_batch(
+        q,
+        C_pe,
+        C_pi,
+        K_a=1.0,
+        K_ce=1.0,
+        K_ci=1.0,
+        K_l=1.0
+) -> np.ndarray:
+    """
+    Calculates the net design pressure on surfaces for arrays of surfaces and
+    internal pressure (opening) scenarios in one pass,
+
+        p = q (K_a K_ce K_l C_pe - K_ci C_pi)
+
+    Surface quantities (q, C_pe, K_a and K_l) given as 1D arrays are laid
+    along the first axis and scenario quantities (C_pi, K_ce and K_ci) given
+    as 1D arrays are laid along the second axis; 2D arrays with shape
+    (surfaces, scenarios) and scalars are used as is.
+
+    Args:
+        q: basic wind pressure on each surface (kPa).
+        C_pe: external pressure coefficient of each surface.
+        C_pi: internal pressure coefficient of each scenario.
+        K_a: area reduction factor of each surface; default is 1.0.
+        K_ce: external action combination factor; default is 1.0.
+        K_ci: internal action combination factor; default is 1.0.
+        K_l: local pressure factor of each surface; default is 1.0.
+
+    Returns:
+        Net design pressures (kPa) with shape (surfaces, scenarios).
+    """
+    def surface(value):
+        value = np.asarray(value, dtype=float)
+        return value[:, None] if value.ndim == 1 else value
+
+    def scenario(value):
+        value = np.asarray(value, dtype=float)
+        return value[None, :] if value.ndim == 1 else value
+
+    return surface(q) * (
+        surface(K_a) * scenario(K_ce) * surface(K_l) * surface(C_pe)
+        - scenario(K_ci) * scenario(C_pi)
+    )
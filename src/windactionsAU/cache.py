@@ -0,0 +1,252 @@
+"""
+Optional persistent, content-addressed cache of site-level results (e.g.
+V_sit,beta, V_des,theta and C_pe sets) stored in a local SQLite database.
+
+Entries are keyed by a stable hash of the normalised inputs together with the
+package version and the lookup table version, so a package upgrade or a
+revised table invalidates previous results automatically.
+"""
+
+import hashlib
+import io
+import json
+import sqlite3
+import threading
+
+import numpy as np
+
+from windactionsAU import __version__
+from windactionsAU.batch import table_version
+
+
+# Maximum number of bound parameters used in a single SQLite statement
+_SQL_CHUNK = 500
+
+
+def _normalise(value):
+    """
+    Converts an input value into a JSON serialisable canonical form. Scalars
+    are tagged with their kind ('b' boolean, 'n' number, 's' string) so that
+    e.g. the float 10.5 and the string '10.5' produce different keys.
+    """
+    if isinstance(value, dict):
+        return {str(k): _normalise(v) for k, v in value.items()}
+    if isinstance(value, np.ndarray):
+        value = value.tolist()
+    if isinstance(value, (list, tuple)):
+        return [_normalise(v) for v in value]
+    if isinstance(value, (bool, np.bool_)):
+        return ['b', bool(value)]
+    if isinstance(value, (int, np.integer)):
+        return ['n', int(value)]
+    if isinstance(value, (float, np.floating)):
+        value = float(value)
+        if not np.isfinite(value):
+            return ['n', repr(value)]
+        if value == int(value) and abs(value) < 2 ** 53:
+            return ['n', int(value)]
+        return ['n', repr(value)]
+    if isinstance(value, str):
+        return ['s', value.strip()]
+    if value is None:
+        return None
+    raise TypeError(f"Cache inputs of type '{type(value).__name__}' are not supported.")
+
+
+def make_key(inputs: dict, tag: str=None) -> str:
+    """
+    Returns a stable hash of a dictionary of inputs.
+
+    Args:
+        inputs: the calculation inputs, e.g. {'wind_region': 'C', 'R': 500}.
+            Numeric values are normalised so that 500, 500.0 and
+            np.float64(500) produce the same key; other floats are keyed by
+            their exact repr.
+        tag: an additional tag included in the hash, e.g. the package and
+            table versions.
+
+    Returns:
+        Hexadecimal key.
+    """
+    payload = json.dumps(_normalise(inputs), sort_keys=True, separators=(',', ':'))
+    digest = hashlib.sha256(payload.encode())
+    if tag is not None:
+        digest.update(b'|' + tag.encode())
+    return digest.hexdigest()
+
+
+def _dumps(value) -> bytes:
+    buffer = io.BytesIO()
+    np.save(buffer, np.asarray(value), allow_pickle=False)
+    return buffer.getvalue()
+
+
+def _loads(blob: bytes) -> np.ndarray:
+    return np.load(io.BytesIO(blob), allow_pickle=False)
+
+
+class ResultCache:
+    """
+    Persistent cache of array results in a SQLite database, with bulk get/put
+    for batches and least recently used eviction once the stored results
+    exceed a size limit.
+
+    Args:
+        path: location of the SQLite database; ':memory:' may be used for a
+            transient cache.
+        max_bytes: maximum total size of the stored results (bytes); default
+            is 512 MB.
+        namespace: separates results of different calculations stored in
+            the same database, e.g. 'V_sit_beta'; default is 'default'.
+        version_tag: overrides the version tag included in every key;
+            defaults to the package version and the lookup table version.
+    """
+    def __init__(
+            self,
+            path: str,
+            max_bytes: int=512 * 2 ** 20,
+            namespace: str='default',
+            version_tag: str=None
+    ):
+        self.path = str(path)
+        self.max_bytes = int(max_bytes)
+        self.namespace = namespace
+        if version_tag is None:
+            version_tag = f"{__version__}|{table_version()}"
+        self.version_tag = f"{namespace}|{version_tag}"
+        self.hits = 0
+        self.misses = 0
+        self.puts = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, "
+            "size INTEGER NOT NULL, accessed INTEGER NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)"
+        )
+        self._connection.commit()
+        # Logical clock recording the order in which entries were last used
+        self._clock = self._connection.execute(
+            "SELECT COALESCE(MAX(accessed), 0) FROM results"
+        ).fetchone()[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._connection.close()
+
+    def key(self, inputs: dict) -> str:
+        """Returns the cache key of a dictionary of inputs."""
+        return make_key(inputs, self.version_tag)
+
+    def get(self, key: str):
+        """Returns the cached array for a key, or None if not cached."""
+        return self.get_many([key])[0]
+
+    def put(self, key: str, value):
+        """Stores an array result against a key."""
+        self.put_many([key], [value])
+
+    def get_many(self, keys: list) -> list:
+        """
+        Returns the cached arrays for a batch of keys, with None in place of
+        any key that is not cached.
+        """
+        keys = list(keys)
+        found = {}
+        with self._lock:
+            for start in range(0, len(keys), _SQL_CHUNK):
+                chunk = keys[start:start + _SQL_CHUNK]
+                placeholders = ','.join('?' * len(chunk))
+                rows = self._connection.execute(
+                    f"SELECT key, value FROM results WHERE key IN ({placeholders})",
+                    chunk
+                ).fetchall()
+                found.update(rows)
+                if rows:
+                    self._clock += 1
+                    now = self._clock
+                    self._connection.executemany(
+                        "UPDATE results SET accessed = ? WHERE key = ?",
+                        [(now, key) for key, _ in rows]
+                    )
+            self._connection.commit()
+            values = [_loads(found[key]) if key in found else None for key in keys]
+            hits = sum(value is not None for value in values)
+            self.hits += hits
+            self.misses += len(keys) - hits
+        return values
+
+    def put_many(self, keys: list, values: list):
+        """Stores a batch of array results, evicting old entries if required."""
+        blobs = [(key, _dumps(value)) for key, value in zip(keys, values)]
+        with self._lock:
+            self._clock += 1
+            rows = [(key, blob, len(blob), self._clock) for key, blob in blobs]
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO results (key, value, size, accessed) "
+                "VALUES (?, ?, ?, ?)",
+                rows
+            )
+            self.puts += len(rows)
+            self._evict()
+            self._connection.commit()
+
+    def _evict(self):
+        """Removes the least recently used entries until under max_bytes."""
+        total = self._size_bytes()
+        while total > self.max_bytes:
+            oldest = self._connection.execute(
+                "SELECT key, size FROM results ORDER BY accessed LIMIT ?",
+                (_SQL_CHUNK,)
+            ).fetchall()
+            if not oldest:
+                break
+            removed = []
+            for key, size in oldest:
+                if total <= self.max_bytes:
+                    break
+                removed.append((key,))
+                total -= size
+            self._connection.executemany("DELETE FROM results WHERE key = ?", removed)
+            self.evictions += len(removed)
+
+    def _size_bytes(self) -> int:
+        return self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM results"
+        ).fetchone()[0]
+
+    def clear(self):
+        """Removes all entries from the cache."""
+        with self._lock:
+            self._connection.execute("DELETE FROM results")
+            self._connection.commit()
+
+    @property
+    def stats(self) -> dict:
+        """
+        Returns the cache statistics: hits, misses, hit rate, puts, evictions,
+        number of entries and total size (bytes).
+        """
+        with self._lock:
+            entries, size = self._connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results"
+            ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'puts': self.puts,
+            'evictions': self.evictions,
+            'entries': entries,
+            'size_bytes': size,
+        }
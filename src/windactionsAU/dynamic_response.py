@@ -0,0 +1,190 @@
+"""
+Dynamic response factor, C_dyn, for along-wind response per AS/NZS
+1170.2:2021 Section 6, vectorised over arrays of buildings and natural
+frequencies.
+"""
+
+import numpy as np
+
+
+# Table 6.1 turbulence intensity, I_h, built once at import. Only the
+# tabulated terrain categories are included; TC2.5 is not tabulated here and
+# is rejected rather than interpolated between categories.
+TURBULENCE_HEIGHTS = np.array([5, 10, 15, 20, 30, 40, 50, 75, 100, 150, 200], dtype=float)
+TURBULENCE_CATEGORIES = ['TC1', 'TC2', 'TC3', 'TC4']
+TURBULENCE_TABLE = np.array([
+    [0.165, 0.157, 0.152, 0.147, 0.140, 0.133, 0.128, 0.118, 0.108, 0.095, 0.085],
+    [0.196, 0.183, 0.176, 0.171, 0.162, 0.156, 0.151, 0.140, 0.131, 0.117, 0.107],
+    [0.271, 0.239, 0.225, 0.215, 0.203, 0.195, 0.188, 0.176, 0.166, 0.150, 0.139],
+    [0.342, 0.342, 0.342, 0.342, 0.305, 0.285, 0.270, 0.248, 0.233, 0.210, 0.196],
+])
+_CATEGORY_INDEX = {category: i for i, category in enumerate(TURBULENCE_CATEGORIES)}
+
+
+def _category_index(terrain_category) -> np.ndarray:
+    terrain_category = np.asarray(terrain_category)
+    index = np.full(terrain_category.shape, -1, dtype=np.int64)
+    for category in np.unique(terrain_category):
+        if category == 'TC2.5':
+            raise KeyError("The turbulence intensity of terrain category 'TC2.5' is not tabulated. Please use 'TC2' or 'TC3'.")
+        if category not in _CATEGORY_INDEX:
+            raise KeyError(f"The terrain category '{category}' is invalid. Please input a valid terrain category.")
+        index[terrain_category == category] = _CATEGORY_INDEX[category]
+    return index
+
+
+def turbulence_intensity(terrain_category, height) -> np.ndarray:
+    """
+    Calculates the turbulence intensity per Table 6.1, linearly interpolated
+    with height.
+
+    Args:
+        terrain_category: array of terrain categories, 'TC1', 'TC2', 'TC3'
+            or 'TC4'.
+        height: array of heights (m).
+
+    Returns:
+        Array of turbulence intensities, I_h.
+    """
+    category, height = np.broadcast_arrays(
+        _category_index(terrain_category),
+        np.asarray(height, dtype=float)
+    )
+    z = np.clip(height, TURBULENCE_HEIGHTS[0], TURBULENCE_HEIGHTS[-1])
+    i = np.clip(np.searchsorted(TURBULENCE_HEIGHTS, z, side='right') - 1, 0, TURBULENCE_HEIGHTS.size - 2)
+    weight = (z - TURBULENCE_HEIGHTS[i]) / (TURBULENCE_HEIGHTS[i + 1] - TURBULENCE_HEIGHTS[i])
+    return (
+        TURBULENCE_TABLE[category, i] * (1 - weight)
+        + TURBULENCE_TABLE[category, i + 1] * weight
+    )
+
+
+def turbulence_length_scale(h) -> np.ndarray:
+    """
+    Calculates the integral turbulence length scale, L_h = 85 (h / 10)^0.25.
+    """
+    return 85 * (np.asarray(h, dtype=float) / 10) ** 0.25
+
+
+def background_factor(h, b_sh, s=0.0) -> np.ndarray:
+    """
+    Calculates the background factor, B_s, which is a measure of the slowly
+    varying background component of the fluctuating response.
+
+    Args:
+        h: average roof height (m).
+        b_sh: average breadth of the structure between heights s and h (m).
+        s: height of the level at which action effects are calculated (m);
+            default is 0 (the base).
+
+    Returns:
+        Background factor, B_s.
+    """
+    h = np.asarray(h, dtype=float)
+    b_sh = np.asarray(b_sh, dtype=float)
+    s = np.asarray(s, dtype=float)
+    return 1 / (1 + np.sqrt(36 * (h - s) ** 2 + 64 * b_sh ** 2) / turbulence_length_scale(h))
+
+
+def size_reduction_factor(n_a, h, b_0h, I_h, V_des, g_v: float=3.7) -> np.ndarray:
+    """
+    Calculates the size reduction factor, S.
+
+    Args:
+        n_a: first mode natural frequency of vibration (Hz).
+        h: average roof height (m).
+        b_0h: average breadth of the structure between heights 0 and h (m).
+        I_h: turbulence intensity at height h.
+        V_des: design wind speed at height h (m/s).
+        g_v: peak factor for the upwind velocity fluctuations; default 3.7.
+
+    Returns:
+        Size reduction factor, S.
+    """
+    scale = np.asarray(n_a, dtype=float) * (1 + g_v * np.asarray(I_h, dtype=float)) / np.asarray(V_des, dtype=float)
+    return 1 / ((1 + 3.5 * scale * h) * (1 + 4 * scale * b_0h))
+
+
+def spectrum_factor(n_a, h, I_h, V_des, g_v: float=3.7) -> np.ndarray:
+    """
+    Calculates the spectrum of turbulence in the approaching wind stream,
+    E_t = pi N / (1 + 70.8 N^2)^(5/6), with the reduced frequency
+    N = n_a L_h (1 + g_v I_h) / V_des.
+
+    Args:
+        n_a: first mode natural frequency of vibration (Hz).
+        h: average roof height (m).
+        I_h: turbulence intensity at height h.
+        V_des: design wind speed at height h (m/s).
+        g_v: peak factor for the upwind velocity fluctuations; default 3.7.
+
+    Returns:
+        Spectrum of turbulence, E_t.
+    """
+    N = (
+        np.asarray(n_a, dtype=float) * turbulence_length_scale(h)
+        * (1 + g_v * np.asarray(I_h, dtype=float)) / np.asarray(V_des, dtype=float)
+    )
+    return np.pi * N / (1 + 70.8 * N ** 2) ** (5 / 6)
+
+
+def resonant_peak_factor(n_a) -> np.ndarray:
+    """
+    Calculates the peak factor for resonant response (10 min period),
+    g_R = sqrt(2 ln(600 n_a)).
+    """
+    return np.sqrt(2 * np.log(600 * np.asarray(n_a, dtype=float)))
+
+
+def dynamic_response_factor(
+        h,
+        b,
+        n_a,
+        V_des,
+        terrain_category,
+        damping_ratio=0.01,
+        s=0.0,
+        g_v: float=3.7
+) -> np.ndarray:
+    """
+    Calculates the along-wind dynamic response factor per Clause 6.2.2,
+    vectorised over all arguments (which are broadcast against each other).
+
+        C_dyn = (1 + 2 I_h sqrt(g_v^2 B_s + H_s g_R^2 S E_t / zeta))
+                / (1 + 2 g_v I_h)
+
+    Structures with a first mode natural frequency greater than 1 Hz are not
+    dynamically wind sensitive and are assigned C_dyn = 1.0.
+
+    Args:
+        h: average roof height (m).
+        b: average breadth of the structure, normal to the wind (m).
+        n_a: first mode natural frequency of vibration (Hz).
+        V_des: design wind speed at height h (m/s).
+        terrain_category: the site terrain category, e.g. 'TC2'.
+        damping_ratio: ratio of structural damping to critical damping;
+            default is 0.01.
+        s: height of the level at which action effects are calculated (m);
+            default is 0 (the base).
+        g_v: peak factor for the upwind velocity fluctuations; default 3.7.
+
+    Returns:
+        Dynamic response factor, C_dyn.
+    """
+    h = np.asarray(h, dtype=float)
+    n_a = np.asarray(n_a, dtype=float)
+    s = np.asarray(s, dtype=float)
+
+    I_h = turbulence_intensity(terrain_category, h)
+    B_s = background_factor(h, b, s)
+    H_s = 1 + (s / h) ** 2
+    with np.errstate(invalid='ignore'):
+        g_R = resonant_peak_factor(n_a)
+    S = size_reduction_factor(n_a, h, b, I_h, V_des, g_v)
+    E_t = spectrum_factor(n_a, h, I_h, V_des, g_v)
+
+    C_dyn = (
+        (1 + 2 * I_h * np.sqrt(g_v ** 2 * B_s + H_s * g_R ** 2 * S * E_t / damping_ratio))
+        / (1 + 2 * g_v * I_h)
+    )
+    return np.where(n_a > 1.0, 1.0, C_dyn)
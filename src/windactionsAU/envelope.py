@@ -0,0 +1,124 @@
+"""
+Governing (envelope) design pressures across wind directions, external and
+internal pressure coefficient cases (each with its action combination
+factors), found by vectorised reductions rather than by enumerating every
+combination.
+"""
+
+import numpy as np
+
+from windactionsAU.batch import action_combination_factor_batch
+
+
+ENVELOPE_DTYPE = np.dtype([
+    ('p_max', np.float64),
+    ('p_min', np.float64),
+    ('max_direction', np.int16),
+    ('max_cpe', np.int16),
+    ('max_cpi', np.int16),
+    ('min_direction', np.int16),
+    ('min_cpe', np.int16),
+    ('min_cpi', np.int16),
+])
+
+
+def governing_pressures(
+        q,
+        C_pe,
+        C_pi,
+        K_c=None,
+        framing_type='Case z',
+        K_a=1.0,
+        K_l=1.0
+) -> np.ndarray:
+    """
+    Calculates the governing positive and negative net design pressures of
+    each member (or zone),
+
+        p = q (K_a K_ce K_l C_pe - K_ci C_pi)
+
+    over all directions, C_pe values and internal pressure cases, where each
+    internal pressure case is a C_pi with its action combination factors
+    (K_ce, K_ci) per Table 5.5.
+
+    As q and the factors are non-negative, for each direction and internal
+    pressure case the maximum is given by the largest C_pe (and the minimum
+    by the smallest). The other C_pe values are pruned before evaluation, so
+    only (members x directions x C_pi cases) candidates are formed for each
+    of the maximum and minimum. This is the only pruning: every direction
+    and every (C_pi, K_c) pair is evaluated, without a general search for
+    candidates bounded by others.
+
+    Args:
+        q: basic wind pressure with shape (members, directions) (kPa).
+        C_pe: external pressure coefficients with shape (members, directions,
+            cases), e.g. the minimum and maximum C_pe of the zone.
+        C_pi: internal pressure coefficient cases, with shape (cases,) or
+            (members, cases).
+        K_c: action combination factors (K_ce, K_ci) of each C_pi case, with
+            shape (cases, 2) or (members, cases, 2); default is None, for
+            which they are calculated from the framing type.
+        framing_type: Table 5.5 framing type of the members, 'Type 1' to
+            'Type 5', used where K_c is not given; default is 'Case z' (1.0).
+        K_a: area reduction factor, broadcastable to (members, directions);
+            default is 1.0.
+        K_l: local pressure factor, broadcastable to (members, directions);
+            default is 1.0.
+
+    Returns:
+        Structured array with one record per member holding the governing
+        pressures, 'p_max' and 'p_min' (kPa), and the direction, C_pe and
+        C_pi case indices at which each occurs.
+    """
+    q = np.atleast_2d(np.asarray(q, dtype=float))
+    n_members, n_directions = q.shape
+    C_pe = np.asarray(C_pe, dtype=float)
+    if C_pe.ndim == 2:
+        C_pe = C_pe[:, :, None]
+    C_pe = np.broadcast_to(C_pe, (n_members, n_directions, C_pe.shape[-1]))
+    C_pi = np.atleast_1d(np.asarray(C_pi, dtype=float))
+    C_pi = np.broadcast_to(C_pi, (n_members, C_pi.shape[-1]))
+    if K_c is None:
+        framing_type = np.asarray(framing_type)
+        K_ce, K_ci = action_combination_factor_batch(
+            C_pi, framing_type[:, None] if framing_type.ndim == 1 else framing_type
+        )
+    else:
+        K_c = np.broadcast_to(np.asarray(K_c, dtype=float), C_pi.shape + (2,))
+        K_ce, K_ci = K_c[..., 0], K_c[..., 1]
+    factor = np.broadcast_to(
+        np.asarray(K_a, dtype=float) * np.asarray(K_l, dtype=float),
+        (n_members, n_directions)
+    )
+    if np.any(q < 0) or np.any(factor < 0) or np.any(K_ce < 0) or np.any(K_ci < 0):
+        raise ValueError("q, K_a, K_l and K_c shall not be negative.")
+
+    # Prune to the bounding C_pe cases
+    i_pe_max = np.argmax(C_pe, axis=-1)
+    i_pe_min = np.argmin(C_pe, axis=-1)
+    pe_max = np.take_along_axis(C_pe, i_pe_max[..., None], axis=-1)
+    pe_min = np.take_along_axis(C_pe, i_pe_min[..., None], axis=-1)
+
+    # Candidates with shape (members, directions, C_pi cases)
+    external = factor[..., None] * K_ce[:, None, :]
+    internal = (K_ci * C_pi)[:, None, :]
+    upper = q[..., None] * (external * pe_max - internal)
+    lower = q[..., None] * (external * pe_min - internal)
+
+    upper = upper.reshape(n_members, -1)
+    lower = lower.reshape(n_members, -1)
+    j_max = np.argmax(upper, axis=-1)
+    j_min = np.argmin(lower, axis=-1)
+    n_cases = C_pi.shape[-1]
+    members = np.arange(n_members)
+
+    result = np.empty(n_members, dtype=ENVELOPE_DTYPE)
+    result['p_max'] = upper[members, j_max]
+    result['p_min'] = lower[members, j_min]
+    result['max_direction'] = j_max // n_cases
+    result['max_cpe'] = i_pe_max[members, j_max // n_cases]
+    result['max_cpi'] = j_max % n_cases
+    result['min_direction'] = j_min // n_cases
+    result['min_cpe'] = i_pe_min[members, j_min // n_cases]
+    result['min_cpi'] = j_min % n_cases
+    return result
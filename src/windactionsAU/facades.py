@@ -0,0 +1,157 @@
+"""
+Design wind speeds and external pressure coefficients for buildings with
+polygonal (e.g. L-shaped) or rotated footprints, evaluated for an arbitrary
+set of facade normal directions per building.
+"""
+
+import numpy as np
+
+from windactionsAU.batch import (
+    sector_maximum_batch,
+    ext_pressure_coeff_windward_wall_batch,
+    ext_pressure_coeff_leeward_wall_batch,
+    ext_pressure_coeff_roof_shallow_batch,
+    ext_pressure_coeff_roof_steep_batch,
+)
+from windactionsAU.wind_pressure import basic_wind_pressure
+
+
+def _footprints(vertices) -> np.ndarray:
+    """Returns footprint vertices with shape (buildings, vertices, 2)."""
+    vertices = np.asarray(vertices, dtype=float)
+    return vertices[None] if vertices.ndim == 2 else vertices
+
+
+def facade_normals(vertices) -> np.ndarray:
+    """
+    Calculates the outward normal direction of each edge of building
+    footprints.
+
+    Args:
+        vertices: footprint vertices (easting, northing) in order around the
+            polygon, shape (buildings, vertices, 2), or (vertices, 2) for a
+            single building. Buildings with fewer vertices may be padded with
+            NaN.
+
+    Returns:
+        Facade normal angles (degrees clockwise from North), shape
+        (buildings, vertices), where entry i is the normal of the edge from
+        vertex i to the next vertex; NaN for padded vertices.
+    """
+    vertices = _footprints(vertices)
+    valid = ~np.isnan(vertices).any(axis=-1)
+    n_valid = valid.sum(axis=-1)
+
+    # Next vertex, wrapping from the last valid vertex back to the first
+    position = np.arange(vertices.shape[1])
+    following = np.where(position[None, :] + 1 < n_valid[:, None], position + 1, 0)
+    next_vertices = np.take_along_axis(vertices, following[..., None], axis=1)
+    edges = next_vertices - vertices
+
+    # Shoelace signed area; positive for anti-clockwise vertices
+    x, y = vertices[..., 0], vertices[..., 1]
+    area = 0.5 * np.nansum(x * next_vertices[..., 1] - next_vertices[..., 0] * y, axis=-1)
+    sign = np.where(area >= 0, 1.0, -1.0)[:, None]
+
+    normal_x = sign * edges[..., 1]
+    normal_y = -sign * edges[..., 0]
+    angles = np.degrees(np.arctan2(normal_x, normal_y)) % 360
+    return np.where(valid, angles, np.nan)
+
+
+def footprint_dimensions(vertices, theta) -> tuple:
+    """
+    Calculates the effective building depth and breadth of footprints for
+    wind from arbitrary directions, as the extents of the footprint parallel
+    and perpendicular to the wind.
+
+    Args:
+        vertices: footprint vertices (easting, northing), shape (buildings,
+            vertices, 2) or (vertices, 2), NaN padded.
+        theta: wind directions (degrees clockwise from North), shape
+            (buildings, k).
+
+    Returns:
+        Tuple of arrays (d, b), each of shape (buildings, k) (m).
+    """
+    vertices = _footprints(vertices)
+    theta = np.radians(np.asarray(theta, dtype=float))
+    sin, cos = np.sin(theta)[..., None], np.cos(theta)[..., None]
+    x = vertices[:, None, :, 0]
+    y = vertices[:, None, :, 1]
+
+    along = x * sin + y * cos
+    across = x * cos - y * sin
+    d = np.nanmax(along, axis=-1) - np.nanmin(along, axis=-1)
+    b = np.nanmax(across, axis=-1) - np.nanmin(across, axis=-1)
+    return d, b
+
+
+def facade_wind_actions(
+        vertices,
+        facade_angles,
+        V_sit_beta,
+        h,
+        roof_pitch=0.0
+) -> dict:
+    """
+    Calculates the design wind speeds and external pressure coefficients for
+    wind normal to each facade of buildings with polygonal footprints.
+
+    For each facade the design wind speed is the maximum site wind speed
+    within +/- 45 degrees of the facade normal (as per Clause 2.3 for the
+    orthogonal directions of rectangular buildings). The depth and breadth
+    for the leeward wall and roof coefficients are the footprint extents
+    parallel and perpendicular to the wind.
+
+    Args:
+        vertices: footprint vertices (easting, northing), shape (buildings,
+            vertices, 2), NaN padded.
+        facade_angles: facade normal angles (degrees clockwise from North),
+            shape (buildings, facades), NaN padded; refer to
+            `facade_normals`.
+        V_sit_beta: site wind speeds in the 8 cardinal directions, shape
+            (buildings, 8) (m/s).
+        h: average roof height of each building (m).
+        roof_pitch: roof pitch of each building (degrees); default is 0.
+
+    Returns:
+        Dictionary of arrays with shape (buildings, facades):
+            'V_des': design wind speed (m/s).
+            'q': basic wind pressure (kPa).
+            'd', 'b': effective building depth and breadth (m).
+            'C_pe_windward', 'C_pe_leeward': wall C_pe.
+            'C_pe_roof': Table 5.3(A) roof C_pe with shape (buildings,
+                facades, 5, 2) where the roof pitch is less than 10 degrees,
+                otherwise NaN.
+            'C_pe_roof_steep': Table 5.3(B) and 5.3(C) upwind and downwind
+                roof C_pe with shape (buildings, facades, 2, 2) where the
+                roof pitch is 10 degrees or more, otherwise NaN.
+    """
+    facade_angles = np.atleast_2d(np.asarray(facade_angles, dtype=float))
+    missing = np.isnan(facade_angles)
+    theta = np.where(missing, 0.0, facade_angles)
+    n_buildings = facade_angles.shape[0]
+    h = np.broadcast_to(np.asarray(h, dtype=float), (n_buildings,))[:, None]
+    roof_pitch = np.broadcast_to(np.asarray(roof_pitch, dtype=float), (n_buildings,))[:, None]
+
+    V_des = np.where(missing, np.nan, sector_maximum_batch(theta, V_sit_beta))
+    d, b = footprint_dimensions(vertices, theta)
+    d = np.where(missing, np.nan, d)
+    b = np.where(missing, np.nan, b)
+
+    C_pe_windward = np.where(missing, np.nan, ext_pressure_coeff_windward_wall_batch(h))
+    C_pe_roof = ext_pressure_coeff_roof_shallow_batch(h, d)
+    C_pe_roof = np.where((roof_pitch < 10)[..., None, None], C_pe_roof, np.nan)
+    C_pe_roof_steep = ext_pressure_coeff_roof_steep_batch(h, d, b, roof_pitch)
+
+    return {
+        'V_des': V_des,
+        'q': basic_wind_pressure(V_des),
+        'd': d,
+        'b': b,
+        'C_pe_windward': C_pe_windward,
+        'C_pe_leeward': ext_pressure_coeff_leeward_wall_batch(d, b, roof_pitch),
+        'C_pe_roof': C_pe_roof,
+        'C_pe_roof_steep': C_pe_roof_steep,
+    }
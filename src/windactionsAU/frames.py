@@ -0,0 +1,167 @@
+"""
+Portal frame line loads (uniformly distributed loads on the columns and
+rafters of each frame) for arrays of frames, for the 4 orthogonal directions
+and any number of internal pressure cases, with the action combination
+factors of AS/NZS 1170.2:2021 Table 5.5 applied.
+
+The frames span the building depth d (parallel with the wind at 0 degrees)
+and are spaced along the building length b, with the ridge parallel to b.
+Eave A is the windward eave for wind at 0 degrees and eave B the windward
+eave for wind at 180 degrees; for wind at 90 and 270 degrees (parallel to the
+ridge) the columns are on the side walls and the loads depend on the
+distance of the frame from the windward end wall.
+"""
+
+import numpy as np
+import pandas as pd
+
+from windactionsAU.batch import (
+    ORTHOGONAL_ANGLES,
+    SURFACES,
+    ext_pressure_coeff_all_directions_batch,
+    action_combination_factor_batch,
+)
+from windactionsAU.zones import (
+    side_wall_cpe_at,
+    roof_cpe_at,
+    roof_cpe_span_average,
+)
+
+
+FRAME_MEMBERS = ['column_A', 'rafter_A', 'rafter_B', 'column_B']
+
+
+def _frame_cpe(h, d, b, roof_pitch, position) -> np.ndarray:
+    """
+    Returns the external pressure coefficients of the frame members with
+    shape (frames, 4 directions, 2 (min, max), 4 members).
+    """
+    n = h.size
+    C_pe = np.empty((n, 4, 2, len(FRAME_MEMBERS)))
+
+    # Wind normal to the ridge (0 and 180 degrees)
+    surfaces = ext_pressure_coeff_all_directions_batch(h, d, b, roof_pitch)[:, 0]
+    windward = surfaces[:, SURFACES.index('windward')]
+    leeward = surfaces[:, SURFACES.index('leeward')]
+    steep = (roof_pitch >= 10)[:, None]
+    upwind = np.where(
+        steep,
+        surfaces[:, SURFACES.index('roof_upwind')],
+        roof_cpe_span_average(0.0, d / 2, h, d)
+    )
+    downwind = np.where(
+        steep,
+        surfaces[:, SURFACES.index('roof_downwind')],
+        roof_cpe_span_average(d / 2, d, h, d)
+    )
+    C_pe[:, 0] = np.stack([windward, upwind, downwind, leeward], axis=-1)
+    C_pe[:, 2] = np.stack([leeward, downwind, upwind, windward], axis=-1)
+
+    # Wind parallel to the ridge (90 and 270 degrees)
+    for direction, distance in [(1, position), (3, b - position)]:
+        side_wall = np.repeat(side_wall_cpe_at(distance, h)[:, None], 2, axis=-1)
+        roof = roof_cpe_at(distance, h, b)
+        C_pe[:, direction] = np.stack([side_wall, roof, roof, side_wall], axis=-1)
+    return C_pe
+
+
+def portal_frame_loads(
+        q,
+        h,
+        d,
+        b,
+        position,
+        bay_spacing,
+        C_pi,
+        roof_pitch=0.0,
+        framing_type='Type 1',
+        K_a=1.0
+) -> np.ndarray:
+    """
+    Calculates the uniformly distributed wind loads on the members of portal
+    frames, w = p s, where s is the bay spacing and the net pressure is
+
+        p = q (K_a K_ce C_pe - K_ci C_pi)
+
+    with K_ce and K_ci per Table 5.5 for the framing type and the magnitude
+    of each C_pi. The wall C_pe are per Table 5.2, the roof C_pe per Table
+    5.3(B) for roof pitches of 10 degrees or more and otherwise the average
+    of Table 5.3(A) over each half of the span, and for wind parallel to the
+    ridge the side wall and roof C_pe at the frame position.
+
+    Args:
+        q: basic wind pressure of each frame for the 4 orthogonal directions,
+            shape (frames, 4) (kPa).
+        h: average roof height (m), shape (frames,).
+        d: building depth, the frame span (m), shape (frames,).
+        b: building length, parallel with the ridge (m), shape (frames,).
+        position: distance of each frame from the end wall that is windward
+            for wind at 90 degrees (m), shape (frames,).
+        bay_spacing: tributary width of each frame (m), shape (frames,).
+        C_pi: internal pressure coefficients of the internal pressure cases,
+            shape (cases,) or (frames, cases).
+        roof_pitch: roof pitch (degrees); default is 0.
+        framing_type: Table 5.5 framing type of each frame, 'Type 1' or
+            'Type 2' for portal frames; default is 'Type 1'.
+        K_a: area reduction factor, broadcast against the members; default
+            is 1.0.
+
+    Returns:
+        Uniformly distributed loads (kN/m, positive towards the surface) with
+        shape (frames, 4, 2, cases, 4): the directions are ordered as
+        ORTHOGONAL_ANGLES, the third axis holds the loads with the minimum
+        and maximum C_pe of each member, and the members are ordered as
+        FRAME_MEMBERS.
+    """
+    h, d, b, position, bay_spacing, roof_pitch, framing_type = np.broadcast_arrays(
+        np.atleast_1d(np.asarray(h, dtype=float)),
+        np.asarray(d, dtype=float),
+        np.asarray(b, dtype=float),
+        np.asarray(position, dtype=float),
+        np.asarray(bay_spacing, dtype=float),
+        np.asarray(roof_pitch, dtype=float),
+        np.asarray(framing_type)
+    )
+    n = h.size
+    q = np.broadcast_to(np.asarray(q, dtype=float), (n, 4))
+    C_pi = np.asarray(C_pi, dtype=float)
+    C_pi = np.broadcast_to(C_pi[None, :] if C_pi.ndim == 1 else C_pi, (n, C_pi.shape[-1]))
+    K_ce, K_ci = action_combination_factor_batch(C_pi, framing_type[:, None])
+
+    C_pe = _frame_cpe(h, d, b, roof_pitch, position)
+    p = q[:, :, None, None, None] * (
+        np.asarray(K_a, dtype=float) * K_ce[:, None, None, :, None] * C_pe[:, :, :, None, :]
+        - (K_ci * C_pi)[:, None, None, :, None]
+    )
+    return p * bay_spacing[:, None, None, None, None]
+
+
+def frame_load_table(w: np.ndarray, C_pi, index=None) -> pd.DataFrame:
+    """
+    Converts the loads of `portal_frame_loads` to a long table for export to
+    structural analysis software.
+
+    Args:
+        w: uniformly distributed loads, shape (frames, 4, 2, cases, 4).
+        C_pi: internal pressure coefficients of the cases, shape (cases,).
+        index: frame labels; defaults to the frame positions.
+
+    Returns:
+        Pandas DataFrame with the columns 'Frame', 'Direction', 'C_pe Case'
+        ('min' or 'max'), 'C_pi', 'Member' and 'w' (kN/m).
+    """
+    n_frames, _, _, n_cases, _ = w.shape
+    index = np.arange(n_frames) if index is None else np.asarray(index)
+    grid = np.meshgrid(
+        np.arange(n_frames), np.arange(4), np.arange(2), np.arange(n_cases), np.arange(len(FRAME_MEMBERS)),
+        indexing='ij'
+    )
+    frame, direction, case, cpi, member = [axis.ravel() for axis in grid]
+    return pd.DataFrame({
+        'Frame': index[frame],
+        'Direction': ORTHOGONAL_ANGLES[direction],
+        'C_pe Case': np.array(['min', 'max'])[case],
+        'C_pi': np.broadcast_to(np.asarray(C_pi, dtype=float), (n_cases,))[cpi],
+        'Member': np.array(FRAME_MEMBERS)[member],
+        'w': w.ravel(),
+    })
@@ -0,0 +1,198 @@
+"""
+Wind hazard curves (design pressure against Average Recurrence Interval) and
+expected annual loss integration for portfolios of assets.
+
+The (assets x ARIs) pressure matrix is evaluated in chunks of assets and
+integrated against the fragility curve in the same pass, so memory use is
+bounded by the chunk size rather than the portfolio size.
+"""
+
+import numpy as np
+
+from windactionsAU.batch import regional_wind_speed_batch
+from windactionsAU.memory import CALIBRATION_ROWS, chunk_size_for_budget, track_peak, tracing
+from windactionsAU.wind_pressure import basic_wind_pressure
+
+
+def ari_grid(R_min: float=1.0, R_max: float=10000.0, n: int=200) -> np.ndarray:
+    """
+    Returns a logarithmically spaced grid of Average Recurrence Intervals.
+    """
+    return np.geomspace(R_min, R_max, n)
+
+
+def _normal_cdf(x: np.ndarray) -> np.ndarray:
+    """
+    Standard normal cumulative distribution function using the Abramowitz and
+    Stegun 7.1.26 approximation of erf (absolute error below 1.5e-7).
+    """
+    z = np.abs(x) / np.sqrt(2)
+    t = 1 / (1 + 0.3275911 * z)
+    poly = t * (0.254829592 + t * (-0.284496736 + t * (1.421413741 + t * (-1.453152027 + t * 1.061405429))))
+    erf = 1 - poly * np.exp(-z ** 2)
+    return 0.5 * (1 + np.sign(x) * erf)
+
+
+def lognormal_fragility(p, median, beta) -> np.ndarray:
+    """
+    Returns the probability of failure from a lognormal fragility curve,
+    Phi(ln(p / median) / beta).
+
+    Args:
+        p: design pressure (kPa).
+        median: pressure at which the probability of failure is 0.5 (kPa).
+        beta: logarithmic standard deviation.
+
+    Returns:
+        Probability of failure.
+    """
+    p = np.asarray(p, dtype=float)
+    with np.errstate(divide='ignore'):
+        return _normal_cdf(np.log(p / median) / beta)
+
+
+def hazard_curve(wind_region, site_factor, R, C_shp=1.0, C_dyn=1.0) -> np.ndarray:
+    """
+    Calculates the design pressure for arrays of assets and Average
+    Recurrence Intervals,
+
+        p(R) = 0.6e-3 (V_R(R) site_factor)^2 C_shp C_dyn
+
+    where V_R(R) is the (unrounded) regional wind speed.
+
+    Args:
+        wind_region: wind region of each asset, shape (assets,).
+        site_factor: ratio of the design wind speed to the regional wind
+            speed of each asset (the product of M_c, M_d, M_z,cat, M_s and
+            M_t for the governing direction), shape (assets,).
+        R: Average Recurrence Intervals (years), shape (ARIs,).
+        C_shp: aerodynamic shape factor of each asset; default is 1.0.
+        C_dyn: dynamic response factor of each asset; default is 1.0.
+
+    Returns:
+        Design pressures (kPa), shape (assets, ARIs).
+    """
+    wind_region = np.atleast_1d(np.asarray(wind_region))
+    V_R = regional_wind_speed_batch(wind_region[:, None], np.asarray(R, dtype=float)[None, :], rounded=False)
+
+    def column(value):
+        value = np.asarray(value, dtype=float)
+        return value[:, None] if value.ndim == 1 else value
+
+    return basic_wind_pressure(V_R * column(site_factor)) * column(C_shp) * column(C_dyn)
+
+
+def expected_annual_loss(
+        wind_region,
+        site_factor,
+        C_shp=1.0,
+        C_dyn=1.0,
+        median=None,
+        beta=None,
+        loss=1.0,
+        fragility=None,
+        R=None,
+        chunk_size: int=10000,
+        memory_budget: int=None,
+        stats: dict=None
+) -> np.ndarray:
+    """
+    Calculates the expected annual loss of each asset by integrating the
+    loss at the design pressure of each ARI over the annual rate of
+    exceedance, lambda = 1 / R,
+
+        EAL = loss * integral of P_f(p(lambda)) d(lambda)
+
+    with the trapezoidal rule over the ARI grid. The failure probability at
+    the largest ARI is applied to all rarer events and events more frequent
+    than the smallest ARI are ignored.
+
+    Args:
+        wind_region: wind region of each asset, shape (assets,).
+        site_factor: ratio of the design wind speed to the regional wind
+            speed of each asset, shape (assets,).
+        C_shp: aerodynamic shape factor of each asset; default is 1.0.
+        C_dyn: dynamic response factor of each asset; default is 1.0.
+        median: lognormal fragility median pressure of each asset (kPa).
+        beta: lognormal fragility logarithmic standard deviation of each
+            asset.
+        loss: loss (e.g. replacement cost) of each asset given failure;
+            default is 1.0, giving the annual probability of failure.
+        fragility: optional callable, fragility(p, index), returning the
+            probability of failure for a chunk of pressures p of shape
+            (chunk, ARIs) for the assets at positions index; replaces the
+            lognormal fragility.
+        R: ARI grid (years); default is `ari_grid()`.
+        chunk_size: number of assets evaluated at a time; default 10,000.
+        memory_budget: if given, the chunk size is instead chosen to keep
+            the working memory within this number of bytes, estimated with
+            tracemalloc from a first chunk of CALIBRATION_ROWS assets (the
+            other chunks are not traced). Where the caller is already
+            tracing, its peak is not reset and the estimate is an upper
+            bound. The budget covers the integration of the chunks only,
+            not the input and result arrays of the whole portfolio.
+        stats: optional dictionary in which, where a memory budget is
+            given, 'memory' is set to a dictionary with the budget, the
+            chunk size, the number of chunks, the estimated bytes per asset
+            and the peak traced bytes of the calibration chunk.
+
+    Returns:
+        Expected annual loss of each asset.
+    """
+    wind_region = np.atleast_1d(np.asarray(wind_region))
+    n_assets = wind_region.size
+    R = ari_grid() if R is None else np.sort(np.asarray(R, dtype=float))
+    rate = 1 / R
+    d_rate = rate[:-1] - rate[1:]
+
+    def per_asset(value):
+        return np.broadcast_to(np.asarray(value, dtype=float), (n_assets,))
+
+    site_factor = per_asset(site_factor)
+    C_shp = per_asset(C_shp)
+    C_dyn = per_asset(C_dyn)
+    loss = per_asset(loss)
+    if fragility is None:
+        if median is None or beta is None:
+            raise ValueError("Either a fragility callable or the lognormal median and beta shall be provided.")
+        median = per_asset(median)
+        beta = per_asset(beta)
+
+        def fragility(p, index):
+            return lognormal_fragility(p, median[index, None], beta[index, None])
+
+    EAL = np.empty(n_assets)
+
+    def integrate(start, stop):
+        index = np.arange(start, stop)
+        p = hazard_curve(wind_region[index], site_factor[index], R, C_shp[index], C_dyn[index])
+        P_f = fragility(p, index)
+        integral = 0.5 * ((P_f[:, :-1] + P_f[:, 1:]) * d_rate).sum(axis=1)
+        integral += P_f[:, -1] * rate[-1]
+        EAL[index] = loss[index] * integral
+
+    if memory_budget is None:
+        for start in range(0, n_assets, chunk_size):
+            integrate(start, min(start + chunk_size, n_assets))
+        return EAL
+
+    calibration = min(n_assets, CALIBRATION_ROWS)
+    peaks = {}
+    with tracing() as started:
+        with track_peak(peaks, 'chunk', started):
+            integrate(0, calibration)
+    bytes_per_asset = peaks['chunk'] / calibration if calibration else 0.0
+    chunk_size = chunk_size_for_budget(memory_budget, bytes_per_asset)
+    chunks = 1 if calibration else 0
+    for start in range(calibration, n_assets, chunk_size):
+        integrate(start, min(start + chunk_size, n_assets))
+        chunks += 1
+    if stats is not None:
+        stats['memory'] = {
+            'budget': memory_budget,
+            'chunk_size': chunk_size,
+            'chunks': chunks,
+            'bytes_per_asset': bytes_per_asset,
+            'peak_bytes': peaks['chunk'],
+        }
+    return EAL
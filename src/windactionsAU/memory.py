@@ -0,0 +1,57 @@
+"""
+Measurement of the working memory of chunked calculations with tracemalloc,
+shared by the memory budgets of `pipeline.evaluate_sites` and
+`hazard.expected_annual_loss`. A first chunk of CALIBRATION_ROWS rows is
+traced to estimate the memory used per row, from which the size of the
+remaining (untraced) chunks is chosen.
+"""
+
+import tracemalloc
+from contextlib import contextmanager
+
+
+# Number of rows calculated first to estimate the memory used per row
+CALIBRATION_ROWS = 256
+
+
+@contextmanager
+def tracing():
+    """
+    Starts tracemalloc for the duration of the block where it is not
+    already tracing, and yields True where it was started (so the peak may
+    be reset) or False where the caller is tracing (whose peak is kept).
+    """
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        yield started
+    finally:
+        if started:
+            tracemalloc.stop()
+
+
+@contextmanager
+def track_peak(peaks: dict, name: str, reset_peak: bool=True):
+    """
+    Records the peak traced memory above the memory in use at the start of
+    the block under peaks[name], keeping the largest value, and the largest
+    total traced memory under peaks['traced']; does nothing where peaks is
+    None. Where reset_peak is False (tracing was started by the caller, whose
+    peak is kept) the recorded peaks are upper bounds.
+    """
+    if peaks is None:
+        yield
+        return
+    if reset_peak:
+        tracemalloc.reset_peak()
+    start = tracemalloc.get_traced_memory()[0]
+    yield
+    peak = tracemalloc.get_traced_memory()[1]
+    peaks[name] = max(peaks.get(name, 0), peak - start)
+    peaks['traced'] = max(peaks.get('traced', 0), peak)
+
+
+def chunk_size_for_budget(memory_budget: int, bytes_per_row: float) -> int:
+    """Returns the number of rows whose estimated memory fits the budget."""
+    return max(1, int(memory_budget // max(bytes_per_row, 1.0)))
@@ -0,0 +1,194 @@
+"""
+Awaitable wrappers of the batch calculations for asyncio services. Concurrent
+calls are collected over a short window (or until a maximum batch size is
+reached) and calculated together as one vectorised batch in an executor, so
+that many small requests share the cost of a single call.
+"""
+
+import asyncio
+
+import numpy as np
+import pandas as pd
+
+from windactionsAU.batch import (
+    design_wind_speed_batch,
+    ext_pressure_coeff_all_directions_batch,
+)
+from windactionsAU.pipeline import evaluate_sites
+from windactionsAU.validation import decode_errors
+
+
+class MicroBatcher:
+    """
+    Collects concurrent requests and calculates them in batches.
+
+    Args:
+        function: callable taking a list of requests and returning a list of
+            results in the same order; exception instances in the list are
+            raised in the corresponding request. Where the function raises,
+            the requests of the batch are calculated one at a time so that
+            the error is raised in the failing request only.
+        max_batch_size: maximum number of requests per batch; a batch is
+            started as soon as it is full. Default is 256.
+        max_latency: maximum time (s) the first request of a batch waits for
+            further requests; default is 0.002.
+        executor: `concurrent.futures` executor of the calculations; default
+            is the event loop's default executor.
+    """
+    def __init__(
+            self,
+            function,
+            max_batch_size: int=256,
+            max_latency: float=0.002,
+            executor=None
+    ):
+        self.function = function
+        self.max_batch_size = int(max_batch_size)
+        self.max_latency = float(max_latency)
+        self.executor = executor
+        self.batches = 0
+        self.requests = 0
+        self._pending = []
+        self._timer = None
+
+    async def submit(self, request):
+        """
+        Adds a request to the next batch and returns its result.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((request, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush(loop)
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_latency, self._flush, loop)
+        return await future
+
+    def _flush(self, loop):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        self.batches += 1
+        self.requests += len(pending)
+        requests = [request for request, _ in pending]
+        calculation = loop.run_in_executor(self.executor, self._run, requests)
+        calculation.add_done_callback(lambda done: self._resolve(done, pending))
+
+    def _run(self, requests: list) -> list:
+        """Returns (succeeded, result or exception) for each request."""
+        try:
+            return [(not isinstance(result, Exception), result) for result in self.function(requests)]
+        except Exception:
+            outcomes = []
+            for request in requests:
+                try:
+                    result = self.function([request])[0]
+                    outcomes.append((not isinstance(result, Exception), result))
+                except Exception as error:
+                    outcomes.append((False, error))
+            return outcomes
+
+    @staticmethod
+    def _resolve(done, pending: list):
+        if done.exception() is not None:
+            outcomes = [(False, done.exception())] * len(pending)
+        else:
+            outcomes = done.result()
+        for (succeeded, value), (_, future) in zip(outcomes, pending):
+            if future.done():
+                continue
+            if succeeded:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+
+
+def _site_batch(requests: list) -> list:
+    """
+    Calculates site requests (dictionaries of `evaluate_sites` columns),
+    grouping requests with the same columns.
+    """
+    results = [None] * len(requests)
+    groups = {}
+    for i, request in enumerate(requests):
+        groups.setdefault(tuple(sorted(request)), []).append(i)
+    for positions in groups.values():
+        batch = evaluate_sites(pd.DataFrame([requests[i] for i in positions]))
+        for row, i in enumerate(positions):
+            if batch.errors[row]:
+                results[i] = ValueError(' '.join(decode_errors(batch.errors[row])))
+            else:
+                results[i] = batch.results.iloc[row]
+    return results
+
+
+def _design_batch(requests: list) -> list:
+    """Calculates (orientation, V_sit_beta) requests."""
+    orientation = np.array([request[0] for request in requests], dtype=float)
+    V_sit_beta = np.stack([np.asarray(request[1], dtype=float) for request in requests])
+    return list(design_wind_speed_batch(orientation, V_sit_beta))
+
+
+def _cpe_batch(requests: list) -> list:
+    """Calculates (h, d, b, roof_pitch) requests."""
+    h, d, b, roof_pitch = np.array(requests, dtype=float).T
+    return list(ext_pressure_coeff_all_directions_batch(h, d, b, roof_pitch))
+
+
+class AsyncWindActions:
+    """
+    Awaitable site wind speed, design wind speed and external pressure
+    coefficient calculations, with concurrent calls of each calculation
+    batched by a `MicroBatcher`.
+
+    Args:
+        max_batch_size: maximum number of requests per batch; default 256.
+        max_latency: maximum time (s) a request waits for further requests;
+            default is 0.002.
+        executor: `concurrent.futures` executor of the calculations; default
+            is the event loop's default executor.
+    """
+    def __init__(self, max_batch_size: int=256, max_latency: float=0.002, executor=None):
+        self.sites = MicroBatcher(_site_batch, max_batch_size, max_latency, executor)
+        self.design = MicroBatcher(_design_batch, max_batch_size, max_latency, executor)
+        self.pressure_coefficients = MicroBatcher(_cpe_batch, max_batch_size, max_latency, executor)
+
+    async def site_wind_speeds(self, wind_region: str, terrain_category: str, height: float, **inputs) -> pd.Series:
+        """
+        Calculates the results of one site as per `pipeline.evaluate_sites`.
+
+        Args:
+            wind_region: the wind region.
+            terrain_category: the terrain category.
+            height: the reference height (m).
+            **inputs: the optional input columns of `evaluate_sites`.
+
+        Returns:
+            Pandas Series indexed by SITE_RESULT_COLUMNS. Raises a ValueError
+            with the validation messages where the inputs are invalid.
+        """
+        request = dict(wind_region=wind_region, terrain_category=terrain_category, height=height, **inputs)
+        return await self.sites.submit(request)
+
+    async def design_wind_speeds(self, orientation_angle: float, V_sit_beta) -> np.ndarray:
+        """
+        Calculates the orthogonal design wind speeds of one building as per
+        `batch.design_wind_speed_batch`.
+
+        Returns:
+            Array of design wind speeds (m/s) for 0, 90, 180 and 270 degrees.
+        """
+        return await self.design.submit((orientation_angle, V_sit_beta))
+
+    async def ext_pressure_coeffs(self, h: float, d: float, b: float, roof_pitch: float=0.0) -> np.ndarray:
+        """
+        Calculates the external pressure coefficients of one building as per
+        `batch.ext_pressure_coeff_all_directions_batch`.
+
+        Returns:
+            Array of C_pe with shape (4, len(SURFACES), 2).
+        """
+        return await self.pressure_coefficients.submit((h, d, b, roof_pitch))
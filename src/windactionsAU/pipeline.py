@@ -0,0 +1,594 @@
+"""
+Batch calculation of site and design wind speeds for tables of sites, from
+the Average Recurrence Interval through to the basic wind pressures in the 4
+orthogonal directions. Inputs are validated row by row; invalid rows are
+reported and returned as NaN while the valid rows are calculated together.
+"""
+
+import tracemalloc
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from windactionsAU.batch import (
+    DIRECTIONS,
+    ORTHOGONAL_ANGLES,
+    average_recurrence_interval_batch,
+    regional_wind_speed_batch,
+    climate_change_multiplier_batch,
+    wind_direction_multiplier_batch,
+    terrain_height_multiplier_batch,
+    shielding_multiplier_batch,
+    topographic_multiplier_batch,
+    site_wind_speed_batch,
+    design_wind_speed_batch,
+    table_fingerprints,
+)
+from windactionsAU.memory import CALIBRATION_ROWS, chunk_size_for_budget, track_peak, tracing
+from windactionsAU.validation import parse_boolean, validate_inputs, validation_report
+from windactionsAU.wind_pressure import basic_wind_pressure
+
+
+SITE_RESULT_COLUMNS = (
+    ['R', 'V_R', 'M_c', 'M_zcat', 'M_s', 'M_t']
+    + ['V_sit_' + direction for direction in DIRECTIONS]
+    + ['V_des_' + str(angle) for angle in ORTHOGONAL_ANGLES]
+    + ['q_' + str(angle) for angle in ORTHOGONAL_ANGLES]
+)
+
+# Stages of the site calculation, for the memory report of `evaluate_sites`
+SITE_STAGES = ['multipliers', 'wind_speeds', 'pressures']
+
+
+@dataclass
+class BatchResult:
+    """
+    Results of a batch calculation.
+
+    Args:
+        results: Pandas DataFrame of results with the index of the inputs;
+            invalid rows are NaN.
+        errors: array of validation error codes, one per row (0 is valid).
+        report: Pandas DataFrame summarising the validation errors.
+        stats: dictionary of run statistics.
+        trace: array of trace codes of the clause branches taken, one per
+            row (0 for invalid rows), where requested; refer to
+            `trace.decode_trace`.
+    """
+    results: pd.DataFrame
+    errors: np.ndarray
+    report: pd.DataFrame
+    stats: dict = field(default_factory=dict)
+    trace: np.ndarray = None
+
+
+def _column(inputs: pd.DataFrame, column: str, default) -> np.ndarray:
+    if column in inputs:
+        return inputs[column].to_numpy()
+    return np.full(len(inputs), default)
+
+
+def site_arrays(inputs: pd.DataFrame) -> dict:
+    """
+    Extracts the site inputs of `evaluate_sites` as arrays, filling the
+    optional columns with their defaults.
+
+    Args:
+        inputs: Pandas DataFrame of site inputs, as per `evaluate_sites`.
+
+    Returns:
+        Dictionary of arrays by input column, with 'shielded' True where the
+        shielding columns are given.
+    """
+    height = pd.to_numeric(inputs['height']).to_numpy(dtype=float)
+    arrays = {
+        'wind_region': inputs['wind_region'].to_numpy(dtype=str),
+        'terrain_category': inputs['terrain_category'].to_numpy(dtype=str),
+        'height': height,
+        'design_life': _column(inputs, 'design_life', '50 Years').astype(str),
+        'importance_level': _column(inputs, 'importance_level', 2).astype(int),
+        'cyclonic': parse_boolean(_column(inputs, 'cyclonic', False))[0],
+        'orientation': _column(inputs, 'orientation', 0.0).astype(float),
+        'hill_height': _column(inputs, 'hill_height', 0.0).astype(float),
+        'L_u': _column(inputs, 'L_u', 0.0).astype(float),
+        'x': pd.to_numeric(_column(inputs, 'x', 0.0)).astype(float),
+        'escarpment': parse_boolean(_column(inputs, 'escarpment', False))[0],
+        'E': pd.to_numeric(_column(inputs, 'E', 0.0)).astype(float),
+    }
+    shielded = all(column in inputs for column in ['h_s', 'b_s', 'n_s'])
+    arrays['shielded'] = np.full(len(inputs), shielded)
+    for column in ['h_s', 'b_s', 'n_s']:
+        arrays[column] = _column(inputs, column, 1.0).astype(float)
+    return arrays
+
+
+def _compute_sites(
+        arrays: dict,
+        dtype=np.float64,
+        trace: bool=False,
+        peaks: dict=None,
+        reset_peak: bool=True
+) -> dict:
+    """
+    Calculates the site results for validated input arrays, with the wind
+    speed arrays in the given floating point type. Where trace is True the
+    results include the combined trace codes under 'trace'. Where a peaks
+    dictionary is given (with tracemalloc tracing) the peak memory of each
+    of SITE_STAGES is recorded in it (refer to `memory.track_peak`).
+    """
+    with track_peak(peaks, 'multipliers', reset_peak):
+        values = _site_multipliers(arrays, dtype, trace)
+    with track_peak(peaks, 'wind_speeds', reset_peak):
+        values['V_sit_beta'] = site_wind_speed_batch(
+            values['V_R'], values['M_c'], values.pop('M_d'), values['M_zcat'],
+            values['M_s'], values['M_t'], dtype=dtype
+        )
+        values['V_des_theta'] = design_wind_speed_batch(arrays['orientation'], values['V_sit_beta'])
+    with track_peak(peaks, 'pressures', reset_peak):
+        values['q'] = basic_wind_pressure(values['V_des_theta'])
+    return values
+
+
+def _site_multipliers(arrays: dict, dtype=np.float64, trace: bool=False) -> dict:
+    """Calculates the ARI, regional wind speed and multipliers of each site."""
+    wind_region = arrays['wind_region']
+    height = arrays['height']
+
+    R = average_recurrence_interval_batch(
+        arrays['design_life'], arrays['importance_level'], arrays['cyclonic'], trace=trace
+    )
+    M_s = shielding_multiplier_batch(
+        height, arrays['h_s'], arrays['b_s'], arrays['n_s'], trace=trace
+    )
+    M_t = topographic_multiplier_batch(
+        wind_region, height, arrays['hill_height'], arrays['L_u'],
+        arrays['x'], arrays['escarpment'], arrays['E'], trace=trace
+    )
+    if trace:
+        (R, R_trace), (M_s, M_s_trace), (M_t, M_t_trace) = R, M_s, M_t
+    V_R = regional_wind_speed_batch(wind_region, R, dtype=dtype)
+    M_c = climate_change_multiplier_batch(wind_region).astype(dtype)
+    M_d, _ = wind_direction_multiplier_batch(wind_region)
+    M_zcat = terrain_height_multiplier_batch(arrays['terrain_category'], wind_region, height, dtype=dtype)
+    M_s = np.where(arrays['shielded'], M_s, 1.0).astype(dtype)
+    M_t = M_t.astype(dtype)
+
+    values = {
+        'R': R,
+        'V_R': V_R,
+        'M_c': M_c,
+        'M_d': M_d,
+        'M_zcat': M_zcat,
+        'M_s': M_s,
+        'M_t': M_t,
+    }
+    if trace:
+        values['trace'] = R_trace | np.where(arrays['shielded'], M_s_trace, 0) | M_t_trace
+    return values
+
+
+def _compute_sites_budgeted(arrays: dict, memory_budget: int, dtype=np.float64, trace: bool=False) -> tuple:
+    """
+    Calculates the site results in chunks sized to keep the traced memory of
+    each chunk within the budget. The memory per row is estimated with
+    tracemalloc from a first chunk of CALIBRATION_ROWS rows; the remaining
+    chunks are calculated without tracing. Where the caller is already
+    tracing, its peak is not reset and the estimate is an upper bound.
+
+    Returns:
+        Tuple of the results and a dictionary of memory statistics.
+    """
+    n_rows = len(arrays['height'])
+    calibration = min(n_rows, CALIBRATION_ROWS)
+    peaks = {}
+    with tracing() as started:
+        # Peak of the whole chunk, including the results held between stages
+        start = tracemalloc.get_traced_memory()[0]
+        chunk = {name: array[:calibration] for name, array in arrays.items()}
+        parts = [_compute_sites(chunk, dtype, trace, peaks, started)]
+        peaks['chunk'] = peaks.pop('traced') - start
+
+    bytes_per_row = {name: peak / calibration for name, peak in peaks.items()}
+    chunk_size = chunk_size_for_budget(memory_budget, bytes_per_row['chunk'])
+    for chunk_start in range(calibration, n_rows, chunk_size):
+        chunk = {name: array[chunk_start:chunk_start + chunk_size] for name, array in arrays.items()}
+        parts.append(_compute_sites(chunk, dtype, trace))
+
+    values = {name: np.concatenate([part[name] for part in parts]) for name in parts[0]}
+    memory = {
+        'budget': memory_budget,
+        'chunk_size': chunk_size,
+        'chunks': len(parts),
+        'bytes_per_row': bytes_per_row,
+        'peak_bytes': peaks,
+    }
+    return values, memory
+
+
+def _unique_rows(arrays: dict) -> tuple:
+    """
+    Encodes each row of the site input arrays as a record and finds the
+    distinct rows.
+
+    Returns:
+        Tuple of (first, inverse), the position of the first occurrence of
+        each distinct row and, for every row, the index of its distinct row.
+    """
+    names = sorted(arrays)
+    keys = np.empty(
+        len(arrays[names[0]]),
+        dtype=[(name, arrays[name].dtype) for name in names]
+    )
+    for name in names:
+        keys[name] = arrays[name]
+    _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    return first, inverse.ravel()
+
+
+def _results_matrix(values: dict) -> np.ndarray:
+    """Stacks the site results into columns ordered as SITE_RESULT_COLUMNS."""
+    return np.column_stack([
+        values['R'], values['V_R'], values['M_c'], values['M_zcat'],
+        values['M_s'], values['M_t'],
+        values['V_sit_beta'], values['V_des_theta'], values['q'],
+    ])
+
+
+def _results_frame(data: np.ndarray, n_rows: int, rows: np.ndarray, index, dtype=np.float64) -> pd.DataFrame:
+    """Scatters the results matrix of the calculated rows into a DataFrame."""
+    frame = np.full((n_rows, len(SITE_RESULT_COLUMNS)), np.nan, dtype=dtype)
+    frame[rows] = data
+    return pd.DataFrame(data=frame, index=index, columns=SITE_RESULT_COLUMNS)
+
+
+def _compute_results(arrays: dict, dtype=np.float64, trace: bool=False, memory_budget: int=None) -> tuple:
+    """
+    Calculates the site results matrix (refer to `_results_matrix`).
+
+    Returns:
+        Tuple of the results matrix, the trace codes (None where trace is
+        False) and the memory statistics (None without a memory budget).
+    """
+    memory = None
+    if memory_budget is not None and len(arrays['height']):
+        values, memory = _compute_sites_budgeted(arrays, memory_budget, dtype, trace)
+    else:
+        values = _compute_sites(arrays, dtype, trace)
+    return _results_matrix(values), values.get('trace'), memory
+
+
+def _compute_results_cached(
+        arrays: dict,
+        cache,
+        dtype=np.float64,
+        trace: bool=False,
+        memory_budget: int=None
+) -> tuple:
+    """
+    Calculates the site results matrix as per `_compute_results`, looking
+    each row up in the cache in one bulk query and calculating only the rows
+    not found, which are then stored in one bulk write. Each row is keyed by
+    its inputs, the floating point type and whether it is traced, and stored
+    as its results (as float64) followed by its trace code where traced.
+
+    Returns:
+        Tuple of the results matrix, the trace codes, the memory statistics
+        and a dictionary of the number of cache 'hits' and 'misses'.
+    """
+    n_columns = len(SITE_RESULT_COLUMNS)
+    tag = {'dtype': np.dtype(dtype).name, 'trace': bool(trace)}
+    keys = [
+        cache.key({**{name: array[i] for name, array in arrays.items()}, **tag})
+        for i in range(len(arrays['height']))
+    ]
+    cached = cache.get_many(keys)
+    misses = np.array([value is None for value in cached], dtype=bool)
+
+    data, codes, memory = _compute_results(
+        {name: array[misses] for name, array in arrays.items()}, dtype, trace, memory_budget
+    )
+    stored = data.astype(np.float64)
+    if trace:
+        stored = np.column_stack([stored, codes])
+    cache.put_many([key for key, miss in zip(keys, misses) if miss], list(stored))
+
+    combined = np.empty((len(keys), stored.shape[1]))
+    combined[misses] = stored
+    if not misses.all():
+        combined[~misses] = np.vstack([value for value in cached if value is not None])
+    codes = combined[:, n_columns].astype(np.uint32) if trace else None
+    counts = {'hits': int((~misses).sum()), 'misses': int(misses.sum())}
+    return combined[:, :n_columns].astype(dtype), codes, memory, counts
+
+
+def evaluate_sites(
+        inputs: pd.DataFrame,
+        deduplicate: bool=True,
+        dtype=np.float64,
+        trace: bool=False,
+        memory_budget: int=None,
+        shadow=None,
+        cache=None
+) -> BatchResult:
+    """
+    Calculates the site wind speeds in the 8 cardinal directions, and the
+    design wind speeds and basic wind pressures in the 4 orthogonal
+    directions, for a table of sites.
+
+    Args:
+        inputs: Pandas DataFrame with one row per site and the columns:
+            'wind_region', 'terrain_category', 'height' (required);
+            'design_life' (default '50 Years'), 'importance_level' (default
+            2), 'cyclonic' (default False), 'orientation' (default 0);
+            'h_s', 'b_s', 'n_s' (shielding, M_s = 1.0 where not given);
+            'hill_height', 'L_u', 'x', 'escarpment', 'E' (topography,
+            M_t = 1.0 where not given).
+        deduplicate: if True (default), rows with identical inputs are
+            calculated once and the results copied to each row.
+        dtype: floating point type of the wind speed calculations and
+            results; np.float32 halves the memory of the intermediate arrays
+            (refer to `precision_report` for the resulting error).
+        trace: if True, records the clause branches taken for the ARI,
+            shielding and topographic multipliers of each row as trace codes;
+            default is False.
+        memory_budget: if given, the rows are calculated in chunks sized so
+            that the working memory of each chunk stays within this number
+            of bytes, estimated with tracemalloc from a first chunk of
+            CALIBRATION_ROWS rows (the other chunks are not traced); default
+            is None (a single chunk). The budget covers the site calculation
+            only: the validation, the deduplication, the copy of the results
+            to duplicate rows and the results DataFrame hold arrays for all
+            rows and are outside it.
+        shadow: optional `shadow.ShadowChecker`, which recalculates a sample
+            of the valid rows with the scalar functions and records the
+            mismatches; default is None.
+        cache: optional `cache.ResultCache` in which the results of each
+            distinct valid row are looked up before, and stored after, the
+            calculation, keyed by the row inputs, dtype and trace; rows
+            found are not recalculated. Default is None.
+
+    Returns:
+        BatchResult, with results in the columns of SITE_RESULT_COLUMNS. The
+        stats include 'unique_rows', the number of distinct valid rows
+        calculated, 'dedup_ratio', the number of valid rows per distinct
+        row, and 'tables', the fingerprints of the lookup tables used (refer
+        to `update_sites`). Where a memory budget is given the stats include
+        'memory', with the chunk size, the number of chunks, the estimated
+        bytes per row and the peak traced bytes of each of SITE_STAGES and of
+        a whole chunk, measured on the calibration chunk. Where a shadow
+        checker is given the stats include 'shadow', the number of rows it
+        checked and the number that failed, and where a cache is given
+        'cache', the number of distinct rows found ('hits') and calculated
+        ('misses').
+    """
+    errors = validate_inputs(inputs)
+    rows = np.flatnonzero(errors == 0)
+
+    arrays = site_arrays(inputs.iloc[rows])
+    inverse = None
+    if deduplicate and rows.size:
+        first, inverse = _unique_rows(arrays)
+        arrays = {name: array[first] for name, array in arrays.items()}
+    unique_rows = len(arrays['height'])
+
+    cache_counts = None
+    if cache is not None and unique_rows:
+        data, codes, memory, cache_counts = _compute_results_cached(arrays, cache, dtype, trace, memory_budget)
+    else:
+        data, codes, memory = _compute_results(arrays, dtype, trace, memory_budget)
+    if inverse is not None:
+        data = data[inverse]
+        codes = codes[inverse] if trace else None
+
+    trace_codes = None
+    if trace:
+        trace_codes = np.zeros(len(inputs), dtype=np.uint32)
+        trace_codes[rows] = codes
+
+    stats = {
+        'rows': len(inputs),
+        'valid_rows': rows.size,
+        'unique_rows': unique_rows,
+        'dedup_ratio': rows.size / unique_rows if unique_rows else 1.0,
+        'tables': table_fingerprints(),
+    }
+    if memory is not None:
+        stats['memory'] = memory
+    if cache_counts is not None:
+        stats['cache'] = cache_counts
+
+    result = BatchResult(
+        results=_results_frame(data, len(inputs), rows, inputs.index, dtype),
+        errors=errors,
+        report=validation_report(errors, inputs.index),
+        stats=stats,
+        trace=trace_codes,
+    )
+    if shadow is not None:
+        rows_checked = shadow.rows_checked
+        failed = shadow.check_sites(inputs, result)
+        stats['shadow'] = {'rows_checked': shadow.rows_checked - rows_checked, 'failed_rows': failed}
+    return result
+
+
+def _rows_affected_by_tables(tables: list, inputs: pd.DataFrame) -> np.ndarray:
+    """
+    Returns a boolean array of the rows of the inputs whose site results
+    depend on any of the named lookup tables (refer to `batch._tables`).
+    """
+    region = inputs['wind_region'].to_numpy(dtype=str)
+    category = inputs['terrain_category'].to_numpy(dtype=str)
+    shielded = all(column in inputs for column in ['h_s', 'b_s', 'n_s'])
+    affected = np.zeros(len(inputs), dtype=bool)
+    for name in tables:
+        if name in ['ARI', 'M_zcat_heights']:
+            affected[:] = True
+        elif name.startswith('V_R_') or name.startswith('M_d_'):
+            affected |= region == name[4:]
+        elif name == 'M_zcat_A0':
+            affected |= region == 'A0'
+        elif name.startswith('M_zcat_'):
+            affected |= (category == name[7:]) & (region != 'A0')
+        elif name in ['M_s_parameters', 'M_s'] and shielded:
+            affected[:] = True
+    return affected
+
+
+def update_sites(
+        previous_inputs: pd.DataFrame,
+        previous: BatchResult,
+        inputs: pd.DataFrame,
+        deduplicate: bool=True,
+        dtype=np.float64
+) -> tuple:
+    """
+    Updates the results of a previous `evaluate_sites` run for a revised
+    table of sites, recalculating only the rows that were added, whose
+    inputs changed, or that depend on a lookup table that changed since the
+    previous run. Rows are matched by the index of the inputs, which shall
+    be unique.
+
+    Args:
+        previous_inputs: Pandas DataFrame of the inputs of the previous run.
+        previous: BatchResult of the previous run.
+        inputs: Pandas DataFrame of the revised inputs.
+        deduplicate: passed to `evaluate_sites`; default is True.
+        dtype: passed to `evaluate_sites`; default is float64.
+
+    Returns:
+        Tuple of (BatchResult, changes), where the BatchResult has the index
+        of the revised inputs and changes is a Pandas DataFrame with one row
+        per change and the columns 'Key', 'Change' ('added', 'removed',
+        'inputs' or 'tables') and 'Detail' (the changed columns or tables).
+        Where the previous run has no table fingerprints all rows are
+        recalculated.
+    """
+    if not (previous_inputs.index.is_unique and inputs.index.is_unique):
+        raise ValueError("The index of the inputs shall be unique to match rows between runs.")
+
+    keys = inputs.index
+    added = ~keys.isin(previous_inputs.index)
+    removed = previous_inputs.index[~previous_inputs.index.isin(keys)]
+    common = keys[~added]
+    changes = [[key, 'added', ''] for key in keys[added]]
+    changes += [[key, 'removed', ''] for key in removed]
+
+    # Input changes of the rows in both runs
+    changed = np.zeros(len(inputs), dtype=bool)
+    columns = list(inputs.columns) + [c for c in previous_inputs.columns if c not in inputs.columns]
+    differs = np.zeros((common.size, len(columns)), dtype=bool)
+    for j, column in enumerate(columns):
+        new = inputs[column].loc[common] if column in inputs else pd.Series(np.nan, index=common)
+        old = previous_inputs[column].loc[common] if column in previous_inputs else pd.Series(np.nan, index=common)
+        differs[:, j] = ~((new.to_numpy() == old.to_numpy()) | (new.isna().to_numpy() & old.isna().to_numpy()))
+    changed[~added] = differs.any(axis=1)
+    for key, row in zip(common, differs):
+        if row.any():
+            changes.append([key, 'inputs', ', '.join(np.array(columns)[row])])
+
+    # Rows depending on lookup tables that changed
+    tables = table_fingerprints()
+    previous_tables = previous.stats.get('tables')
+    if previous_tables is None:
+        changed_tables = sorted(tables)
+        table_affected = np.ones(len(inputs), dtype=bool)
+    else:
+        changed_tables = sorted(
+            name for name in set(tables) | set(previous_tables)
+            if tables.get(name) != previous_tables.get(name)
+        )
+        table_affected = _rows_affected_by_tables(changed_tables, inputs)
+    table_affected &= ~added
+    for key in keys[table_affected]:
+        changes.append([key, 'tables', ', '.join(changed_tables) if previous_tables is not None else 'unknown'])
+
+    recompute = added | changed | table_affected
+    trace = previous.trace is not None
+    update = evaluate_sites(inputs.loc[recompute], deduplicate=deduplicate, dtype=dtype, trace=trace)
+
+    results = previous.results.reindex(keys)
+    results.loc[recompute] = update.results.to_numpy()
+    errors = pd.Series(previous.errors, index=previous_inputs.index).reindex(keys, fill_value=0)
+    errors = np.array(errors, dtype=np.uint32)
+    errors[recompute] = update.errors
+    trace_codes = None
+    if trace:
+        trace_codes = pd.Series(previous.trace, index=previous_inputs.index).reindex(keys, fill_value=0)
+        trace_codes = np.array(trace_codes, dtype=np.uint32)
+        trace_codes[recompute] = update.trace
+
+    result = BatchResult(
+        results=results,
+        errors=errors,
+        report=validation_report(errors, keys),
+        stats={
+            'rows': len(inputs),
+            'valid_rows': int((errors == 0).sum()),
+            'recomputed_rows': int(recompute.sum()),
+            'added_rows': int(added.sum()),
+            'removed_rows': removed.size,
+            'changed_rows': int(changed.sum()),
+            'table_affected_rows': int(table_affected.sum()),
+            'changed_tables': changed_tables,
+            'unique_rows': update.stats['unique_rows'],
+            'dedup_ratio': update.stats['dedup_ratio'],
+            'tables': tables,
+        },
+        trace=trace_codes,
+    )
+    return result, pd.DataFrame(data=changes, columns=['Key', 'Change', 'Detail'])
+
+
+# Decimal places of the rounded design values in the scalar calculations
+ROUNDED_COLUMNS = dict(
+    [('V_R', 0)] + [('V_des_' + str(angle), 2) for angle in ORTHOGONAL_ANGLES]
+)
+
+
+def precision_report(
+        inputs: pd.DataFrame,
+        dtype=np.float32,
+        sample_size: int=10000,
+        seed: int=0
+) -> pd.DataFrame:
+    """
+    Compares the site results calculated in a reduced precision floating
+    point type with the float64 reference on a random sample of the valid
+    rows.
+
+    Args:
+        inputs: Pandas DataFrame of site inputs (refer to `evaluate_sites`).
+        dtype: floating point type to check; default is float32.
+        sample_size: maximum number of valid rows compared; default 10,000.
+        seed: seed of the random sample; default is 0.
+
+    Returns:
+        Pandas DataFrame indexed by SITE_RESULT_COLUMNS with the columns
+        'Max Abs Deviation', 'Max Rel Deviation' and, for the rounded design
+        values (refer to ROUNDED_COLUMNS), 'Decimals' and 'Rounding
+        Mismatches', the number of sampled rows that round to a different
+        design value.
+    """
+    rows = np.flatnonzero(validate_inputs(inputs) == 0)
+    if rows.size > sample_size:
+        rows = np.sort(np.random.default_rng(seed).choice(rows, sample_size, replace=False))
+    arrays = site_arrays(inputs.iloc[rows])
+    index = inputs.index[rows]
+    reference = _results_frame(_compute_results(arrays)[0], rows.size, np.arange(rows.size), index)
+    reduced = _results_frame(_compute_results(arrays, dtype)[0], rows.size, np.arange(rows.size), index, dtype)
+    reduced = reduced.astype(np.float64)
+
+    deviation = (reduced - reference).abs()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        relative = deviation / reference.abs()
+    report = pd.DataFrame({
+        'Max Abs Deviation': deviation.max(),
+        'Max Rel Deviation': relative.max(),
+        'Decimals': pd.Series(ROUNDED_COLUMNS, dtype=float),
+        'Rounding Mismatches': np.nan,
+    }, index=SITE_RESULT_COLUMNS)
+    for column, decimals in ROUNDED_COLUMNS.items():
+        mismatch = np.round(reduced[column], decimals) != np.round(reference[column], decimals)
+        report.loc[column, 'Rounding Mismatches'] = int(mismatch.sum())
+    return report
@@ -0,0 +1,244 @@
+"""
+Tiled generation of site wind speed and basic wind pressure maps. The input
+grids are read and the output grids written as memory-mapped `.npy` files
+one tile at a time, so that grids much larger than the available memory can
+be processed, and completed tiles are appended to a manifest so that an
+interrupted run can be resumed.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from windactionsAU.batch import (
+    M_D_TABLE,
+    M_ZCAT_TABLE,
+    regional_wind_speed_batch,
+    climate_change_multiplier_batch,
+    wind_direction_multiplier_batch,
+    terrain_height_multiplier_batch,
+    site_wind_speed_batch,
+)
+from windactionsAU.wind_pressure import basic_wind_pressure
+
+
+# Integer codes of the region and terrain category grids (negative values
+# and codes outside these lists are treated as no data)
+REGION_CODES = list(M_D_TABLE)
+TERRAIN_CATEGORY_CODES = list(M_ZCAT_TABLE)
+
+# JSON lines file of the run settings followed by one line per completed tile
+MANIFEST = 'manifest.jsonl'
+
+
+def _open_grid(grid):
+    """Opens a path to a `.npy` file as a read-only memmap."""
+    if isinstance(grid, (str, os.PathLike)):
+        return np.load(grid, mmap_mode='r')
+    return np.asarray(grid)
+
+
+def _fingerprint(grid):
+    """
+    Identifies an input of `site_wind_speed_map` for the resume check: a
+    scalar by its value, a `.npy` file by its path, size and modification
+    time, and an array by a hash of its contents.
+    """
+    if isinstance(grid, (str, os.PathLike)):
+        status = os.stat(grid)
+        return {'path': os.path.abspath(grid), 'size': status.st_size, 'mtime_ns': status.st_mtime_ns}
+    array = np.asarray(grid)
+    if array.ndim == 0:
+        return array.item()
+    digest = hashlib.sha256(np.ascontiguousarray(array).tobytes())
+    return {'shape': list(array.shape), 'dtype': array.dtype.str, 'sha256': digest.hexdigest()}
+
+
+def _read_manifest(path: str) -> tuple:
+    """
+    Returns the settings and the set of completed tiles of a manifest; a
+    partly written last line (from an interrupted run) is ignored.
+    """
+    with open(path) as f:
+        lines = f.read().splitlines()
+    settings = json.loads(lines[0]) if lines else None
+    completed = set()
+    for line in lines[1:]:
+        try:
+            completed.add(tuple(json.loads(line)))
+        except ValueError:
+            continue
+    return settings, completed
+
+
+def _tile_values(grid, rows: slice, cols: slice) -> np.ndarray:
+    """Returns a tile of a grid, or a scalar where the grid is a scalar."""
+    if np.ndim(grid) == 0:
+        return grid
+    return np.asarray(grid[rows, cols])
+
+
+def site_wind_speed_map(
+        wind_region,
+        terrain_category,
+        output_dir,
+        R: float=500.0,
+        height=10.0,
+        M_s=1.0,
+        M_t=1.0,
+        tile_size: int=512,
+        max_workers: int=None,
+        resume: bool=True,
+        dtype=np.float32
+) -> dict:
+    """
+    Calculates the site wind speeds in the 8 cardinal directions and the
+    corresponding basic wind pressures for each cell of a grid, tile by
+    tile, writing the results to `V_sit.npy` and `q.npy` in the output
+    directory, each with shape (rows, columns, 8) ordered as DIRECTIONS.
+    Cells with no data are NaN.
+
+    Args:
+        wind_region: grid of wind region codes (indices into REGION_CODES),
+            as a 2D array or a path to a `.npy` file.
+        terrain_category: grid of terrain category codes (indices into
+            TERRAIN_CATEGORY_CODES), as a 2D array or a path to a `.npy`
+            file.
+        output_dir: directory of the output grids and the manifest of
+            completed tiles.
+        R: Average Recurrence Interval (years); default is 500.
+        height: reference height (m), a scalar or a grid; default is 10.
+        M_s: shielding multiplier, a scalar or a grid; default is 1.0.
+        M_t: topographic multiplier, a scalar or a grid of shape (rows,
+            columns) or (rows, columns, 8); default is 1.0.
+        tile_size: number of cells along each side of a tile; default 512.
+        max_workers: maximum number of worker threads; default is the
+            `ThreadPoolExecutor` default.
+        resume: if True (default) and the output directory holds the grids
+            and manifest of an earlier run with the same inputs, R, dtype and
+            tile size, only the tiles not yet completed are calculated. Input
+            files are identified by their path, size and modification time
+            and arrays by a hash of their contents.
+        dtype: floating point type of the output grids; default is float32.
+
+    Returns:
+        Dictionary with the paths of the output grids ('V_sit' and 'q') and
+        the number of tiles calculated and skipped.
+    """
+    inputs = {'wind_region': wind_region, 'terrain_category': terrain_category, 'height': height, 'M_s': M_s, 'M_t': M_t}
+    region_grid = _open_grid(wind_region)
+    category_grid = _open_grid(terrain_category)
+    if region_grid.ndim != 2 or region_grid.shape != category_grid.shape:
+        raise ValueError("The wind region and terrain category grids shall be 2D with the same shape.")
+    height, M_s, M_t = (_open_grid(grid) for grid in (height, M_s, M_t))
+    n_rows, n_cols = region_grid.shape
+
+    os.makedirs(output_dir, exist_ok=True)
+    paths = {name: os.path.join(output_dir, name + '.npy') for name in ['V_sit', 'q']}
+    manifest_path = os.path.join(output_dir, MANIFEST)
+    settings = {
+        'shape': [n_rows, n_cols],
+        'tile_size': tile_size,
+        'R': R,
+        'dtype': np.dtype(dtype).name,
+        'inputs': {name: _fingerprint(grid) for name, grid in inputs.items()},
+    }
+    # Round trip through JSON so that the settings compare equal to a manifest
+    settings = json.loads(json.dumps(settings))
+
+    completed = set()
+    if resume and os.path.exists(manifest_path) and all(os.path.exists(path) for path in paths.values()):
+        previous, tiles_done = _read_manifest(manifest_path)
+        if previous == settings:
+            completed = tiles_done
+    skipped = len(completed)
+    if completed:
+        outputs = {name: np.load(path, mmap_mode='r+') for name, path in paths.items()}
+        manifest = open(manifest_path, 'a')
+    else:
+        outputs = {
+            name: np.lib.format.open_memmap(path, mode='w+', dtype=dtype, shape=(n_rows, n_cols, 8))
+            for name, path in paths.items()
+        }
+        manifest = open(manifest_path, 'w')
+        manifest.write(json.dumps(settings) + '\n')
+        manifest.flush()
+
+    tiles = [
+        (ti, tj)
+        for ti in range(-(-n_rows // tile_size))
+        for tj in range(-(-n_cols // tile_size))
+        if (ti, tj) not in completed
+    ]
+    lock = threading.Lock()
+
+    def run(tile):
+        ti, tj = tile
+        rows = slice(ti * tile_size, (ti + 1) * tile_size)
+        cols = slice(tj * tile_size, (tj + 1) * tile_size)
+        V_sit = _site_wind_speed_tile(
+            _tile_values(region_grid, rows, cols),
+            _tile_values(category_grid, rows, cols),
+            R,
+            _tile_values(height, rows, cols),
+            _tile_values(M_s, rows, cols),
+            _tile_values(M_t, rows, cols),
+        )
+        outputs['V_sit'][rows, cols] = V_sit
+        outputs['q'][rows, cols] = basic_wind_pressure(V_sit)
+        with lock:
+            for output in outputs.values():
+                output.flush()
+            manifest.write(json.dumps([ti, tj]) + '\n')
+            manifest.flush()
+
+    with manifest, ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(run, tiles))
+
+    return {
+        'V_sit': paths['V_sit'],
+        'q': paths['q'],
+        'tiles_calculated': len(tiles),
+        'tiles_skipped': skipped,
+    }
+
+
+def _site_wind_speed_tile(region_codes, category_codes, R, height, M_s, M_t) -> np.ndarray:
+    """
+    Calculates the site wind speeds of one tile, with shape (rows, columns,
+    8); cells with no data are NaN.
+    """
+    region_codes = np.asarray(region_codes)
+    category_codes = np.asarray(category_codes)
+    shape = region_codes.shape
+    valid = (
+        (region_codes >= 0) & (region_codes < len(REGION_CODES))
+        & (category_codes >= 0) & (category_codes < len(TERRAIN_CATEGORY_CODES))
+    )
+    V_sit = np.full(shape + (8,), np.nan)
+    if not valid.any():
+        return V_sit
+
+    region = np.array(REGION_CODES)[region_codes[valid]]
+    category = np.array(TERRAIN_CATEGORY_CODES)[category_codes[valid]]
+
+    def cells(grid):
+        grid = np.asarray(grid, dtype=float)
+        return np.broadcast_to(grid, shape + grid.shape[2:])[valid] if grid.ndim else grid
+
+    V_R = regional_wind_speed_batch(region, R)
+    M_d, _ = wind_direction_multiplier_batch(region)
+    M_zcat = terrain_height_multiplier_batch(category, region, cells(height))
+    V_sit[valid] = site_wind_speed_batch(
+        V_R,
+        climate_change_multiplier_batch(region),
+        M_d,
+        M_zcat,
+        np.broadcast_to(cells(M_s), V_R.shape),
+        np.broadcast_to(cells(M_t), V_R.shape + np.shape(cells(M_t))[1:]),
+    )
+    return V_sit
@@ -0,0 +1,265 @@
+"""
+Design pressures together with their partial derivatives with respect to the
+building height, orientation and distance from a hill crest, for gradient
+based optimisation of building layouts.
+
+The lookup tables are piecewise linear, so the derivatives are evaluated
+exactly on the segment (or branch) containing each input; at a segment
+boundary the derivative of the segment above is returned. The 2 decimal
+place rounding and the 5 degree grid of `design_wind_speed` make its design
+wind speed piecewise constant in the inputs, so the design wind speed here
+is the exact maximum of the interpolated site wind speeds within each +/- 45
+degree sector. It is not less than the gridded value (by at most the change
+in the site wind speed over 5 degrees), and its derivatives are consistent
+with it. The gridded and rounded value of `design_wind_speed` is returned
+alongside it for checking against the design.
+"""
+
+import numpy as np
+
+from windactionsAU.batch import (
+    ORTHOGONAL_ANGLES,
+    M_ZCAT_HEIGHTS,
+    M_ZCAT_TABLE,
+    M_ZCAT_A0,
+    regional_wind_speed_batch,
+    climate_change_multiplier_batch,
+    wind_direction_multiplier_batch,
+    terrain_height_multiplier_batch,
+    topographic_multiplier_batch,
+    site_wind_speed_batch,
+    design_wind_speed_batch,
+)
+from windactionsAU.wind_pressure import basic_wind_pressure
+
+
+def _interp_slope(x: np.ndarray, xp: np.ndarray, fp: np.ndarray) -> np.ndarray:
+    """
+    Returns the slope of the linear interpolation of (xp, fp) at x, taking
+    the segment above at the knots and zero outside the table.
+    """
+    segment = np.searchsorted(xp, x, side='right') - 1
+    inside = (segment >= 0) & (segment < xp.size - 1)
+    segment = np.clip(segment, 0, xp.size - 2)
+    slope = np.diff(fp) / np.diff(xp)
+    return np.where(inside, slope[segment], 0.0)
+
+
+def terrain_height_multiplier_slope(terrain_category, wind_region, height) -> np.ndarray:
+    """
+    Returns the derivative of the terrain/height multiplier (Table 4.1) with
+    respect to height, dM_z,cat/dz (1/m), for arrays of sites.
+    """
+    terrain_category, wind_region, height = np.broadcast_arrays(
+        np.asarray(terrain_category),
+        np.asarray(wind_region),
+        np.asarray(height, dtype=float)
+    )
+    slope = np.empty(height.shape)
+    region_A0 = wind_region == 'A0'
+    slope[region_A0] = _interp_slope(height[region_A0], M_ZCAT_HEIGHTS, M_ZCAT_A0)
+    for category in np.unique(terrain_category[~region_A0]):
+        mask = (terrain_category == category) & ~region_A0
+        slope[mask] = _interp_slope(height[mask], M_ZCAT_HEIGHTS, M_ZCAT_TABLE[category])
+    return slope
+
+
+def topographic_multiplier_slopes(
+        wind_region,
+        z,
+        hill_height,
+        L_u,
+        x,
+        escarpment=False,
+        E=0.0
+) -> tuple:
+    """
+    Returns the derivatives of the topographic multiplier (Clause 4.4) with
+    respect to the reference height and the distance from the crest,
+    following the branches of `batch.topographic_multiplier_batch`.
+
+    Returns:
+        Tuple of arrays (dM_t/dz, dM_t/dx) (1/m).
+    """
+    wind_region, z, hill_height, L_u, x, escarpment, E = np.broadcast_arrays(
+        np.asarray(wind_region),
+        np.asarray(z, dtype=float),
+        np.asarray(hill_height, dtype=float),
+        np.asarray(L_u, dtype=float),
+        np.asarray(x, dtype=float),
+        np.asarray(escarpment, dtype=bool),
+        np.asarray(E, dtype=float)
+    )
+    with np.errstate(divide='ignore', invalid='ignore'):
+        upwind_slope = np.where(L_u > 0, hill_height / (2 * L_u), 0.0)
+    L_1 = np.maximum(0.36 * L_u, 0.4 * hill_height)
+    L_2 = np.where(escarpment, 10 * L_1, 4 * L_1)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        decay = np.where(L_2 > 0, 1 - np.abs(x) / L_2, 0.0)
+        d_decay_dx = np.where(L_2 > 0, -np.sign(x) / L_2, 0.0)
+        ratio = hill_height / (3.5 * (z + L_1))
+        M_h_general = 1 + ratio * decay
+    steep = (upwind_slope > 0.45) & (x >= 0) & (x <= hill_height / 4)
+    flat = upwind_slope < 0.05
+    M_h = np.where(flat, 1.0, np.where(steep, 1 + 0.71 * decay, M_h_general))
+
+    dM_h_dz = np.where(flat | steep, 0.0, -ratio / (z + L_1) * decay)
+    dM_h_dx = np.where(flat, 0.0, np.where(steep, 0.71, ratio) * d_decay_dx)
+
+    # Derivative of M_t with respect to M_h for each region branch
+    factor = np.where(
+        wind_region == 'A0',
+        0.5,
+        np.where(
+            (wind_region == 'A4') & (E >= 500),
+            1 + 0.00015 * E,
+            np.where(M_h > 1.0, 1.0, 0.0)
+        )
+    )
+    return factor * dM_h_dz, factor * dM_h_dx
+
+
+def _sector_maximum_slopes(theta: np.ndarray, V: np.ndarray, dV: dict) -> tuple:
+    """
+    Returns the maximum of the piecewise-linear interpolation of V (sites, 8)
+    between theta - 45 and theta + 45 degrees (sites, k), its derivative with
+    respect to theta, and its derivatives with respect to each quantity in dV
+    (the derivatives of V, each with shape (sites, 8)).
+    """
+    # Candidates: the cardinal directions within the sector, then its ends
+    first = np.ceil((theta - 45) / 45)
+    cardinal = 45 * (first[..., None] + np.arange(3))
+    in_sector = cardinal <= (theta + 45)[..., None]
+    angles = np.concatenate([cardinal, (theta - 45)[..., None], (theta + 45)[..., None]], axis=-1)
+    valid = np.concatenate([in_sector, np.ones(theta.shape + (2,), dtype=bool)], axis=-1)
+
+    wrapped = angles % 360
+    lower = (wrapped // 45).astype(np.int64) % 8
+    upper = (lower + 1) % 8
+    fraction = (wrapped % 45) / 45
+
+    sites = np.arange(V.shape[0])[:, None, None]
+
+    def at(values):
+        return values[sites, lower], values[sites, upper]
+
+    V_lower, V_upper = at(V)
+    values = np.where(valid, V_lower * (1 - fraction) + V_upper * fraction, -np.inf)
+    best = np.argmax(values, axis=-1)[..., None]
+    maximum = np.take_along_axis(values, best, axis=-1)[..., 0]
+
+    # Interior cardinal directions do not move with theta; the ends do
+    slope = (V_upper - V_lower) / 45
+    is_end = best[..., 0] >= 3
+    d_theta = np.where(is_end, np.take_along_axis(slope, best, axis=-1)[..., 0], 0.0)
+
+    derivatives = {}
+    best_fraction = np.take_along_axis(fraction, best, axis=-1)[..., 0]
+    for name, values_dV in dV.items():
+        dV_lower, dV_upper = at(values_dV)
+        derivatives[name] = (
+            np.take_along_axis(dV_lower, best, axis=-1)[..., 0] * (1 - best_fraction)
+            + np.take_along_axis(dV_upper, best, axis=-1)[..., 0] * best_fraction
+        )
+    return maximum, d_theta, derivatives
+
+
+def design_pressure_sensitivities(
+        wind_region,
+        terrain_category,
+        height,
+        orientation,
+        R=500.0,
+        hill_height=0.0,
+        L_u=0.0,
+        x=0.0,
+        escarpment=False,
+        E=0.0,
+        M_s=1.0,
+        C_fig=1.0
+) -> dict:
+    """
+    Calculates the design pressures p = q C_fig in the 4 orthogonal
+    directions for arrays of buildings, with their partial derivatives with
+    respect to the height, the orientation and the distance from the hill
+    crest, in one vectorised pass.
+
+    Args:
+        wind_region: wind region of each building, shape (buildings,).
+        terrain_category: terrain category of each building.
+        height: reference height (m).
+        orientation: building orientation relative to true North, between 0
+            and 90 degrees.
+        R: Average Recurrence Interval (years); default is 500.
+        hill_height, L_u, x, escarpment, E: topographic inputs as per
+            `batch.topographic_multiplier_batch`; default is flat ground.
+        M_s: shielding multiplier; default is 1.0.
+        C_fig: aerodynamic shape factor, shape (buildings,) or (buildings,
+            4); default is 1.0.
+
+    Returns:
+        Dictionary of arrays with shape (buildings, 4), ordered as
+        ORTHOGONAL_ANGLES:
+            'V_des': design wind speed (m/s), the exact sector maximum with
+                a minimum of 30 m/s, which the derivatives follow.
+            'p': design pressure (kPa), from V_des.
+            'V_des_design': design wind speed (m/s) as calculated by
+                `design_wind_speed` (on the 5 degree grid, rounded to 2
+                decimal places); not greater than V_des by more than the
+                rounding.
+            'p_design': design pressure (kPa), from V_des_design.
+            'dp_dheight': derivative of p with respect to height (kPa/m).
+            'dp_dorientation': derivative of p with respect to the
+                orientation (kPa/degree).
+            'dp_dx': derivative of p with respect to x (kPa/m).
+        The derivatives are zero where the 30 m/s minimum design wind speed
+        governs.
+    """
+    wind_region = np.atleast_1d(np.asarray(wind_region))
+    n = wind_region.size
+
+    def per_building(value, dtype=float):
+        return np.broadcast_to(np.asarray(value, dtype=dtype), (n,))
+
+    terrain_category = per_building(terrain_category, None)
+    height = per_building(height)
+    orientation = per_building(orientation)
+    hill_height, L_u, x, E, M_s = (per_building(value) for value in (hill_height, L_u, x, E, M_s))
+    escarpment = per_building(escarpment, bool)
+
+    V_R = regional_wind_speed_batch(wind_region, R)
+    M_c = climate_change_multiplier_batch(wind_region)
+    M_d, _ = wind_direction_multiplier_batch(wind_region)
+    M_zcat = terrain_height_multiplier_batch(terrain_category, wind_region, height)
+    M_t = topographic_multiplier_batch(wind_region, height, hill_height, L_u, x, escarpment, E)
+    V_sit_beta = site_wind_speed_batch(V_R, M_c, M_d, M_zcat, M_s, M_t)
+
+    dM_zcat_dz = terrain_height_multiplier_slope(terrain_category, wind_region, height)
+    dM_t_dz, dM_t_dx = topographic_multiplier_slopes(wind_region, height, hill_height, L_u, x, escarpment, E)
+    directional = (V_R * M_c * M_s)[:, None] * M_d
+    dV_sit = {
+        'height': directional * (dM_zcat_dz * M_t + M_zcat * dM_t_dz)[:, None],
+        'x': directional * (M_zcat * dM_t_dx)[:, None],
+    }
+
+    theta = orientation[:, None] + ORTHOGONAL_ANGLES
+    maximum, dV_dtheta, dV_des = _sector_maximum_slopes(theta, V_sit_beta, dV_sit)
+    governs = maximum > 30
+    V_des = np.maximum(maximum, 30)
+
+    C_fig = np.asarray(C_fig, dtype=float)
+    C_fig = C_fig[:, None] if C_fig.ndim == 1 else C_fig
+    dp_dV = 1.2e-3 * V_des * C_fig * governs
+
+    V_des_design = design_wind_speed_batch(orientation, V_sit_beta)
+
+    return {
+        'V_des': V_des,
+        'p': basic_wind_pressure(V_des) * C_fig,
+        'V_des_design': V_des_design,
+        'p_design': basic_wind_pressure(V_des_design) * C_fig,
+        'dp_dheight': dp_dV * dV_des['height'],
+        'dp_dorientation': dp_dV * dV_dtheta,
+        'dp_dx': dp_dV * dV_des['x'],
+    }
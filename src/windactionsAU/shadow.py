@@ -0,0 +1,391 @@
+"""
+Shadow-mode checking of the batch calculations against the scalar reference
+functions of `wind_speed` and `aerodynamic_shape_factors`. A sampled fraction
+of the rows of each batch is recalculated one row at a time through the
+scalar functions and the results compared, so that divergence between the
+two engines is detected in production runs at a small, bounded cost.
+"""
+
+import numpy as np
+import pandas as pd
+
+from windactionsAU.aerodynamic_shape_factors import (
+    ext_pressure_coeff_windward_wall,
+    ext_pressure_coeff_leeward_wall,
+    ext_pressure_coeff_side_walls,
+    ext_pressure_coeff_roof_shallow,
+    ext_pressure_coeff_roof_steep,
+)
+from windactionsAU.batch import (
+    ORTHOGONAL_ANGLES,
+    SURFACES,
+    ext_pressure_coeff_all_directions_batch,
+    net_pressure_batch,
+)
+from windactionsAU.pipeline import SITE_RESULT_COLUMNS, site_arrays
+from windactionsAU.wind_pressure import basic_wind_pressure, design_wind_pressure
+from windactionsAU.wind_speed import (
+    average_recurrence_interval,
+    regional_wind_speed,
+    site_wind_speed,
+    design_wind_speed,
+    wind_direction_multiplier,
+    climate_change_multiplier,
+    terrain_height_multiplier,
+    shielding_multiplier,
+    topographic_multiplier,
+)
+
+
+# Input columns recorded with each mismatch
+SHADOW_INPUT_COLUMNS = [
+    'wind_region', 'terrain_category', 'height', 'design_life', 'importance_level',
+    'cyclonic', 'orientation', 'h_s', 'b_s', 'n_s', 'hill_height', 'L_u', 'x',
+    'escarpment', 'E',
+]
+
+# Input columns recorded with each mismatch of the pressure coefficient and
+# net pressure checks
+SHADOW_PRESSURE_COLUMNS = [
+    'h', 'd', 'b', 'roof_pitch', 'vary_with_height',
+    'q', 'C_pe', 'C_pi', 'K_a', 'K_ce', 'K_ci', 'K_l',
+]
+
+
+def scalar_site_results(row: dict) -> dict:
+    """
+    Calculates the site results of one row of site inputs with the scalar
+    functions, as the reference of `pipeline.evaluate_sites`.
+
+    Args:
+        row: dictionary of the site inputs as extracted by `evaluate_sites`
+            (optional columns filled with their defaults, and 'shielded'
+            True where the shielding columns are given). M_s is 1.0 where
+            n_s is 0, as per `batch.shielding_multiplier_batch`.
+
+    Returns:
+        Dictionary of results keyed by SITE_RESULT_COLUMNS.
+    """
+    wind_region = str(row['wind_region'])
+    height = float(row['height'])
+    R = average_recurrence_interval(str(row['design_life']), int(row['importance_level']), bool(row['cyclonic']))
+    V_R = regional_wind_speed(wind_region, R)
+    M_c = climate_change_multiplier(wind_region)
+    M_d, _ = wind_direction_multiplier(wind_region)
+    M_zcat = terrain_height_multiplier(str(row['terrain_category']), wind_region, height)
+    if row['shielded'] and row['n_s'] > 0:
+        M_s = shielding_multiplier(height, float(row['h_s']), float(row['b_s']), float(row['n_s']))
+    else:
+        M_s = 1.0
+    if row['L_u'] > 0:
+        M_t = topographic_multiplier(
+            wind_region, height, float(row['hill_height']), float(row['L_u']),
+            float(row['x']), bool(row['escarpment']), float(row['E'])
+        )
+    else:
+        # Flat ground, as per `batch.topographic_multiplier_batch`
+        M_t = 1.0
+    V_sit_beta = site_wind_speed(V_R, M_c, M_d, M_zcat, M_s, M_t)
+    V_des_theta = design_wind_speed(float(row['orientation']), V_sit_beta)
+
+    results = {'R': R, 'V_R': V_R, 'M_c': M_c, 'M_zcat': M_zcat, 'M_s': M_s, 'M_t': M_t}
+    for direction, value in V_sit_beta.items():
+        results['V_sit_' + direction] = value
+    for angle in ORTHOGONAL_ANGLES:
+        V_des = V_des_theta[str(angle) + ' Deg']
+        results['V_des_' + str(angle)] = V_des
+        results['q_' + str(angle)] = basic_wind_pressure(V_des)
+    return results
+
+
+def scalar_pressure_coefficients(
+        h: float,
+        d: float,
+        b: float,
+        roof_pitch: float=0.0,
+        vary_with_height: bool=False
+) -> np.ndarray:
+    """
+    Calculates the external pressure coefficients of one building with the
+    scalar functions, as the reference of
+    `batch.ext_pressure_coeff_all_directions_batch`.
+
+    Args:
+        h: average roof height (m).
+        d: building depth for wind at 0 degrees (m).
+        b: building width for wind at 0 degrees (m).
+        roof_pitch: roof pitch (degrees); default is 0.
+        vary_with_height: True where the windward wall wind speed varies with
+            height; default is False.
+
+    Returns:
+        Array of C_pe with shape (4, len(SURFACES), 2), laid out as per
+        `ext_pressure_coeff_all_directions_batch`.
+    """
+    C_pe = np.full((4, len(SURFACES), 2), np.nan)
+    # Wind normal to the ridge at 0 and 180 degrees, parallel to it otherwise
+    for direction, (depth, width, pitch) in enumerate([(d, b, roof_pitch), (b, d, 0.0)] * 2):
+        C_pe[direction, 0] = ext_pressure_coeff_windward_wall(h, vary_with_height)
+        C_pe[direction, 1] = ext_pressure_coeff_leeward_wall(depth, width, pitch)
+        side_walls = ext_pressure_coeff_side_walls(h, depth)
+        C_pe[direction, 2:6] = np.array([zone[-1] for zone in side_walls.values()])[:, None]
+        if pitch < 10:
+            roof = ext_pressure_coeff_roof_shallow(h, depth, pitch)
+            C_pe[direction, 6:11] = np.sort(list(roof.values()), axis=-1)
+        else:
+            C_pe[direction, 11:13] = np.sort(ext_pressure_coeff_roof_steep(h, depth, width, pitch), axis=-1)
+    return C_pe
+
+
+class ShadowChecker:
+    """
+    Recalculates a random sample of the valid rows of site batches with the
+    scalar functions and records the results that differ from the batch
+    results. Pass an instance as the `shadow` argument of
+    `pipeline.evaluate_sites`, or call `check_sites` directly; the pressure
+    coefficients and net pressures of the surface calculations are checked
+    with `check_pressure_coefficients` and `check_net_pressures`.
+
+    Args:
+        fraction: expected fraction of the valid rows of each batch that is
+            checked; default is 0.01.
+        tolerance: largest accepted difference between the batch and scalar
+            results, relative to the magnitude of the scalar result (and
+            absolute below 1); default is 1e-6. Results that are NaN in both
+            agree.
+        seed: seed of the row sampling; default is None.
+        max_records: maximum number of mismatches (and scalar errors) kept
+            in `records`; the counters continue beyond it. Default is 1000.
+    """
+    def __init__(self, fraction: float=0.01, tolerance: float=1e-6, seed=None, max_records: int=1000):
+        if not 0 <= fraction <= 1:
+            raise ValueError(f"The shadow fraction shall be between 0 and 1, not '{fraction}'.")
+        self.fraction = float(fraction)
+        self.tolerance = float(tolerance)
+        self.max_records = int(max_records)
+        self.rows_checked = 0
+        self.mismatched_rows = 0
+        self.scalar_errors = 0
+        self.mismatches = dict.fromkeys(SITE_RESULT_COLUMNS, 0)
+        self.records = []
+        self._rng = np.random.default_rng(seed)
+
+    def sample(self, n_rows: int) -> np.ndarray:
+        """Returns the sorted positions of the rows to check out of n_rows."""
+        n_sampled = self._rng.binomial(n_rows, self.fraction) if n_rows else 0
+        return np.sort(self._rng.choice(n_rows, size=n_sampled, replace=False))
+
+    def check_sites(self, inputs: pd.DataFrame, result) -> int:
+        """
+        Checks a sample of the valid rows of a site batch.
+
+        Args:
+            inputs: Pandas DataFrame of site inputs passed to
+                `evaluate_sites`.
+            result: BatchResult returned by `evaluate_sites` for the inputs.
+
+        Returns:
+            Number of the checked rows with a mismatch or scalar error.
+        """
+        valid = np.flatnonzero(result.errors == 0)
+        rows = valid[self.sample(valid.size)]
+        if not rows.size:
+            return 0
+        arrays = site_arrays(inputs.iloc[rows])
+        batch = result.results.iloc[rows]
+
+        failed = 0
+        for i, row in enumerate(rows):
+            values = {name: array[i] for name, array in arrays.items()}
+            recorded = {
+                name: values[name] if name not in ('h_s', 'b_s', 'n_s') or values['shielded'] else np.nan
+                for name in SHADOW_INPUT_COLUMNS
+            }
+            try:
+                reference = scalar_site_results(values)
+            except Exception as error:
+                failed += self._fail(inputs.index[row], recorded, error)
+                continue
+            batch_values = [float(batch[column].iloc[i]) for column in SITE_RESULT_COLUMNS]
+            scalar_values = [float(reference[column]) for column in SITE_RESULT_COLUMNS]
+            failed += self._compare(inputs.index[row], recorded, SITE_RESULT_COLUMNS, batch_values, scalar_values)
+        return failed
+
+    def check_pressure_coefficients(
+            self,
+            h,
+            d,
+            b,
+            roof_pitch=0.0,
+            vary_with_height=False,
+            C_pe: np.ndarray=None
+    ) -> int:
+        """
+        Checks the external pressure coefficients of a sample of buildings
+        against `scalar_pressure_coefficients`.
+
+        Args:
+            h, d, b, roof_pitch, vary_with_height: building inputs as per
+                `batch.ext_pressure_coeff_all_directions_batch`.
+            C_pe: the coefficients returned by
+                `ext_pressure_coeff_all_directions_batch` for the inputs;
+                calculated where None (default).
+
+        Returns:
+            Number of the checked buildings with a mismatch or scalar error.
+        """
+        h, d, b, roof_pitch, vary_with_height = (
+            array.ravel() for array in np.broadcast_arrays(
+                np.atleast_1d(np.asarray(h, dtype=float)),
+                np.asarray(d, dtype=float),
+                np.asarray(b, dtype=float),
+                np.asarray(roof_pitch, dtype=float),
+                np.asarray(vary_with_height, dtype=bool)
+            )
+        )
+        if C_pe is None:
+            C_pe = ext_pressure_coeff_all_directions_batch(h, d, b, roof_pitch, vary_with_height)
+        columns = [
+            f"C_pe_{angle}_{surface}_{bound}"
+            for angle in ORTHOGONAL_ANGLES for surface in SURFACES for bound in ('min', 'max')
+        ]
+
+        failed = 0
+        for row in self.sample(h.size):
+            recorded = {
+                'h': h[row], 'd': d[row], 'b': b[row],
+                'roof_pitch': roof_pitch[row], 'vary_with_height': vary_with_height[row],
+            }
+            try:
+                reference = scalar_pressure_coefficients(h[row], d[row], b[row], roof_pitch[row], vary_with_height[row])
+            except Exception as error:
+                failed += self._fail(row, recorded, error)
+                continue
+            failed += self._compare(row, recorded, columns, C_pe[row].ravel(), reference.ravel())
+        return failed
+
+    def check_net_pressures(
+            self,
+            q,
+            C_pe,
+            C_pi,
+            K_a=1.0,
+            K_ce=1.0,
+            K_ci=1.0,
+            K_l=1.0,
+            p: np.ndarray=None
+    ) -> int:
+        """
+        Checks the net pressures of a sample of surfaces against
+        `wind_pressure.design_wind_pressure` with the aerodynamic shape
+        factor C_shp = K_a K_ce K_l C_pe - K_ci C_pi of each scenario.
+
+        Args:
+            q, C_pe, C_pi, K_a, K_ce, K_ci, K_l: surface and scenario inputs
+                as per `batch.net_pressure_batch`.
+            p: the net pressures returned by `net_pressure_batch` for the
+                inputs, shape (surfaces, scenarios); calculated where None
+                (default).
+
+        Returns:
+            Number of the checked surfaces with a mismatch or scalar error.
+        """
+        if p is None:
+            p = net_pressure_batch(q, C_pe, C_pi, K_a, K_ce, K_ci, K_l)
+        p = np.atleast_2d(p)
+
+        def surface(value):
+            value = np.asarray(value, dtype=float)
+            return value[:, None] if value.ndim == 1 else value
+
+        def scenario(value):
+            value = np.asarray(value, dtype=float)
+            return value[None, :] if value.ndim == 1 else value
+
+        inputs = {
+            'q': surface(q), 'C_pe': surface(C_pe), 'K_a': surface(K_a), 'K_l': surface(K_l),
+            'C_pi': scenario(C_pi), 'K_ce': scenario(K_ce), 'K_ci': scenario(K_ci),
+        }
+        inputs = {name: np.broadcast_to(value, p.shape) for name, value in inputs.items()}
+        columns = [f"p_{scenario}" for scenario in range(p.shape[1])]
+
+        failed = 0
+        for row in self.sample(p.shape[0]):
+            values = {name: value[row] for name, value in inputs.items()}
+            # Surface inputs are recorded as is, scenario inputs where common
+            recorded = {
+                name: value[0] if np.all(value == value[0]) else np.nan
+                for name, value in values.items()
+            }
+            reference = [
+                design_wind_pressure(
+                    values['q'][j],
+                    values['K_a'][j] * values['K_ce'][j] * values['K_l'][j] * values['C_pe'][j]
+                    - values['K_ci'][j] * values['C_pi'][j]
+                )
+                for j in range(p.shape[1])
+            ]
+            failed += self._compare(row, recorded, columns, p[row], reference)
+        return failed
+
+    def _fail(self, index, inputs: dict, error: Exception) -> int:
+        self.rows_checked += 1
+        self.scalar_errors += 1
+        self._record(index, inputs, 'error', np.nan, np.nan, f"{type(error).__name__}: {error}")
+        return 1
+
+    def _compare(self, index, inputs: dict, columns: list, batch_values, scalar_values) -> int:
+        """
+        Compares the batch and scalar results of one row, recording each
+        mismatch, and returns 1 where the row has a mismatch (otherwise 0).
+        """
+        self.rows_checked += 1
+        mismatched = False
+        for column, batch_value, scalar_value in zip(columns, batch_values, scalar_values):
+            batch_value = float(batch_value)
+            scalar_value = float(scalar_value)
+            if np.isnan(batch_value) and np.isnan(scalar_value):
+                continue
+            scale = max(abs(scalar_value), 1.0)
+            if not abs(batch_value - scalar_value) <= self.tolerance * scale:
+                self.mismatches[column] = self.mismatches.get(column, 0) + 1
+                mismatched = True
+                self._record(index, inputs, column, batch_value, scalar_value, '')
+        if mismatched:
+            self.mismatched_rows += 1
+        return int(mismatched)
+
+    def _record(self, index, inputs: dict, column: str, batch_value: float, scalar_value: float, message: str):
+        if len(self.records) >= self.max_records:
+            return
+        record = {'Row': index, 'Column': column, 'Batch': batch_value, 'Scalar': scalar_value, 'Message': message}
+        record.update(inputs)
+        self.records.append(record)
+
+    @property
+    def counters(self) -> dict:
+        """
+        Dictionary of the number of rows checked, the rows with a mismatch,
+        the scalar errors and the mismatches of each result column.
+        """
+        return {
+            'rows_checked': self.rows_checked,
+            'mismatched_rows': self.mismatched_rows,
+            'scalar_errors': self.scalar_errors,
+            'mismatches': {column: count for column, count in self.mismatches.items() if count},
+        }
+
+    def mismatch_report(self) -> pd.DataFrame:
+        """
+        Returns the recorded mismatches as a Pandas DataFrame with the
+        columns 'Row' (the input index), 'Column' (the result column, or
+        'error' where the scalar calculation raised), 'Batch', 'Scalar',
+        'Message' and the SHADOW_INPUT_COLUMNS of the offending inputs, or,
+        where pressure coefficients or net pressures were checked, also
+        their SHADOW_PRESSURE_COLUMNS. 'Row' is the position of the building
+        or surface for those checks.
+        """
+        columns = ['Row', 'Column', 'Batch', 'Scalar', 'Message'] + SHADOW_INPUT_COLUMNS
+        if any('h' in record or 'q' in record for record in self.records):
+            columns += SHADOW_PRESSURE_COLUMNS
+        return pd.DataFrame(self.records, columns=columns)
@@ -0,0 +1,122 @@
+"""
+Height-varying windward pressures and storey load takedown (storey forces,
+shears and overturning moments) for enclosed rectangular buildings, evaluated
+for the 4 orthogonal directions across arrays of buildings.
+"""
+
+import numpy as np
+
+from windactionsAU.batch import (
+    ORTHOGONAL_ANGLES,
+    terrain_height_multiplier_batch,
+    ext_pressure_coeff_windward_wall_batch,
+    ext_pressure_coeff_leeward_wall_batch,
+)
+from windactionsAU.wind_pressure import basic_wind_pressure
+
+
+def storey_wind_loads(
+        elevations,
+        b_0,
+        b_90,
+        V_des_theta,
+        terrain_category,
+        wind_region,
+        roof_pitch=0.0,
+        C_dyn=1.0
+) -> dict:
+    """
+    Calculates the storey wind loads on enclosed rectangular buildings with
+    the windward wall pressure varying with height, using the Table 5.2(A)
+    C_pe for a wind speed varying with height evaluated at each level, and
+    the leeward wall pressure evaluated at the roof height (Table 5.2(B)).
+
+    The design wind speed at height z is taken as
+    V_des,theta * M_z,cat(z) / M_z,cat(h), where V_des,theta is the design
+    wind speed at the roof height, h. Each storey level carries the load on
+    the band of wall between the midpoints to the levels below and above it;
+    the band of the highest level extends to the roof and the lower half of
+    the lowest storey is taken directly to the ground.
+
+    Args:
+        elevations: storey levels above ground with shape (buildings,
+            storeys), ascending, with the last level at the roof height (m).
+            Buildings with fewer storeys may be padded by repeating the roof
+            level.
+        b_0: building plan dimension perpendicular to the 0 degree direction
+            (m), one per building.
+        b_90: building plan dimension perpendicular to the 90 degree
+            direction (m), one per building.
+        V_des_theta: design wind speeds at the roof height with shape
+            (buildings, 4), ordered 0, 90, 180 and 270 degrees (m/s).
+        terrain_category: terrain category of each building.
+        wind_region: wind region of each building.
+        roof_pitch: roof pitch (degrees); default is 0.
+        C_dyn: dynamic response factor; default is 1.0.
+
+    Returns:
+        Dictionary of arrays:
+            'directions': the orthogonal directions (degrees).
+            'p_windward': windward wall pressure at each level, shape
+                (buildings, 4, storeys) (kPa).
+            'p_leeward': leeward wall pressure, shape (buildings, 4) (kPa).
+            'force': storey force, shape (buildings, 4, storeys) (kN).
+            'shear': storey shear below each level (kN).
+            'overturning_moment': overturning moment at the floor below each
+                level, the first entry being the base moment (kNm).
+    """
+    z = np.atleast_2d(np.asarray(elevations, dtype=float))
+    n_buildings = z.shape[0]
+    b_0 = np.broadcast_to(np.asarray(b_0, dtype=float), (n_buildings,))
+    b_90 = np.broadcast_to(np.asarray(b_90, dtype=float), (n_buildings,))
+    V_des_theta = np.broadcast_to(np.asarray(V_des_theta, dtype=float), (n_buildings, 4))
+    terrain_category = np.broadcast_to(np.asarray(terrain_category), (n_buildings,))
+    wind_region = np.broadcast_to(np.asarray(wind_region), (n_buildings,))
+    roof_pitch = np.broadcast_to(np.asarray(roof_pitch, dtype=float), (n_buildings,))
+
+    if np.any(np.diff(z, axis=1) < 0) or np.any(z[:, 0] <= 0):
+        raise ValueError("The storey elevations shall be positive and ascending.")
+    h = z[:, -1]
+
+    # Wind speed profile relative to the roof height
+    M_zcat = terrain_height_multiplier_batch(
+        terrain_category[:, None], wind_region[:, None], z
+    )
+    M_zcat_h = M_zcat[:, -1:]
+    V_z = V_des_theta[:, :, None] * (M_zcat / M_zcat_h)[:, None, :]
+
+    C_pe_windward = ext_pressure_coeff_windward_wall_batch(z, vary_with_height=True)
+    p_windward = basic_wind_pressure(V_z) * C_pe_windward[:, None, :] * C_dyn
+
+    # Breadth and depth for each orthogonal direction
+    breadth = np.stack([b_0, b_90, b_0, b_90], axis=1)
+    depth = np.stack([b_90, b_0, b_90, b_0], axis=1)
+    C_pe_leeward = ext_pressure_coeff_leeward_wall_batch(depth, breadth, roof_pitch[:, None])
+    p_leeward = basic_wind_pressure(V_des_theta) * C_pe_leeward * C_dyn
+
+    # Tributary heights of each level
+    midpoints = 0.5 * (z[:, 1:] + z[:, :-1])
+    lower = np.concatenate([0.5 * z[:, :1], midpoints], axis=1)
+    upper = np.concatenate([midpoints, h[:, None]], axis=1)
+    tributary = upper - lower
+
+    force = (
+        (p_windward - p_leeward[:, :, None])
+        * breadth[:, :, None]
+        * tributary[:, None, :]
+    )
+
+    # Reverse cumulative sums give the shear and moment below each level
+    shear = np.cumsum(force[..., ::-1], axis=-1)[..., ::-1]
+    first_moment = np.cumsum((force * z[:, None, :])[..., ::-1], axis=-1)[..., ::-1]
+    floor_below = np.concatenate([np.zeros((n_buildings, 1)), z[:, :-1]], axis=1)
+    overturning_moment = first_moment - shear * floor_below[:, None, :]
+
+    return {
+        'directions': ORTHOGONAL_ANGLES,
+        'p_windward': p_windward,
+        'p_leeward': p_leeward,
+        'force': force,
+        'shear': shear,
+        'overturning_moment': overturning_moment,
+    }
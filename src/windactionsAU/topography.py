@@ -0,0 +1,293 @@
+"""
+Derivation of the Clause 4.4 hill parameters (H, L_u, x and the escarpment
+flag) from a digital elevation model (DEM), and evaluation of the topographic
+multiplier for each of the 8 cardinal directions.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from windactionsAU.batch import DIRECTION_ANGLES, topographic_multiplier_batch
+
+
+class ElevationRaster:
+    """
+    A north-up elevation grid read in square tiles. Tiles are held in a least
+    recently used cache so that nearby sites reuse previous reads.
+
+    Args:
+        data: path to a `.npy` file (opened as a read-only memmap) or a 2D
+            array of elevations (m), with row 0 along the northern edge.
+        cell_size: grid spacing (m).
+        origin: (easting, northing) of the top-left corner of the grid (m);
+            default is (0, 0).
+        tile_size: number of cells along each side of a cached tile;
+            default is 256.
+        max_tiles: maximum number of tiles held in the cache; default is 64.
+    """
+    def __init__(
+            self,
+            data,
+            cell_size: float,
+            origin: tuple=(0.0, 0.0),
+            tile_size: int=256,
+            max_tiles: int=64
+    ):
+        if isinstance(data, (str, os.PathLike)):
+            data = np.load(data, mmap_mode='r')
+        if np.ndim(data) != 2:
+            raise ValueError(f"The elevation grid shall be 2D, not {np.ndim(data)}D.")
+        self.data = data
+        self.cell_size = float(cell_size)
+        self.origin = (float(origin[0]), float(origin[1]))
+        self.tile_size = int(tile_size)
+        self.max_tiles = int(max_tiles)
+        self.tile_hits = 0
+        self.tile_misses = 0
+        self._tiles = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def shape(self) -> tuple:
+        return self.data.shape
+
+    def _tile(self, ti: int, tj: int) -> np.ndarray:
+        key = (ti, tj)
+        with self._lock:
+            tile = self._tiles.get(key)
+            if tile is not None:
+                self._tiles.move_to_end(key)
+                self.tile_hits += 1
+                return tile
+        r0, c0 = ti * self.tile_size, tj * self.tile_size
+        tile = np.array(
+            self.data[r0:r0 + self.tile_size, c0:c0 + self.tile_size],
+            dtype=float
+        )
+        with self._lock:
+            self.tile_misses += 1
+            self._tiles[key] = tile
+            while len(self._tiles) > self.max_tiles:
+                self._tiles.popitem(last=False)
+        return tile
+
+    def _cells(self, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+        """Returns the elevations of integer cells, clipped to the grid."""
+        rows = np.clip(rows, 0, self.shape[0] - 1)
+        cols = np.clip(cols, 0, self.shape[1] - 1)
+        ti = rows // self.tile_size
+        tj = cols // self.tile_size
+        out = np.empty(rows.shape, dtype=float)
+        keys = ti * (self.shape[1] // self.tile_size + 1) + tj
+        for key in np.unique(keys):
+            mask = keys == key
+            i, j = ti[mask][0], tj[mask][0]
+            tile = self._tile(int(i), int(j))
+            out[mask] = tile[
+                rows[mask] - i * self.tile_size,
+                cols[mask] - j * self.tile_size
+            ]
+        return out
+
+    def sample(self, easting, northing) -> np.ndarray:
+        """
+        Returns elevations at arbitrary points by bilinear interpolation
+        between cell centres. Points outside the grid take the value of the
+        nearest edge cell.
+        """
+        col = (np.asarray(easting, dtype=float) - self.origin[0]) / self.cell_size - 0.5
+        row = (self.origin[1] - np.asarray(northing, dtype=float)) / self.cell_size - 0.5
+        r0 = np.floor(row).astype(np.int64)
+        c0 = np.floor(col).astype(np.int64)
+        fr = row - r0
+        fc = col - c0
+        e00 = self._cells(r0, c0)
+        e01 = self._cells(r0, c0 + 1)
+        e10 = self._cells(r0 + 1, c0)
+        e11 = self._cells(r0 + 1, c0 + 1)
+        return (
+            e00 * (1 - fr) * (1 - fc) + e01 * (1 - fr) * fc
+            + e10 * fr * (1 - fc) + e11 * fr * fc
+        )
+
+
+def upwind_profiles(
+        raster: ElevationRaster,
+        easting,
+        northing,
+        upwind_length: float=2000.0,
+        downwind_length: float=1000.0,
+        step: float=None
+) -> tuple:
+    """
+    Extracts ground profiles through each site along each of the 8 cardinal
+    wind directions.
+
+    Args:
+        raster: the elevation grid.
+        easting, northing: site coordinates (m).
+        upwind_length: profile length upwind of the site (m); default 2000 m.
+        downwind_length: profile length downwind of the site (m); default
+            1000 m.
+        step: sample spacing along the profile (m); defaults to the raster
+            cell size.
+
+    Returns:
+        Tuple of (s, profiles), where s is the distance of each sample
+        upwind of the site (m, negative downwind) and profiles is an array of
+        elevations with shape (sites, 8, samples).
+    """
+    step = raster.cell_size if step is None else float(step)
+    s = np.arange(-downwind_length, upwind_length + 0.5 * step, step)
+    beta = np.radians(DIRECTION_ANGLES)
+    easting = np.atleast_1d(np.asarray(easting, dtype=float))
+    northing = np.atleast_1d(np.asarray(northing, dtype=float))
+
+    # Wind from direction beta; the upwind unit vector points towards beta
+    px = easting[:, None, None] + np.sin(beta)[None, :, None] * s[None, None, :]
+    py = northing[:, None, None] + np.cos(beta)[None, :, None] * s[None, None, :]
+    return s, raster.sample(px, py)
+
+
+def hill_parameters(s: np.ndarray, profiles: np.ndarray) -> dict:
+    """
+    Derives the hill parameters of Clause 4.4 from ground profiles.
+
+    The crest is taken as the highest point on the profile. The hill height
+    is measured from the lowest point upwind of the crest and L_u is the
+    distance from the crest upwind to the first point half the hill height
+    below it. A feature is classed as an escarpment where the ground downwind
+    of the crest does not fall to half the hill height below the crest within
+    the profile.
+
+    Args:
+        s: distance of each sample upwind of the site (m), ascending.
+        profiles: elevations with s along the last axis (m).
+
+    Returns:
+        Dictionary of arrays 'hill_height', 'L_u', 'x' (distance of the site
+        downwind of the crest, negative where the site is upwind of it),
+        'escarpment' and 'E' (site elevation).
+    """
+    profiles = np.asarray(profiles, dtype=float)
+    step = s[1] - s[0]
+    idx = np.arange(s.size)
+
+    i_crest = np.argmax(profiles, axis=-1)[..., None]
+    e_crest = np.take_along_axis(profiles, i_crest, axis=-1)
+    upwind = idx >= i_crest
+    downwind = idx <= i_crest
+
+    e_base = np.where(upwind, profiles, np.inf).min(axis=-1, keepdims=True)
+    hill_height = e_crest - e_base
+    half = e_crest - 0.5 * hill_height
+
+    below_upwind = upwind & (profiles <= half) & (idx > i_crest)
+    i_half = np.where(below_upwind.any(axis=-1, keepdims=True),
+                      np.argmax(below_upwind, axis=-1)[..., None],
+                      s.size - 1)
+    L_u = np.maximum((i_half - i_crest) * step, step)
+
+    below_downwind = downwind & (profiles <= half) & (idx < i_crest)
+    escarpment = ~below_downwind.any(axis=-1, keepdims=True) & (hill_height > 0)
+
+    i_site = np.argmin(np.abs(s))
+    hill_height = hill_height[..., 0]
+    return {
+        'hill_height': hill_height,
+        'L_u': L_u[..., 0],
+        'x': np.where(hill_height > 0, s[i_crest[..., 0]], 0.0),
+        'escarpment': escarpment[..., 0],
+        'E': profiles[..., i_site],
+    }
+
+
+def hill_parameters_from_dem(
+        raster: ElevationRaster,
+        easting,
+        northing,
+        upwind_length: float=2000.0,
+        downwind_length: float=1000.0,
+        step: float=None,
+        chunk_size: int=256,
+        max_workers: int=None
+) -> dict:
+    """
+    Derives the hill parameters for a batch of sites in each of the 8
+    cardinal directions. Sites are processed in chunks in parallel.
+
+    Args:
+        raster: the elevation grid.
+        easting, northing: site coordinates (m).
+        upwind_length, downwind_length, step: refer to `upwind_profiles`.
+        chunk_size: number of sites per parallel task; default is 256.
+        max_workers: maximum number of worker threads; default is the
+            `ThreadPoolExecutor` default.
+
+    Returns:
+        Dictionary of arrays with shape (sites, 8); refer to
+        `hill_parameters`.
+    """
+    easting = np.atleast_1d(np.asarray(easting, dtype=float))
+    northing = np.atleast_1d(np.asarray(northing, dtype=float))
+    if easting.shape != northing.shape:
+        raise ValueError("The easting and northing arrays shall have the same shape.")
+
+    def run(start):
+        stop = start + chunk_size
+        s, profiles = upwind_profiles(
+            raster, easting[start:stop], northing[start:stop],
+            upwind_length, downwind_length, step
+        )
+        return hill_parameters(s, profiles)
+
+    starts = range(0, easting.size, chunk_size)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        parts = list(executor.map(run, starts))
+
+    if not parts:
+        return {key: np.empty((0, 8)) for key in
+                ['hill_height', 'L_u', 'x', 'escarpment', 'E']}
+    return {key: np.concatenate([part[key] for part in parts]) for key in parts[0]}
+
+
+def topographic_multipliers_from_dem(
+        raster: ElevationRaster,
+        easting,
+        northing,
+        z,
+        wind_region,
+        **kwargs
+) -> np.ndarray:
+    """
+    Calculates the topographic multiplier per Clause 4.4 for a batch of sites
+    in each of the 8 cardinal directions, with the hill parameters derived
+    from a DEM.
+
+    Args:
+        raster: the elevation grid.
+        easting, northing: site coordinates (m).
+        z: reference height of each structure above local ground level (m).
+        wind_region: the wind region of each site.
+        **kwargs: passed to `hill_parameters_from_dem`.
+
+    Returns:
+        Topographic Multipliers, M_t, with shape (sites, 8) ordered N, NE,
+        E, SE, S, SW, W, NW.
+    """
+    params = hill_parameters_from_dem(raster, easting, northing, **kwargs)
+    z = np.atleast_1d(np.asarray(z, dtype=float))[:, None]
+    wind_region = np.atleast_1d(np.asarray(wind_region))[:, None]
+    return topographic_multiplier_batch(
+        wind_region,
+        z,
+        params['hill_height'],
+        params['L_u'],
+        params['x'],
+        params['escarpment'],
+        params['E']
+    )
@@ -0,0 +1,103 @@
+"""
+Audit trail of the clause branches taken by the batch calculations. Where
+requested, each row is given an integer trace code (a bit field of the
+branches it took), which can be decoded to the clause references after the
+run without slowing the calculation down with strings or logging.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+NO_TRACE = 0
+ARI_TABLE_F2 = 1
+ARI_IL1_NON_CYCLONIC = 2
+ARI_IL1_CYCLONIC = 4
+M_H_FLAT = 8
+M_H_STEEP = 16
+M_H_GENERAL = 32
+M_H_ESCARPMENT = 64
+M_T_A0 = 128
+M_T_A4_ELEVATION = 256
+M_T_GENERAL = 512
+M_S_HEIGHT = 1024
+M_S_SPACING = 2048
+M_S_CLOSE = 4096
+M_S_INTERPOLATED = 8192
+C_PE_LEEWARD_FLAT = 16384
+C_PE_LEEWARD_MID = 32768
+C_PE_LEEWARD_TRANSITION = 65536
+C_PE_LEEWARD_STEEP = 131072
+
+TRACE_CLAUSES = {
+    ARI_TABLE_F2: "AS/NZS 1170.0 Table F2: annual probability of exceedance from the design working life and importance level.",
+    ARI_IL1_NON_CYCLONIC: "AS/NZS 1170.0 Table F2: Importance Level 1, 50 year design working life, non-cyclonic (R = 100 years).",
+    ARI_IL1_CYCLONIC: "AS/NZS 1170.0 Table F2: Importance Level 1, 50 year design working life, cyclonic (R = 200 years).",
+    M_H_FLAT: "AS/NZS 1170.2 Clause 4.4.2: upwind slope H/(2L_u) < 0.05, M_h = 1.0.",
+    M_H_STEEP: "AS/NZS 1170.2 Clause 4.4.2: upwind slope > 0.45 within the separation zone, M_h = 1 + 0.71(1 - |x|/L_2).",
+    M_H_GENERAL: "AS/NZS 1170.2 Clause 4.4.2: M_h = 1 + H/(3.5(z + L_1)) (1 - |x|/L_2).",
+    M_H_ESCARPMENT: "AS/NZS 1170.2 Clause 4.4.2: escarpment, L_2 = 10 L_1 downwind of the crest.",
+    M_T_A0: "AS/NZS 1170.2 Clause 4.4.1: Region A0, M_t = 0.5 + 0.5 M_h.",
+    M_T_A4_ELEVATION: "AS/NZS 1170.2 Clause 4.4.1: Region A4 with site elevation E >= 500 m, M_t = M_h M_lee (1 + 0.00015E).",
+    M_T_GENERAL: "AS/NZS 1170.2 Clause 4.4.1: M_t = the larger of M_h and M_lee.",
+    M_S_HEIGHT: "AS/NZS 1170.2 Clause 4.3.1: average roof height greater than 25 m, M_s = 1.0.",
+    M_S_SPACING: "AS/NZS 1170.2 Table 4.3: shielding parameter s >= 12, M_s = 1.0.",
+    M_S_CLOSE: "AS/NZS 1170.2 Table 4.3: shielding parameter s <= 1.5, M_s = 0.7.",
+    M_S_INTERPOLATED: "AS/NZS 1170.2 Table 4.3: M_s interpolated on the shielding parameter s.",
+    C_PE_LEEWARD_FLAT: "AS/NZS 1170.2 Table 5.2(B): roof pitch < 10 degrees, C_pe from d/b.",
+    C_PE_LEEWARD_MID: "AS/NZS 1170.2 Table 5.2(B): roof pitch 10 to 20 degrees, C_pe from the roof pitch.",
+    C_PE_LEEWARD_TRANSITION: "AS/NZS 1170.2 Table 5.2(B): roof pitch 20 to 25 degrees, C_pe interpolated on the roof pitch.",
+    C_PE_LEEWARD_STEEP: "AS/NZS 1170.2 Table 5.2(B): roof pitch >= 25 degrees, C_pe from the building aspect ratio.",
+}
+
+
+def trace_codes(conditions: list, codes: list) -> np.ndarray:
+    """
+    Combines branch conditions into an array of trace codes.
+
+    Args:
+        conditions: boolean arrays, broadcast against each other.
+        codes: the trace code of each condition.
+
+    Returns:
+        Array of trace codes.
+    """
+    conditions = np.broadcast_arrays(*[np.asarray(condition, dtype=bool) for condition in conditions])
+    trace = np.zeros(conditions[0].shape, dtype=np.uint32)
+    for condition, code in zip(conditions, codes):
+        trace[condition] |= code
+    return trace
+
+
+def decode_trace(code: int) -> list:
+    """
+    Returns the clause references of a single trace code.
+    """
+    return [clause for flag, clause in TRACE_CLAUSES.items() if int(code) & flag]
+
+
+def trace_report(codes: np.ndarray, index=None) -> pd.DataFrame:
+    """
+    Summarises an array of trace codes.
+
+    Args:
+        codes: trace codes returned by the batch calculations.
+        index: row labels used to report the first row taking each branch;
+            defaults to the row positions.
+
+    Returns:
+        Pandas DataFrame with one row per branch taken giving the number of
+        rows, the first row and the clause reference.
+    """
+    codes = np.asarray(codes)
+    index = np.arange(codes.size) if index is None else np.asarray(index)
+    acc = []
+    for flag, clause in TRACE_CLAUSES.items():
+        taken = (codes & flag) != 0
+        count = int(taken.sum())
+        if count:
+            acc.append([flag, count, index[taken][0], clause])
+    return pd.DataFrame(
+        data=acc,
+        columns=['Code', 'Rows', 'First Row', 'Clause']
+    )
@@ -0,0 +1,193 @@
+"""
+Vectorised validation of batch inputs. Rather than raising an exception on
+the first invalid value, each row is given an integer error code (a bit
+field of the checks it failed) so that valid rows can proceed and invalid
+rows can be reported together.
+"""
+
+import numpy as np
+import pandas as pd
+
+from windactionsAU.batch import (
+    ARI_DESIGN_LIVES,
+    M_D_TABLE,
+    M_ZCAT_TABLE,
+)
+
+
+VALID = 0
+INVALID_REGION = 1
+INVALID_TERRAIN_CATEGORY = 2
+INVALID_DESIGN_LIFE = 4
+INVALID_IMPORTANCE_LEVEL = 8
+ARI_NOT_DEFINED = 16
+INVALID_HEIGHT = 32
+INVALID_ORIENTATION = 64
+INVALID_SHIELDING = 128
+INVALID_TOPOGRAPHY = 256
+INVALID_GEOMETRY = 512
+INVALID_BOOLEAN = 1024
+INVALID_POSITION = 2048
+
+ERROR_MESSAGES = {
+    INVALID_REGION: "Wind region shall be one of 'A0' to 'A5', 'B1', 'B2', 'C' or 'D'.",
+    INVALID_TERRAIN_CATEGORY: "Terrain category shall be one of 'TC1', 'TC2', 'TC2.5', 'TC3' or 'TC4'.",
+    INVALID_DESIGN_LIFE: "Design life shall be one of 'Construction Equipment', '5 Years', '25 Years', '50 Years' or '100 Years'.",
+    INVALID_IMPORTANCE_LEVEL: "Importance level shall be 1, 2, 3 or 4.",
+    ARI_NOT_DEFINED: "Importance Level 4 structures with a 5 or 100 year design life are not covered by AS/NZS 1170.0 Table F2.",
+    INVALID_HEIGHT: "Height shall be greater than 0 m and not greater than 200 m.",
+    INVALID_ORIENTATION: "Orientation angle shall be between 0 and 90 degrees.",
+    INVALID_SHIELDING: "Shielding parameters h_s and b_s shall be positive, with h_s not less than the height, where n_s is positive (n_s = 0 for no shielding).",
+    INVALID_TOPOGRAPHY: "Hill height shall not be negative and L_u shall be positive where a hill is present.",
+    INVALID_GEOMETRY: "Building dimensions d and b shall be positive and the roof pitch between 0 and 90 degrees.",
+    INVALID_BOOLEAN: "Cyclonic and escarpment shall be True or False (or 1/0, 'yes'/'no').",
+    INVALID_POSITION: "Distance from the crest x and site elevation E shall be finite numbers.",
+}
+
+REQUIRED_COLUMNS = ['wind_region', 'terrain_category', 'height']
+
+# Accepted spellings of boolean inputs (strings are compared in lower case)
+BOOLEAN_VALUES = {
+    True: True, False: False, 1: True, 0: False,
+    'true': True, 'false': False, 't': True, 'f': False,
+    'yes': True, 'no': False, 'y': True, 'n': False, '1': True, '0': False,
+}
+
+
+def _numeric(inputs: pd.DataFrame, column: str, default=np.nan) -> np.ndarray:
+    """Returns a column as floats, with unparseable values as NaN."""
+    if column not in inputs:
+        return np.full(len(inputs), default, dtype=float)
+    return pd.to_numeric(inputs[column], errors='coerce').to_numpy(dtype=float)
+
+
+def parse_boolean(values) -> tuple:
+    """
+    Parses an array of boolean inputs given as booleans, 1/0 or strings
+    such as 'True', 'false', 'yes' or '0' (rather than by truthiness, which
+    would make the string 'False' True).
+
+    Returns:
+        Tuple of arrays (values, valid); invalid values are False.
+    """
+    def parse(value):
+        if isinstance(value, str):
+            value = value.strip().lower()
+        try:
+            return BOOLEAN_VALUES.get(value)
+        except TypeError:
+            return None
+
+    parsed = [parse(value) for value in np.asarray(values, dtype=object).ravel()]
+    valid = np.array([value is not None for value in parsed], dtype=bool)
+    result = np.array([bool(value) for value in parsed], dtype=bool)
+    shape = np.shape(values)
+    return result.reshape(shape), valid.reshape(shape)
+
+
+def validate_inputs(inputs: pd.DataFrame) -> np.ndarray:
+    """
+    Validates a table of batch inputs, one row per site or building.
+
+    The columns 'wind_region', 'terrain_category' and 'height' are required.
+    The optional columns 'design_life', 'importance_level', 'cyclonic',
+    'orientation', 'h_s', 'b_s', 'n_s', 'hill_height', 'L_u', 'x',
+    'escarpment', 'E', 'd', 'b' and 'roof_pitch' are checked where present.
+
+    Args:
+        inputs: Pandas DataFrame of inputs.
+
+    Returns:
+        Array of error codes, one per row; 0 where the row is valid,
+        otherwise the sum of the failed checks (refer to ERROR_MESSAGES).
+    """
+    missing = [column for column in REQUIRED_COLUMNS if column not in inputs]
+    if missing:
+        raise KeyError(f"The input columns {missing} are required.")
+
+    codes = np.zeros(len(inputs), dtype=np.uint32)
+
+    def flag(condition, code):
+        codes[np.asarray(condition, dtype=bool)] |= code
+
+    flag(~inputs['wind_region'].isin(list(M_D_TABLE)).to_numpy(), INVALID_REGION)
+    flag(~inputs['terrain_category'].isin(list(M_ZCAT_TABLE)).to_numpy(), INVALID_TERRAIN_CATEGORY)
+
+    height = _numeric(inputs, 'height')
+    flag(~((height > 0) & (height <= 200)), INVALID_HEIGHT)
+
+    if 'design_life' in inputs:
+        design_life = inputs['design_life']
+        flag(~design_life.isin(ARI_DESIGN_LIVES).to_numpy(), INVALID_DESIGN_LIFE)
+    if 'importance_level' in inputs:
+        level = _numeric(inputs, 'importance_level')
+        flag(~np.isin(level, [1, 2, 3, 4]), INVALID_IMPORTANCE_LEVEL)
+        if 'design_life' in inputs:
+            flag((level == 4) & inputs['design_life'].isin(['5 Years', '100 Years']).to_numpy(), ARI_NOT_DEFINED)
+
+    for column in ['cyclonic', 'escarpment']:
+        if column in inputs:
+            flag(~parse_boolean(inputs[column].to_numpy())[1], INVALID_BOOLEAN)
+
+    if 'orientation' in inputs:
+        orientation = _numeric(inputs, 'orientation')
+        flag(~((orientation >= 0) & (orientation <= 90)), INVALID_ORIENTATION)
+
+    if any(column in inputs for column in ['h_s', 'b_s', 'n_s']):
+        h_s = _numeric(inputs, 'h_s')
+        b_s = _numeric(inputs, 'b_s')
+        n_s = _numeric(inputs, 'n_s')
+        # n_s = 0 marks an unshielded site (M_s = 1.0) and needs no h_s or b_s
+        shielded = (h_s > 0) & (b_s > 0) & (h_s >= height)
+        flag(~((n_s == 0) | ((n_s > 0) & shielded)), INVALID_SHIELDING)
+
+    if 'hill_height' in inputs:
+        hill_height = _numeric(inputs, 'hill_height')
+        L_u = _numeric(inputs, 'L_u')
+        flag(~((hill_height == 0) | ((hill_height > 0) & (L_u > 0))), INVALID_TOPOGRAPHY)
+
+    for column in ['x', 'E']:
+        if column in inputs:
+            flag(~np.isfinite(_numeric(inputs, column)), INVALID_POSITION)
+
+    if any(column in inputs for column in ['d', 'b', 'roof_pitch']):
+        d = _numeric(inputs, 'd', 1.0)
+        b = _numeric(inputs, 'b', 1.0)
+        roof_pitch = _numeric(inputs, 'roof_pitch', 0.0)
+        flag(~((d > 0) & (b > 0) & (roof_pitch >= 0) & (roof_pitch <= 90)), INVALID_GEOMETRY)
+
+    return codes
+
+
+def decode_errors(code: int) -> list:
+    """
+    Returns the error messages of a single error code.
+    """
+    return [message for flag, message in ERROR_MESSAGES.items() if int(code) & flag]
+
+
+def validation_report(codes: np.ndarray, index=None) -> pd.DataFrame:
+    """
+    Summarises an array of error codes.
+
+    Args:
+        codes: error codes returned by `validate_inputs`.
+        index: row labels used to report the first failing row; defaults to
+            the row positions.
+
+    Returns:
+        Pandas DataFrame with one row per failed check giving the number of
+        failing rows, the first failing row and the error message.
+    """
+    codes = np.asarray(codes)
+    index = np.arange(codes.size) if index is None else np.asarray(index)
+    acc = []
+    for flag, message in ERROR_MESSAGES.items():
+        failed = (codes & flag) != 0
+        count = int(failed.sum())
+        if count:
+            acc.append([flag, count, index[failed][0], message])
+    return pd.DataFrame(
+        data=acc,
+        columns=['Code', 'Rows', 'First Row', 'Message']
+    )
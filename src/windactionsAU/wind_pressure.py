@@ -26,7 +26,8 @@ def design_wind_pressure(basic_wind_pressure: float, C_shp: float, C_dyn: float=
         C_shp: aerodynamic shape factor
         C_dyn: dynamic response factor; default=1.0 except where the structure 
             is dynamically wind sensitive. Refer to AS/NZS 1170.2:2021 Section 
-            6 for further details.
+            6 and `dynamic_response.dynamic_response_factor` for further 
+            details.
     Returns:
         Design wind pressure, p (kPa).
     """
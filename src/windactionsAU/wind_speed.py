@@ -63,21 +63,21 @@ def average_recurrence_interval(
     }
     importance_level = str_to_int(importance_level)
 
-    try:
-        if design_life == 'Construction Equipment':
-            ari = ari_dict[design_life]
-        elif design_life == '5 Years' and importance_level == 4:
-            raise ValueError(f"Importance Level 4 structures shall not be designed"
-                            " for less than a 25 year design life.")
-        elif design_life == '100 Years' and importance_level == 4:
-            raise ValueError(f"Importance Level 4 structures with a design working"
-                            " life of 100 years or more shall be determined by a"
-                            " risk analysis, but shall have probabilities less"
-                            " than or equal to those for Importance Level 3.")
-        else:
+    if design_life == 'Construction Equipment':
+        ari = ari_dict[design_life]
+    elif design_life == '5 Years' and importance_level == 4:
+        raise ValueError(f"Importance Level 4 structures shall not be designed"
+                        " for less than a 25 year design life.")
+    elif design_life == '100 Years' and importance_level == 4:
+        raise ValueError(f"Importance Level 4 structures with a design working"
+                        " life of 100 years or more shall be determined by a"
+                        " risk analysis, but shall have probabilities less"
+                        " than or equal to those for Importance Level 3.")
+    else:
+        try:
             ari = ari_dict[design_life][importance_level]
-    except:
-        raise KeyError(f"The input Design Life and/or the Importance Level is an invalid option.")
+        except (KeyError, TypeError):
+            raise KeyError(f"The input Design Life and/or the Importance Level is an invalid option.")
     return ari
 
 
@@ -177,7 +177,7 @@ def design_wind_speed(orientation_angle: float, V_sit_beta: pd.Series) -> dict:
     """
     # Generates a Pandas DataFrame for Wind Direction multipliers in 5 degree increments
     acc = []
-    angles = np.arange(-45, 360, 5).tolist()
+    angles = np.arange(-45, 410, 5).tolist()
     for i in angles:
         if i < 0:
             M_d_interp = np.interp(i, [-45, 0], [V_sit_beta.iloc[7], V_sit_beta.iloc[0]])
@@ -197,6 +197,9 @@ def design_wind_speed(orientation_angle: float, V_sit_beta: pd.Series) -> dict:
             M_d_interp = np.interp(i, [270, 315], [V_sit_beta.iloc[6], V_sit_beta.iloc[7]])
         elif i >= 315 and i < 360:
             M_d_interp = np.interp(i, [315, 360], [V_sit_beta.iloc[7], V_sit_beta.iloc[0]])
+        elif i >= 360:
+            # Wraps past North so the sectors of orientations above 45 degrees are complete
+            M_d_interp = np.interp(i, [360, 405], [V_sit_beta.iloc[0], V_sit_beta.iloc[1]])
         acc.append([i, round(M_d_interp, 2)])
 
     M_d_df = pd.DataFrame(
@@ -358,13 +361,12 @@ def shielding_multiplier(height: float, h_s: float=3.0, b_s: float=3.0, n_s: flo
     Returns:
         Shielding Multiplier, M_s.
     """
-    try:
-        if h_s < height:
-            raise ValueError(f"The average roof height of shielding buildings shall be greater than the height of the building being shielded.")
-        l_s = height * (10 / n_s + 5)
-        s = l_s / sqrt(h_s * b_s)
-    except:
+    if h_s <= 0 or b_s <= 0 or n_s <= 0:
         raise ZeroDivisionError(f"The parameters h_s, b_s, and n_s shall not be zero.")
+    if h_s < height:
+        raise ValueError(f"The average roof height of shielding buildings shall be greater than the height of the building being shielded.")
+    l_s = height * (10 / n_s + 5)
+    s = l_s / sqrt(h_s * b_s)
 
     if s >= 12.0 or height > 25:
         M_s = 1.0
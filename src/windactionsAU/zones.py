@@ -0,0 +1,148 @@
+"""
+Zone queries for the piecewise-constant side wall (Table 5.2(C)) and shallow
+roof (Table 5.3(A)) external pressure coefficients: C_pe at an arbitrary
+distance from the windward edge, and the exact average C_pe over the span
+of a member such as a purlin or girt.
+"""
+
+import numpy as np
+
+from windactionsAU.batch import (
+    SIDE_WALL_EDGES,
+    SIDE_WALL_CPE,
+    ROOF_SHALLOW_EDGES,
+    ext_pressure_coeff_roof_shallow_batch,
+)
+
+
+def _values_at(u, edges: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """
+    Returns the value of a piecewise-constant distribution at positions u.
+
+    Args:
+        u: positions, in the same units as edges.
+        edges: interior zone edges, ascending.
+        values: zone values with shape u.shape + (zones, k).
+    """
+    zone = np.searchsorted(edges, u, side='right')
+    return np.take_along_axis(values, zone[..., None, None], axis=-2)[..., 0, :]
+
+
+def _integral_to(u, edges: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """
+    Returns the integral of a piecewise-constant distribution from 0 to u,
+    using the cumulative integral at the zone edges.
+    """
+    lower = np.concatenate([[0.0], edges])
+    widths = np.diff(lower)
+    cumulative = np.concatenate(
+        [
+            np.zeros(values.shape[:-2] + (1, values.shape[-1])),
+            np.cumsum(values[..., :-1, :] * widths[:, None], axis=-2)
+        ],
+        axis=-2
+    )
+    zone = np.searchsorted(edges, u, side='right')
+    start = np.take_along_axis(cumulative, zone[..., None, None], axis=-2)[..., 0, :]
+    value = np.take_along_axis(values, zone[..., None, None], axis=-2)[..., 0, :]
+    return start + value * (u - lower[zone])[..., None]
+
+
+def _span_average(u_start, u_end, edges: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """
+    Returns the average of a piecewise-constant distribution between u_start
+    and u_end, or the value at u_start where the span has no length.
+    """
+    u_start, u_end = np.minimum(u_start, u_end), np.maximum(u_start, u_end)
+    length = (u_end - u_start)[..., None]
+    integral = _integral_to(u_end, edges, values) - _integral_to(u_start, edges, values)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = integral / length
+    return np.where(length > 0, mean, _values_at(u_start, edges, values))
+
+
+def side_wall_cpe_at(distance, h) -> np.ndarray:
+    """
+    Returns the side wall external pressure coefficient per Table 5.2(C) at
+    distances from the windward edge.
+
+    Args:
+        distance: horizontal distances from the windward edge (m).
+        h: average roof height (m), broadcast against distance, e.g. with
+            shape (buildings, 1) for distances of shape (buildings, members).
+
+    Returns:
+        Array of C_pe.
+    """
+    u = np.asarray(distance, dtype=float) / np.asarray(h, dtype=float)
+    return SIDE_WALL_CPE[np.searchsorted(SIDE_WALL_EDGES, u, side='right')]
+
+
+def side_wall_cpe_span_average(start, end, h) -> np.ndarray:
+    """
+    Returns the exact average side wall external pressure coefficient per
+    Table 5.2(C) over member spans, from the integral of the zone
+    distribution.
+
+    Args:
+        start, end: distances of the span ends from the windward edge (m).
+        h: average roof height (m), broadcast against start and end.
+
+    Returns:
+        Array of span-averaged C_pe.
+    """
+    h = np.asarray(h, dtype=float)
+    u_start, u_end = np.broadcast_arrays(
+        np.asarray(start, dtype=float) / h,
+        np.asarray(end, dtype=float) / h
+    )
+    values = np.broadcast_to(SIDE_WALL_CPE[:, None], u_start.shape + (SIDE_WALL_CPE.size, 1))
+    return _span_average(u_start, u_end, SIDE_WALL_EDGES, values)[..., 0]
+
+
+def roof_cpe_at(distance, h, d) -> np.ndarray:
+    """
+    Returns the roof external pressure coefficients per Table 5.3(A) (roof
+    pitch less than 10 degrees) at distances from the windward edge.
+
+    Args:
+        distance: horizontal distances from the windward edge (m).
+        h: average roof height (m), broadcast against distance.
+        d: building depth, parallel with the wind direction (m), broadcast
+            against distance.
+
+    Returns:
+        Array of C_pe with a trailing axis holding the two values of the zone.
+    """
+    distance, h, d = np.broadcast_arrays(
+        np.asarray(distance, dtype=float),
+        np.asarray(h, dtype=float),
+        np.asarray(d, dtype=float)
+    )
+    values = ext_pressure_coeff_roof_shallow_batch(h, d)
+    return _values_at(distance / h, ROOF_SHALLOW_EDGES, values)
+
+
+def roof_cpe_span_average(start, end, h, d) -> np.ndarray:
+    """
+    Returns the exact average roof external pressure coefficients per Table
+    5.3(A) over member spans, from the integral of the zone distribution.
+
+    Args:
+        start, end: distances of the span ends from the windward edge (m).
+        h: average roof height (m), broadcast against start and end.
+        d: building depth, parallel with the wind direction (m), broadcast
+            against start and end.
+
+    Returns:
+        Array of span-averaged C_pe with a trailing axis holding the two
+        values of the zones.
+    """
+    start, end, h, d = np.broadcast_arrays(
+        np.asarray(start, dtype=float),
+        np.asarray(end, dtype=float),
+        np.asarray(h, dtype=float),
+        np.asarray(d, dtype=float)
+    )
+    values = ext_pressure_coeff_roof_shallow_batch(h, d)
+    return _span_average(start / h, end / h, ROOF_SHALLOW_EDGES, values)
@@ -0,0 +1,26 @@
+import math
+from windactionsAU import aerodynamic_shape_factors as ASF
+
+
+def test_action_combination_factor():
+    assert ASF.action_combination_factor(0.2, "Type 1") == (0.8, 1.0)
+    assert ASF.action_combination_factor(-0.65, "Type 1") == (0.8, 0.8)
+    assert ASF.action_combination_factor(0.7, "Type 2") == (0.8, 0.8)
+    assert ASF.action_combination_factor(0.7, "Type 3") == (0.9, 0.9)
+    assert ASF.action_combination_factor(0.0, "Type 5") == (0.9, 0.9)
+    assert ASF.action_combination_factor(0.7, "Type 5") == (1.0, 1.0)
+    assert ASF.action_combination_factor(0.7) == (1.0, 1.0)
+
+
+def test_int_pressure_coeff_permeable():
+    assert ASF.int_pressure_coeff_permeable("All walls permeable") == [-0.3, 0.0]
+    assert ASF.int_pressure_coeff_permeable("One wall permeable, windward") == [0.6, 0.6]
+
+
+def test_int_pressure_coeff_dominant_opening():
+    assert ASF.int_pressure_coeff_dominant_opening(0.5, "Windward Wall", 0.7) == [-0.3, 0.0]
+    assert ASF.int_pressure_coeff_dominant_opening(1.0, "Windward Wall", 0.7) == [-0.1, 0.2]
+    C_pi = ASF.int_pressure_coeff_dominant_opening(6.0, "Windward Wall", 0.7)
+    assert math.isclose(C_pi[0], 0.7) and math.isclose(C_pi[1], 0.7)
+    C_pi = ASF.int_pressure_coeff_dominant_opening(3.0, "Roof", -0.9)
+    assert math.isclose(C_pi[0], -0.9) and math.isclose(C_pi[1], -0.9)
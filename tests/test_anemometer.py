@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+from windactionsAU import anemometer as AN
+from windactionsAU import wind_speed as WS
+
+
+def gust_records(tmp_path):
+    time = pd.date_range('2000-01-01', '2009-12-31 23:00', freq='h')
+    rng = np.random.default_rng(2)
+    gust = rng.uniform(5.0, 20.0, time.size)
+    # One storm per year, spread over 3 hours
+    for year in range(2000, 2010):
+        start = np.searchsorted(time, pd.Timestamp(f'{year}-06-01'))
+        gust[start:start + 3] = [30.0, 30.0 + year - 2000, 28.0]
+    path = tmp_path / 'gusts.csv'
+    pd.DataFrame({'time': time, 'gust': gust}).to_csv(path, index=False)
+    return path
+
+
+def test_implied_ari_inverts_regional_wind_speed():
+    R = np.array([25, 500, 2500])
+    assert np.allclose(AN.implied_ari(67 - 41 * R ** -0.1, 'A2'), R)
+    assert np.allclose(AN.implied_ari(122 - 104 * R ** -0.1, 'C'), R)
+    assert np.isclose(AN.implied_ari(WS.regional_wind_speed('D', 500), 'D'), 500, rtol=0.2)
+    assert np.isinf(AN.implied_ari(70.0, 'A2'))
+
+
+def test_annual_maxima_streaming(tmp_path):
+    path = gust_records(tmp_path)
+    maxima = AN.annual_maxima(AN.read_gust_records(path, chunksize=5000))
+    assert list(maxima.index) == list(range(2000, 2010))
+    assert np.allclose(maxima['gust'], np.maximum(30.0 + np.arange(10), 30.0))
+    comparison = AN.compare_to_design(maxima, 'A2')
+    # The largest of 10 annual maxima is exceeded with probability 1/11
+    assert np.isclose(comparison['empirical_rate'].iloc[0], -np.log(1 - 1 / 11))
+
+
+def test_peaks_over_threshold_streaming(tmp_path):
+    path = gust_records(tmp_path)
+    # Chunks of 1000 rows place some storms across chunk boundaries
+    peaks, years = AN.peaks_over_threshold(AN.read_gust_records(path, chunksize=1000), threshold=25.0)
+    assert len(peaks) == 10
+    assert np.isclose(years, 10.0, atol=0.01)
+    comparison = AN.compare_to_design(peaks, 'A2', years)
+    assert comparison['gust'].iloc[0] == 39.0
+    assert np.isclose(comparison['empirical_rate'].iloc[0], 1 / years)
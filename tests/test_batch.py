@@ -0,0 +1,131 @@
+import pandas as pd
+import numpy as np
+from windactionsAU import batch as B
+from windactionsAU import wind_speed as WS
+from windactionsAU import aerodynamic_shape_factors as ASF
+
+
+def test_terrain_height_multiplier_batch():
+    categories = ['TC1', 'TC1', 'TC2.5', 'TC3', 'TC3', 'TC4']
+    regions = ['A0', 'A1', 'C', 'C', 'C', 'B2']
+    heights = [17.5, 17.5, 25, 2.5, 200, 42]
+    expected = [WS.terrain_height_multiplier(*args) for args in zip(categories, regions, heights)]
+    assert np.allclose(B.terrain_height_multiplier_batch(categories, regions, heights), expected)
+
+
+def test_ext_pressure_coeff_leeward_wall_batch():
+    d = np.array([10, 20, 40, 5, 12, 30, 30])
+    b = np.array([10, 10, 10, 40, 40, 100, 100])
+    pitch = np.array([0, 5, 9, 12, 22, 25, 40])
+    expected = [ASF.ext_pressure_coeff_leeward_wall(*args) for args in zip(d, b, pitch)]
+    assert np.allclose(B.ext_pressure_coeff_leeward_wall_batch(d, b, pitch), expected)
+
+
+def test_topographic_multiplier_batch():
+    cases = [
+        ('C', 10, 0.0, 100, 0, False, 0),
+        ('C', 10, 30, 100, 50, False, 0),
+        ('A0', 10, 30, 100, 50, False, 0),
+        ('C', 10, 100, 100, 10, True, 0),
+        ('A4', 10, 30, 100, 50, False, 600),
+    ]
+    expected = [WS.topographic_multiplier(*case) if case[2] > 0 else 1.0 for case in cases]
+    result = B.topographic_multiplier_batch(*[np.array(col) for col in zip(*cases)])
+    assert np.allclose(result, expected)
+
+
+def test_int_pressure_coeff_batch():
+    ratios = [0.3, 1.0, 1.5, 2.0, 4.0, 8.0, 1.5]
+    surfaces = ['Windward Wall', 'Windward Wall', 'Windward Wall', 'Leeward Wall', 'Side Wall', 'Roof', 'roof']
+    C_pe = [0.7, 0.7, 0.7, -0.5, -0.65, -0.9, -0.9]
+    C_pi_min, C_pi_max = B.int_pressure_coeff_batch(ratios, surfaces, C_pe)
+    for i, args in enumerate(zip(ratios, surfaces, C_pe)):
+        expected = ASF.int_pressure_coeff_dominant_opening(*args)
+        assert np.isclose(C_pi_min[i], expected[0]) and np.isclose(C_pi_max[i], expected[1])
+
+
+def test_action_combination_factor_batch():
+    C_pi = [0.2, -0.65, 0.7, 0.0, 0.7, 0.3]
+    framing = ['Type 1', 'Type 1', 'Type 3', 'Type 5', 'Type 5', 'Case z']
+    K_ce, K_ci = B.action_combination_factor_batch(C_pi, framing)
+    for i, args in enumerate(zip(C_pi, framing)):
+        assert (K_ce[i], K_ci[i]) == ASF.action_combination_factor(*args)
+
+
+def test_net_pressure_batch():
+    q = np.array([1.0, 1.5])
+    C_pe = np.array([0.7, -0.9])
+    C_pi = np.array([-0.3, 0.0, 0.7])
+    K_ce, K_ci = B.action_combination_factor_batch(C_pi, 'Type 1')
+    p = B.net_pressure_batch(q, C_pe, C_pi, K_a=[0.9, 1.0], K_ce=K_ce, K_ci=K_ci)
+    assert p.shape == (2, 3)
+    assert np.isclose(p[1, 2], 1.5 * (1.0 * 0.8 * -0.9 - 0.8 * 0.7))
+    assert np.isclose(p[0, 0], 1.0 * (0.9 * 0.8 * 0.7 - 1.0 * -0.3))
+
+
+def test_wind_speed_batch_functions():
+    assert np.array_equal(
+        B.average_recurrence_interval_batch(['50 Years', '50 Years', '25 Years', 'Construction Equipment'], [1, 4, 3, 2], [True, False, False, False]),
+        [200, 2500, 500, 100]
+    )
+    regions = ['A0', 'A2', 'B2', 'C', 'D', 'NZ3']
+    R = [500, 250, 250, 2500, 500, 100]
+    expected = [WS.regional_wind_speed(*args) for args in zip(regions, R)]
+    assert np.array_equal(B.regional_wind_speed_batch(regions, R), expected)
+
+    for region in ['A0', 'A1', 'A2', 'A3', 'A4', 'A5', 'B1', 'B2', 'C', 'D']:
+        M_d, M_d_cladding = WS.wind_direction_multiplier(region)
+        batch_M_d, batch_M_d_cladding = B.wind_direction_multiplier_batch([region])
+        assert np.allclose(batch_M_d[0], M_d.to_numpy())
+        assert np.allclose(batch_M_d_cladding[0], M_d_cladding.to_numpy())
+        assert B.climate_change_multiplier_batch([region])[0] == WS.climate_change_multiplier(region)
+
+    args = [(10, 10, 10, 4), (5, 10, 5, 8), (30, 40, 10, 4), (5, 20, 20, 50)]
+    expected = [WS.shielding_multiplier(*arg) for arg in args]
+    assert np.allclose(B.shielding_multiplier_batch(*np.array(args).T), expected)
+
+
+def test_design_wind_speed_batch():
+    rng = np.random.default_rng(1)
+    V_sit = rng.uniform(25, 60, (20, 8)).round(2)
+    orientation = rng.choice(np.arange(0, 95, 5), 20)
+    result = B.design_wind_speed_batch(orientation, V_sit)
+    for i in range(20):
+        expected = WS.design_wind_speed(orientation[i], pd.Series(V_sit[i], index=B.DIRECTIONS))
+        assert np.allclose(result[i], list(expected.values()))
+
+
+def test_ext_pressure_coeff_roof_steep_batch():
+    cases = [(6.0, 10.0, 40.0, 15.0), (8.0, 12.0, 30.0, 22.0), (12.0, 8.0, 100.0, 40.0), (5.0, 30.0, 60.0, 27.5)]
+    h, d, b, alpha = np.array(cases).T
+    C_pe = B.ext_pressure_coeff_roof_steep_batch(h, d, b, alpha)
+    for i, case in enumerate(cases):
+        expected = np.array(ASF.ext_pressure_coeff_roof_steep(*case), dtype=float)
+        assert np.allclose(C_pe[i], expected)
+    assert np.isnan(B.ext_pressure_coeff_roof_steep_batch(6.0, 10.0, 40.0, 5.0)).all()
+
+
+def test_ext_pressure_coeff_all_directions_batch():
+    h = np.array([6.0, 6.0])
+    d = np.array([20.0, 20.0])
+    b = np.array([40.0, 40.0])
+    pitch = np.array([5.0, 20.0])
+    C_pe = B.ext_pressure_coeff_all_directions_batch(h, d, b, pitch)
+    assert C_pe.shape == (2, 4, len(B.SURFACES), 2)
+    assert np.array_equal(C_pe[:, 0], C_pe[:, 2], equal_nan=True)
+    assert np.array_equal(C_pe[:, 1], C_pe[:, 3], equal_nan=True)
+
+    windward, leeward = B.SURFACES.index('windward'), B.SURFACES.index('leeward')
+    assert (C_pe[:, :, windward] == 0.7).all()
+    assert np.allclose(C_pe[0, 0, leeward], ASF.ext_pressure_coeff_leeward_wall(20, 40, 5))
+    assert np.allclose(C_pe[1, 0, leeward], ASF.ext_pressure_coeff_leeward_wall(20, 40, 20))
+    assert np.allclose(C_pe[1, 1, leeward], ASF.ext_pressure_coeff_leeward_wall(40, 20, 0))
+
+    roof = [B.SURFACES.index('roof_0 to 0.5h'), B.SURFACES.index('roof_> 3h')]
+    shallow = list(ASF.ext_pressure_coeff_roof_shallow(6.0, 40.0, 0).values())
+    assert np.allclose(C_pe[1, 1, roof], [shallow[0], shallow[-1]])
+    assert np.isnan(C_pe[1, 0, roof]).all()
+    upwind = B.SURFACES.index('roof_upwind')
+    steep = np.array(ASF.ext_pressure_coeff_roof_steep(6.0, 20.0, 40.0, 20.0))
+    assert np.allclose(C_pe[1, 0, upwind:upwind + 2], np.sort(steep, axis=-1))
+    assert np.isnan(C_pe[0, :, upwind]).all()
@@ -0,0 +1,47 @@
+import numpy as np
+from windactionsAU import cache as C
+
+
+def test_make_key_normalises_inputs():
+    key_1 = C.make_key({'wind_region': 'C', 'R': 500, 'height': 10.5})
+    key_2 = C.make_key({'height': np.float64(10.5), 'R': 500.0, 'wind_region': 'C '})
+    assert key_1 == key_2
+    assert key_1 != C.make_key({'wind_region': 'C', 'R': 500, 'height': 10.5}, tag='0.1.0|other')
+
+
+def test_make_key_handles_non_finite_and_types():
+    assert C.make_key({'x': 10.5}) != C.make_key({'x': '10.5'})
+    assert C.make_key({'x': True}) != C.make_key({'x': 1})
+    assert C.make_key({'x': np.nan}) == C.make_key({'x': float('nan')})
+    assert C.make_key({'x': np.inf}) != C.make_key({'x': -np.inf})
+    assert C.make_key({'x': 0.1 + 0.2}) != C.make_key({'x': 0.3})
+
+
+def test_result_cache_bulk_get_put(tmp_path):
+    cache = C.ResultCache(tmp_path / 'results.sqlite', namespace='V_sit_beta')
+    keys = [cache.key({'site': i}) for i in range(3)]
+    cache.put_many(keys[:2], [np.full(8, 40.0), np.arange(8.0)])
+    values = cache.get_many(keys)
+    assert np.array_equal(values[1], np.arange(8.0))
+    assert values[2] is None
+    stats = cache.stats
+    assert stats['hits'] == 2 and stats['misses'] == 1 and stats['entries'] == 2
+    cache.close()
+
+    # Results persist between sessions but not between table versions
+    with C.ResultCache(tmp_path / 'results.sqlite', namespace='V_sit_beta') as cache:
+        assert cache.get(keys[0]) is not None
+    with C.ResultCache(tmp_path / 'results.sqlite', namespace='V_sit_beta', version_tag='new') as cache:
+        assert cache.get(cache.key({'site': 0})) is None
+
+
+def test_result_cache_eviction():
+    cache = C.ResultCache(':memory:', max_bytes=3000)
+    keys = [cache.key({'site': i}) for i in range(10)]
+    for key in keys:
+        cache.put(key, np.zeros(100))
+    stats = cache.stats
+    assert stats['size_bytes'] <= 3000
+    assert stats['evictions'] > 0
+    assert cache.get(keys[-1]) is not None
+    assert cache.get(keys[0]) is None
@@ -0,0 +1,36 @@
+import math
+import numpy as np
+import pytest
+from windactionsAU import dynamic_response as DR
+
+
+def test_turbulence_intensity():
+    assert math.isclose(DR.turbulence_intensity('TC2', 10), 0.183)
+    assert math.isclose(DR.turbulence_intensity('TC3', 3), 0.271)
+    assert math.isclose(DR.turbulence_intensity('TC1', 25), 0.1435)
+    with pytest.raises(KeyError):
+        DR.turbulence_intensity('TC2.5', 200)
+    result = DR.turbulence_intensity(['TC1', 'TC4'], [[10], [300]])
+    assert result.shape == (2, 2)
+
+
+def test_dynamic_response_factor_single():
+    h, b, n_a, V, zeta, g_v = 100.0, 30.0, 0.4, 45.0, 0.01, 3.7
+    I_h = 0.131
+    L_h = 85 * (h / 10) ** 0.25
+    B_s = 1 / (1 + math.sqrt(36 * h ** 2 + 64 * b ** 2) / L_h)
+    g_R = math.sqrt(2 * math.log(600 * n_a))
+    k = n_a * (1 + g_v * I_h) / V
+    S = 1 / ((1 + 3.5 * k * h) * (1 + 4 * k * b))
+    N = n_a * L_h * (1 + g_v * I_h) / V
+    E_t = math.pi * N / (1 + 70.8 * N ** 2) ** (5 / 6)
+    expected = (1 + 2 * I_h * math.sqrt(g_v ** 2 * B_s + g_R ** 2 * S * E_t / zeta)) / (1 + 2 * g_v * I_h)
+    assert math.isclose(DR.dynamic_response_factor(h, b, n_a, V, 'TC2', zeta), expected)
+
+
+def test_dynamic_response_factor_batch():
+    n_a = np.array([0.2, 0.5, 1.5])
+    C_dyn = DR.dynamic_response_factor(np.array([[150.0], [80.0]]), 40.0, n_a, 50.0, 'TC3')
+    assert C_dyn.shape == (2, 3)
+    assert np.all(C_dyn[:, 2] == 1.0)
+    assert C_dyn[0, 0] > C_dyn[0, 1]
@@ -0,0 +1,42 @@
+import itertools
+import numpy as np
+from windactionsAU import envelope as EN
+
+
+def test_governing_pressures_matches_enumeration():
+    rng = np.random.default_rng(0)
+    n_members, n_directions = 20, 4
+    q = rng.uniform(0.5, 1.5, (n_members, n_directions))
+    C_pe = rng.uniform(-1.3, 0.8, (n_members, n_directions, 3))
+    C_pi = np.array([-0.3, 0.0, 0.2, 0.7])
+    K_c = np.array([[1.0, 1.0], [0.8, 1.0], [0.9, 0.9], [0.8, 0.8]])
+    K_a = rng.uniform(0.8, 1.0, (n_members, 1))
+
+    result = EN.governing_pressures(q, C_pe, C_pi, K_c, K_a=K_a)
+
+    for m in range(n_members):
+        cases = {}
+        for d, e, i in itertools.product(range(n_directions), range(3), range(4)):
+            p = q[m, d] * (K_a[m, 0] * K_c[i, 0] * C_pe[m, d, e] - K_c[i, 1] * C_pi[i])
+            cases[(d, e, i)] = p
+        assert np.isclose(result['p_max'][m], max(cases.values()))
+        assert np.isclose(result['p_min'][m], min(cases.values()))
+        record = result[m]
+        max_case = (record['max_direction'], record['max_cpe'], record['max_cpi'])
+        min_case = (record['min_direction'], record['min_cpe'], record['min_cpi'])
+        assert np.isclose(cases[max_case], record['p_max'])
+        assert np.isclose(cases[min_case], record['p_min'])
+
+
+def test_governing_pressures_pairs_factors_with_internal_pressures():
+    q = np.ones((2, 1))
+    C_pe = np.array([[[-0.9, 0.7]], [[-0.9, 0.7]]])
+    C_pi = np.array([-0.2, 0.7])
+    framing_type = np.array(['Type 1', 'Case z'])
+    result = EN.governing_pressures(q, C_pe, C_pi, framing_type=framing_type)
+    K_ce, K_ci = EN.action_combination_factor_batch(C_pi, 'Type 1')
+    # The reduced K_ci applies to the C_pi = 0.7 case only
+    assert np.isclose(result['p_max'][0], max(K_ce * 0.7 - K_ci * C_pi))
+    assert np.isclose(result['p_min'][0], min(K_ce * -0.9 - K_ci * C_pi))
+    assert np.isclose(result['p_min'][1], -0.9 - 0.7)
+    assert result['min_cpi'][1] == 1
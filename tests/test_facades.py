@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+from windactionsAU import facades as FA
+from windactionsAU import wind_speed as WS
+from windactionsAU import aerodynamic_shape_factors as ASF
+
+
+L_SHAPE = [[0, 0], [30, 0], [30, 10], [10, 10], [10, 20], [0, 20]]
+V_SIT = [45.36, 42.84, 42.84, 45.36, 45.36, 47.88, 50.40, 47.88]
+
+
+def test_facade_normals():
+    normals = FA.facade_normals([L_SHAPE, L_SHAPE[::-1]])
+    assert np.allclose(normals[0], [180, 90, 0, 90, 0, 270])
+    assert np.allclose(np.sort(normals[1]), np.sort(normals[0]))
+    padded = FA.facade_normals([[[0, 0], [10, 0], [10, 10], [0, 10], [np.nan, np.nan]]])
+    assert np.allclose(padded[0, :4], [180, 90, 0, 270])
+    assert np.isnan(padded[0, 4])
+    assert np.allclose(FA.facade_normals(L_SHAPE), normals[:1])
+
+
+def test_footprint_dimensions():
+    d, b = FA.footprint_dimensions([L_SHAPE], [[0, 90, 45]])
+    assert np.allclose(d[0, :2], [20, 30])
+    assert np.allclose(b[0, :2], [30, 20])
+    assert np.isclose(d[0, 2], (30 + 10) / np.sqrt(2))
+    single = FA.footprint_dimensions(L_SHAPE, [[0, 90, 45]])
+    assert np.allclose(single[0], d) and np.allclose(single[1], b)
+
+
+def test_facade_wind_actions_rectangle_matches_orthogonal():
+    rectangle = [[0, 0], [40, 0], [40, 20], [0, 20]]
+    actions = FA.facade_wind_actions([rectangle], [[0, 90, 180, 270, np.nan]], [V_SIT], h=8.0)
+    expected = WS.design_wind_speed(0, pd.Series(V_SIT, index=['N', 'NE', 'E', 'SE', 'S', 'SW', 'W', 'NW']))
+    assert np.allclose(actions['V_des'][0, :4], list(expected.values()))
+    assert np.isnan(actions['V_des'][0, 4])
+    assert np.isclose(actions['C_pe_leeward'][0, 0], ASF.ext_pressure_coeff_leeward_wall(20, 40, 0))
+    assert np.isclose(actions['C_pe_leeward'][0, 1], ASF.ext_pressure_coeff_leeward_wall(40, 20, 0))
+    roof = list(ASF.ext_pressure_coeff_roof_shallow(8.0, 20, 0).values())
+    assert np.allclose(actions['C_pe_roof'][0, 0], roof)
+    assert actions['C_pe_windward'][0, 0] == 0.7
+
+
+def test_facade_wind_actions_steep_roof():
+    rectangle = [[0, 0], [40, 0], [40, 20], [0, 20]]
+    actions = FA.facade_wind_actions(rectangle, [[0, 90]], [V_SIT], h=8.0, roof_pitch=20.0)
+    assert np.isnan(actions['C_pe_roof']).all()
+    assert actions['C_pe_roof_steep'].shape == (1, 2, 2, 2)
+    expected = np.array(ASF.ext_pressure_coeff_roof_steep(8.0, 20, 40, 20.0), dtype=float)
+    assert np.allclose(actions['C_pe_roof_steep'][0, 0], expected)
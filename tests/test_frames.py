@@ -0,0 +1,43 @@
+import numpy as np
+from windactionsAU import frames as F
+from windactionsAU import aerodynamic_shape_factors as ASF
+
+
+def test_portal_frame_loads_normal_to_ridge():
+    q = np.array([[1.2, 1.0, 0.9, 1.1]])
+    C_pi = np.array([-0.3, 0.7])
+    w = F.portal_frame_loads(q, 8.0, 20.0, 48.0, 6.0, 6.0, C_pi, roof_pitch=15.0)
+    assert w.shape == (1, 4, 2, 2, 4)
+
+    K_ce, K_ci = ASF.action_combination_factor(-0.3, 'Type 1')
+    C_pe = ASF.ext_pressure_coeff_windward_wall(8.0)
+    assert np.isclose(w[0, 0, 0, 0, 0], 1.2 * (K_ce * C_pe - K_ci * -0.3) * 6.0)
+    K_ce, K_ci = ASF.action_combination_factor(0.7, 'Type 1')
+    C_pe = ASF.ext_pressure_coeff_leeward_wall(20.0, 48.0, 15.0)
+    assert np.isclose(w[0, 0, 1, 1, 3], 1.2 * (K_ce * C_pe - K_ci * 0.7) * 6.0)
+
+    K_ce, K_ci = ASF.action_combination_factor(-0.3, 'Type 1')
+    upwind = np.sort(ASF.ext_pressure_coeff_roof_steep(8.0, 20.0, 48.0, 15.0)[0])
+    assert np.isclose(w[0, 0, 0, 0, 1], 1.2 * (K_ce * upwind[0] - K_ci * -0.3) * 6.0)
+    # Wind at 180 degrees mirrors the members
+    assert np.isclose(w[0, 2, 0, 0, 3] / 0.9, w[0, 0, 0, 0, 0] / 1.2)
+
+
+def test_portal_frame_loads_parallel_to_ridge():
+    position = np.array([3.0, 45.0])
+    w = F.portal_frame_loads(1.0, 8.0, 20.0, 48.0, position, 6.0, [0.0], roof_pitch=5.0)
+    # Frame near the windward end at 90 degrees and near the leeward end at 270
+    assert np.isclose(w[0, 1, 0, 0, 0], -0.65 * 0.8 * 6.0)
+    assert np.isclose(w[1, 3, 0, 0, 0], -0.65 * 0.8 * 6.0)
+    assert np.isclose(w[1, 1, 0, 0, 0], -0.2 * 0.8 * 6.0)
+    roof = ASF.ext_pressure_coeff_roof_shallow(8.0, 48.0, 5.0)['0 to 0.5h']
+    assert np.allclose(w[0, 1, :, 0, 1], np.array(roof) * 0.8 * 6.0)
+
+
+def test_frame_load_table():
+    w = F.portal_frame_loads(1.0, 8.0, 20.0, 48.0, [6.0, 12.0], 6.0, [-0.3, 0.2])
+    table = F.frame_load_table(w, [-0.3, 0.2], index=['F1', 'F2'])
+    assert len(table) == w.size
+    row = table[(table['Frame'] == 'F2') & (table['Direction'] == 90) & (table['C_pe Case'] == 'max')
+                & (table['C_pi'] == 0.2) & (table['Member'] == 'rafter_B')]
+    assert np.isclose(row['w'].iloc[0], w[1, 1, 1, 1, 2])
@@ -0,0 +1,51 @@
+import math
+import numpy as np
+from windactionsAU import hazard as HZ
+
+
+def test_hazard_curve():
+    p = HZ.hazard_curve(['C', 'A2'], [1.1, 0.95], [500, 1000], C_shp=[0.8, 1.2])
+    V = (122 - 104 * 500 ** -0.1) * 1.1
+    assert p.shape == (2, 2)
+    assert math.isclose(p[0, 0], 0.6e-3 * V ** 2 * 0.8)
+    assert p[1, 1] > p[1, 0]
+
+
+def test_lognormal_fragility():
+    assert np.isclose(HZ.lognormal_fragility(2.0, 2.0, 0.3), 0.5)
+    assert np.isclose(HZ.lognormal_fragility(2.0 * math.exp(0.3), 2.0, 0.3), 0.8413447, atol=1e-6)
+
+
+def test_expected_annual_loss():
+    # A step fragility at the 500 year pressure gives an EAL of 1/500
+    R = HZ.ari_grid(1, 10000, 4001)
+    p_500 = HZ.hazard_curve(['A2'], [1.0], [500.0])[0, 0]
+
+    def step(p, index):
+        return (p >= p_500).astype(float)
+
+    EAL = HZ.expected_annual_loss(['A2'], 1.0, fragility=step, R=R)
+    assert np.isclose(EAL[0], 1 / 500, rtol=1e-2)
+
+    # Chunking does not change the result
+    regions = np.array(['A2', 'C', 'B1', 'D'] * 5)
+    factors = np.linspace(0.9, 1.2, 20)
+    EAL_1 = HZ.expected_annual_loss(regions, factors, median=3.0, beta=0.4, loss=100.0, chunk_size=3)
+    EAL_2 = HZ.expected_annual_loss(regions, factors, median=3.0, beta=0.4, loss=100.0)
+    assert np.allclose(EAL_1, EAL_2)
+    assert np.all(EAL_1 > 0)
+
+
+def test_expected_annual_loss_memory_budget():
+    site_factor = np.linspace(0.8, 1.2, 1000)
+    reference = HZ.expected_annual_loss(['A2'] * 1000, site_factor, median=2.0, beta=0.4)
+    stats = {}
+    budgeted = HZ.expected_annual_loss(
+        ['A2'] * 1000, site_factor, median=2.0, beta=0.4, memory_budget=500_000, stats=stats
+    )
+    assert isinstance(budgeted, np.ndarray)
+    assert np.allclose(budgeted, reference)
+    memory = stats['memory']
+    assert memory['peak_bytes'] > 0
+    assert memory['chunks'] > 1
+    assert memory['chunk_size'] * memory['bytes_per_asset'] <= 500_000
@@ -0,0 +1,32 @@
+import tracemalloc
+import numpy as np
+from windactionsAU import memory as MEM
+
+
+def test_track_peak():
+    peaks = {}
+    with MEM.tracing() as started:
+        assert started and tracemalloc.is_tracing()
+        with MEM.track_peak(peaks, 'block', started):
+            np.ones(100_000)
+    assert not tracemalloc.is_tracing()
+    assert peaks['block'] >= 800_000
+    assert peaks['traced'] >= peaks['block']
+    with MEM.track_peak(None, 'block'):
+        pass
+
+
+def test_tracing_keeps_caller_tracing():
+    tracemalloc.start()
+    try:
+        with MEM.tracing() as started:
+            assert not started
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+
+def test_chunk_size_for_budget():
+    assert MEM.chunk_size_for_budget(1000, 10.0) == 100
+    assert MEM.chunk_size_for_budget(1000, 0.0) == 1000
+    assert MEM.chunk_size_for_budget(5, 10.0) == 1
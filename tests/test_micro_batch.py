@@ -0,0 +1,58 @@
+import asyncio
+import numpy as np
+import pandas as pd
+from windactionsAU import batch as B
+from windactionsAU import micro_batch as MB
+from windactionsAU import pipeline as PL
+
+
+def test_site_wind_speeds_batched():
+    actions = MB.AsyncWindActions(max_latency=0.01)
+    heights = [5.0, 10.0, 15.0, 20.0]
+
+    async def run():
+        return await asyncio.gather(*[
+            actions.site_wind_speeds('A2', 'TC2', height, orientation=30.0) for height in heights
+        ])
+
+    results = asyncio.run(run())
+    assert actions.sites.batches == 1
+    reference = PL.evaluate_sites(pd.DataFrame({
+        'wind_region': 'A2', 'terrain_category': 'TC2', 'height': heights, 'orientation': 30.0
+    }))
+    for result, (_, expected) in zip(results, reference.results.iterrows()):
+        assert np.allclose(result.to_numpy(dtype=float), expected.to_numpy(dtype=float))
+
+
+def test_invalid_requests_fail_alone():
+    actions = MB.AsyncWindActions(max_latency=0.01)
+    V_sit = np.full(8, 40.0)
+
+    async def run():
+        return await asyncio.gather(
+            actions.site_wind_speeds('A2', 'TC2', 10.0),
+            actions.site_wind_speeds('X9', 'TC2', 10.0),
+            actions.design_wind_speeds(10.0, V_sit),
+            actions.design_wind_speeds(120.0, V_sit),
+            return_exceptions=True
+        )
+
+    site, invalid_site, design, invalid_design = asyncio.run(run())
+    assert isinstance(site, pd.Series)
+    assert isinstance(invalid_site, ValueError) and 'Wind region' in str(invalid_site)
+    assert np.allclose(design, 40.0)
+    assert isinstance(invalid_design, ValueError)
+
+
+def test_max_batch_size():
+    actions = MB.AsyncWindActions(max_batch_size=3, max_latency=1.0)
+
+    async def run():
+        return await asyncio.gather(*[
+            actions.ext_pressure_coeffs(6.0, 20.0, 40.0, pitch) for pitch in [0.0, 5.0, 15.0, 20.0, 25.0, 30.0]
+        ])
+
+    results = asyncio.run(run())
+    assert actions.pressure_coefficients.batches == 2
+    expected = B.ext_pressure_coeff_all_directions_batch(6.0, 20.0, 40.0, [0.0, 5.0, 15.0, 20.0, 25.0, 30.0])
+    assert np.array_equal(np.stack(results), expected, equal_nan=True)
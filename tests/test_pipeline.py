@@ -0,0 +1,173 @@
+import tracemalloc
+import numpy as np
+import pandas as pd
+from windactionsAU import cache as C
+from windactionsAU import pipeline as PL
+from windactionsAU import wind_speed as WS
+
+
+def site_inputs():
+    return pd.DataFrame({
+        'wind_region': ['A2', 'C', 'B1', 'X9', 'A0'],
+        'terrain_category': ['TC2', 'TC2.5', 'TC3', 'TC2', 'TC1'],
+        'height': [10.0, 25.0, 7.5, 10.0, -1.0],
+        'importance_level': [2, 3, 2, 2, 2],
+        'orientation': [0.0, 45.0, 80.0, 0.0, 0.0],
+    })
+
+
+def scalar_site(row):
+    R = WS.average_recurrence_interval('50 Years', row.importance_level, False)
+    V_R = WS.regional_wind_speed(row.wind_region, R)
+    M_c = WS.climate_change_multiplier(row.wind_region)
+    M_d, _ = WS.wind_direction_multiplier(row.wind_region)
+    M_zcat = WS.terrain_height_multiplier(row.terrain_category, row.wind_region, row.height)
+    V_sit = WS.site_wind_speed(V_R, M_c, M_d, M_zcat, 1.0, 1.0)
+    return V_sit, WS.design_wind_speed(row.orientation, V_sit)
+
+
+def test_evaluate_sites_matches_scalar():
+    inputs = site_inputs()
+    batch = PL.evaluate_sites(inputs)
+    for i in range(3):
+        V_sit, V_des = scalar_site(inputs.iloc[i])
+        result = batch.results.iloc[i]
+        assert np.allclose(result[['V_sit_' + d for d in V_sit.index]].to_numpy(dtype=float), V_sit.to_numpy())
+        assert np.allclose(result[['V_des_0', 'V_des_90', 'V_des_180', 'V_des_270']].to_numpy(dtype=float), list(V_des.values()))
+
+
+def test_evaluate_sites_reports_invalid_rows():
+    batch = PL.evaluate_sites(site_inputs())
+    assert list(batch.errors) == [0, 0, 0, 1, 32]
+    assert batch.results.iloc[3:].isna().all().all()
+    assert list(batch.report['Rows']) == [1, 1]
+    assert batch.stats['valid_rows'] == 3
+
+
+def test_evaluate_sites_deduplicates_rows():
+    inputs = pd.concat([site_inputs()] * 4, ignore_index=True)
+    batch = PL.evaluate_sites(inputs)
+    assert batch.stats['unique_rows'] == 3
+    assert batch.stats['dedup_ratio'] == 4.0
+    reference = PL.evaluate_sites(inputs, deduplicate=False)
+    pd.testing.assert_frame_equal(batch.results, reference.results)
+
+
+def test_evaluate_sites_float32():
+    batch = PL.evaluate_sites(site_inputs(), dtype=np.float32)
+    assert (batch.results.dtypes == np.float32).all()
+    reference = PL.evaluate_sites(site_inputs())
+    assert np.allclose(batch.results.iloc[:3], reference.results.iloc[:3], rtol=1e-6)
+
+
+def test_precision_report():
+    rng = np.random.default_rng(1)
+    n = 500
+    inputs = pd.DataFrame({
+        'wind_region': rng.choice(['A2', 'B1', 'C', 'D'], n),
+        'terrain_category': rng.choice(['TC1', 'TC2', 'TC3'], n),
+        'height': rng.uniform(3, 60, n),
+        'orientation': rng.uniform(0, 90, n),
+    })
+    report = PL.precision_report(inputs, sample_size=200)
+    assert list(report.index) == PL.SITE_RESULT_COLUMNS
+    assert report.loc['V_sit_N', 'Max Rel Deviation'] < 1e-6
+    assert report['Max Abs Deviation'].max() <= 0.011
+    assert report.loc['V_R', 'Rounding Mismatches'] == 0
+    assert report['Rounding Mismatches'].notna().sum() == 5
+
+
+def test_update_sites(monkeypatch):
+    from windactionsAU import batch as B
+    inputs = site_inputs()
+    previous = PL.evaluate_sites(inputs)
+
+    revised = inputs.drop(index=4).copy()
+    revised.loc[1, 'height'] = 30.0
+    revised.loc[7] = ['A2', 'TC3', 12.0, 2, 10.0]
+    monkeypatch.setitem(B.M_D_TABLE, 'B1', B.M_D_TABLE['B1'] * 1.01)
+
+    result, changes = PL.update_sites(inputs, previous, revised)
+    reference = PL.evaluate_sites(revised)
+    pd.testing.assert_frame_equal(result.results, reference.results)
+    assert list(result.errors) == list(reference.errors)
+    assert result.stats['recomputed_rows'] == 3
+    assert changes.set_index('Key')['Change'].to_dict() == {7: 'added', 4: 'removed', 1: 'inputs', 2: 'tables'}
+    assert changes.set_index('Key').loc[2, 'Detail'] == 'M_d_B1'
+
+
+def test_update_sites_unchanged():
+    inputs = site_inputs()
+    previous = PL.evaluate_sites(inputs)
+    result, changes = PL.update_sites(inputs, previous, inputs.copy())
+    assert result.stats['recomputed_rows'] == 0
+    assert changes.empty
+    pd.testing.assert_frame_equal(result.results, previous.results)
+
+
+def test_evaluate_sites_memory_budget():
+    rng = np.random.default_rng(2)
+    n = 3000
+    inputs = pd.DataFrame({
+        'wind_region': rng.choice(['A2', 'B1', 'C'], n),
+        'terrain_category': rng.choice(['TC1', 'TC2', 'TC3'], n),
+        'height': rng.uniform(3, 60, n),
+        'orientation': rng.uniform(0, 90, n),
+    })
+    reference = PL.evaluate_sites(inputs)
+    batch = PL.evaluate_sites(inputs, memory_budget=500_000)
+    pd.testing.assert_frame_equal(batch.results, reference.results)
+    memory = batch.stats['memory']
+    assert memory['chunks'] > 1
+    assert memory['chunk_size'] * memory['bytes_per_row']['chunk'] <= 500_000
+    assert set(PL.SITE_STAGES) <= set(memory['peak_bytes'])
+    assert 'memory' not in reference.stats
+
+    # Tracing started by the caller keeps its peak
+    tracemalloc.start()
+    try:
+        np.ones(1_000_000)
+        peak = tracemalloc.get_traced_memory()[1]
+        PL.evaluate_sites(inputs.iloc[:300], memory_budget=500_000)
+        assert tracemalloc.get_traced_memory()[1] >= peak
+    finally:
+        tracemalloc.stop()
+
+
+def test_evaluate_sites_parses_boolean_strings():
+    inputs = pd.DataFrame({
+        'wind_region': ['A2', 'A2'], 'terrain_category': ['TC2', 'TC2'], 'height': [10.0, 10.0],
+        'importance_level': [1, 1], 'cyclonic': ['False', 'True'],
+    })
+    batch = PL.evaluate_sites(inputs)
+    assert list(batch.results['R']) == [100.0, 200.0]
+
+
+def test_evaluate_sites_unshielded_rows():
+    inputs = pd.DataFrame({
+        'wind_region': ['A2', 'A2'], 'terrain_category': ['TC3', 'TC3'], 'height': [10.0, 10.0],
+        'h_s': [12.0, 0.0], 'b_s': [10.0, 0.0], 'n_s': [4.0, 0.0],
+    })
+    batch = PL.evaluate_sites(inputs)
+    assert batch.results['M_s'].iloc[0] < 1.0
+    assert batch.results['M_s'].iloc[1] == 1.0
+    assert list(batch.errors) == [0, 0]
+
+
+def test_evaluate_sites_cache():
+    inputs = pd.concat([site_inputs()] * 2, ignore_index=True)
+    reference = PL.evaluate_sites(inputs, trace=True)
+    with C.ResultCache(':memory:', namespace='sites') as cache:
+        first = PL.evaluate_sites(inputs.iloc[:3], trace=True, cache=cache)
+        assert first.stats['cache'] == {'hits': 0, 'misses': 3}
+        batch = PL.evaluate_sites(inputs, trace=True, cache=cache)
+        assert batch.stats['cache'] == {'hits': 3, 'misses': 0}
+        assert batch.results.equals(reference.results)
+        assert np.array_equal(batch.trace, reference.trace)
+
+        # Rows are keyed by the floating point type and the trace flag
+        untraced = PL.evaluate_sites(inputs, dtype=np.float32, cache=cache)
+        assert untraced.stats['cache'] == {'hits': 0, 'misses': 3}
+        assert untraced.trace is None
+        assert untraced.results.dtypes.eq(np.float32).all()
+        assert 'cache' not in reference.stats
@@ -0,0 +1,70 @@
+import numpy as np
+from windactionsAU import raster as RA
+from windactionsAU import wind_speed as WS
+
+
+def grids():
+    region = np.full((5, 7), RA.REGION_CODES.index('A2'))
+    region[:, 4:] = RA.REGION_CODES.index('C')
+    region[0, 0] = -1
+    category = np.full((5, 7), RA.TERRAIN_CATEGORY_CODES.index('TC2'))
+    category[3:] = RA.TERRAIN_CATEGORY_CODES.index('TC3')
+    return region, category
+
+
+def test_site_wind_speed_map(tmp_path):
+    region, category = grids()
+    np.save(tmp_path / 'region.npy', region)
+    result = RA.site_wind_speed_map(
+        tmp_path / 'region.npy', category, tmp_path / 'out', R=500, height=10.0, tile_size=3, max_workers=2
+    )
+    assert result['tiles_calculated'] == 6
+    V_sit = np.load(result['V_sit'])
+    q = np.load(result['q'])
+    assert V_sit.shape == (5, 7, 8) and V_sit.dtype == np.float32
+    assert np.isnan(V_sit[0, 0]).all()
+
+    V_R = WS.regional_wind_speed('C', 500)
+    M_d, _ = WS.wind_direction_multiplier('C')
+    M_zcat = WS.terrain_height_multiplier('TC3', 'C', 10.0)
+    expected = WS.site_wind_speed(V_R, WS.climate_change_multiplier('C'), M_d, M_zcat, 1.0, 1.0)
+    assert np.allclose(V_sit[4, 6], expected.to_numpy(), rtol=1e-6)
+    assert np.allclose(q[4, 6], 0.6e-3 * V_sit[4, 6] ** 2)
+
+
+def test_site_wind_speed_map_resume(tmp_path):
+    region, category = grids()
+    out = tmp_path / 'out'
+    RA.site_wind_speed_map(region, category, out, tile_size=3)
+    reference = np.load(out / 'V_sit.npy')
+
+    # Simulate an interrupted run: one tile missing from the manifest and a
+    # partly written last line
+    with open(out / RA.MANIFEST) as f:
+        lines = f.read().splitlines()
+    lines.remove('[1, 2]')
+    with open(out / RA.MANIFEST, 'w') as f:
+        f.write('\n'.join(lines) + '\n[1,')
+    V_sit = np.load(out / 'V_sit.npy', mmap_mode='r+')
+    V_sit[3:, 6:] = 0.0
+    V_sit.flush()
+    del V_sit
+
+    result = RA.site_wind_speed_map(region, category, out, tile_size=3)
+    assert result['tiles_calculated'] == 1
+    assert result['tiles_skipped'] == 5
+    assert np.array_equal(np.load(out / 'V_sit.npy'), reference, equal_nan=True)
+
+    result = RA.site_wind_speed_map(region, category, out, tile_size=3, resume=False)
+    assert result['tiles_calculated'] == 6
+
+
+def test_site_wind_speed_map_inputs_invalidate_resume(tmp_path):
+    region, category = grids()
+    out = tmp_path / 'out'
+    RA.site_wind_speed_map(region, category, out, tile_size=3)
+    assert RA.site_wind_speed_map(region, category, out, tile_size=3)['tiles_skipped'] == 6
+    assert RA.site_wind_speed_map(region, category, out, tile_size=3, height=20.0)['tiles_calculated'] == 6
+    category[0, 0] = RA.TERRAIN_CATEGORY_CODES.index('TC1')
+    result = RA.site_wind_speed_map(region, category, out, tile_size=3, height=20.0)
+    assert result['tiles_calculated'] == 6
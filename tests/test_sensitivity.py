@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+from windactionsAU import batch as B
+from windactionsAU import sensitivity as SE
+from windactionsAU import wind_speed as WS
+
+
+REGIONS = np.array(['A2', 'A0', 'A4', 'B1'])
+CATEGORIES = np.array(['TC2', 'TC3', 'TC2.5', 'TC1'])
+HILL = dict(hill_height=np.array([40.0, 30.0, 60.0, 0.0]), L_u=np.array([200.0, 100.0, 150.0, 0.0]),
+            escarpment=np.array([False, True, False, False]), E=np.array([0.0, 0.0, 600.0, 0.0]))
+
+
+def site_wind_speeds(height, x):
+    V_R = B.regional_wind_speed_batch(REGIONS, 500.0)
+    M_d, _ = B.wind_direction_multiplier_batch(REGIONS)
+    M_t = B.topographic_multiplier_batch(REGIONS, height, HILL['hill_height'], HILL['L_u'], x, HILL['escarpment'], HILL['E'])
+    return B.site_wind_speed_batch(
+        V_R, B.climate_change_multiplier_batch(REGIONS), M_d,
+        B.terrain_height_multiplier_batch(CATEGORIES, REGIONS, height), 1.0, M_t
+    )
+
+
+def continuous_pressure(height, orientation, x):
+    """Design pressure from the exact sector maximum, by dense sampling."""
+    V_sit = site_wind_speeds(height, x)
+    p = np.empty((REGIONS.size, 4))
+    for k, angle in enumerate(B.ORTHOGONAL_ANGLES):
+        for i in range(REGIONS.size):
+            beta = np.linspace(orientation[i] + angle - 45, orientation[i] + angle + 45, 18001) % 360
+            V = np.interp(beta, np.arange(0, 405, 45), np.append(V_sit[i], V_sit[i, 0]))
+            p[i, k] = 0.6e-3 * max(V.max(), 30) ** 2
+    return p
+
+
+def test_design_pressure_sensitivities_match_finite_differences():
+    height = np.array([12.0, 17.0, 33.0, 7.0])
+    orientation = np.array([10.0, 33.0, 61.0, 80.0])
+    x = np.array([50.0, -40.0, 120.0, 0.0])
+    result = SE.design_pressure_sensitivities(REGIONS, CATEGORIES, height, orientation, x=x, **HILL)
+    step = 1e-3
+    for name, shift in [
+        ('dp_dheight', (step, 0, 0)),
+        ('dp_dorientation', (0, step, 0)),
+        ('dp_dx', (0, 0, step)),
+    ]:
+        upper = continuous_pressure(height + shift[0], orientation + shift[1], x + shift[2])
+        lower = continuous_pressure(height - shift[0], orientation - shift[1], x - shift[2])
+        assert np.allclose(result[name], (upper - lower) / (2 * step), rtol=1e-2, atol=1e-4), name
+    assert np.allclose(result['p'], continuous_pressure(height, orientation, x), rtol=1e-6)
+
+
+def test_terrain_height_multiplier_slope():
+    slope = SE.terrain_height_multiplier_slope(['TC2', 'TC2', 'TC2', 'TC3'], ['A2', 'A2', 'A2', 'A0'], [4.0, 12.0, 250.0, 160.0])
+    assert np.allclose(slope, [0.0, 0.05 / 5, 0.0, 0.0])
+
+
+
+def test_design_pressure_sensitivities_design_value():
+    height = np.array([12.0, 17.0, 33.0, 7.0])
+    orientation = np.array([10.0, 33.0, 61.0, 80.0])
+    x = np.array([50.0, -40.0, 120.0, 0.0])
+    result = SE.design_pressure_sensitivities(REGIONS, CATEGORIES, height, orientation, x=x, **HILL)
+    V_sit = site_wind_speeds(height, x)
+    for i in range(REGIONS.size):
+        expected = WS.design_wind_speed(orientation[i], pd.Series(V_sit[i], index=B.DIRECTIONS))
+        assert np.allclose(result['V_des_design'][i], [expected[str(angle) + ' Deg'] for angle in B.ORTHOGONAL_ANGLES])
+    assert np.all(result['V_des_design'] <= result['V_des'] + 0.005)
+    assert np.allclose(result['p_design'], 0.6e-3 * result['V_des_design'] ** 2)
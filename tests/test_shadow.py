@@ -0,0 +1,109 @@
+import numpy as np
+import pandas as pd
+from windactionsAU import batch as B
+from windactionsAU import pipeline as PL
+from windactionsAU import shadow as SH
+
+
+def site_inputs(n=200):
+    rng = np.random.default_rng(1)
+    return pd.DataFrame({
+        'wind_region': rng.choice(['A2', 'B1', 'C', 'D', 'A0'], n),
+        'terrain_category': rng.choice(['TC1', 'TC2', 'TC2.5', 'TC3', 'TC4'], n),
+        'height': rng.uniform(3, 50, n).round(1),
+        'importance_level': rng.choice([1, 2, 3], n),
+        'orientation': rng.choice(np.arange(0, 95, 5), n).astype(float),
+        'hill_height': rng.choice([0.0, 30.0], n),
+        'L_u': rng.choice([0.0, 100.0], n),
+        'x': rng.uniform(-50, 50, n),
+    })
+
+
+def test_shadow_finds_no_mismatches_in_float64():
+    shadow = SH.ShadowChecker(fraction=1.0, seed=0)
+    batch = PL.evaluate_sites(site_inputs(), shadow=shadow)
+    valid_rows = batch.stats['valid_rows']
+    assert 0 < valid_rows < 200
+    assert shadow.rows_checked == valid_rows
+    assert batch.stats['shadow'] == {'rows_checked': valid_rows, 'failed_rows': 0}
+    assert shadow.counters['mismatches'] == {}
+    assert shadow.mismatch_report().empty
+
+
+def test_shadow_samples_a_fraction_of_valid_rows():
+    inputs = site_inputs(2000)
+    inputs.loc[:9, 'wind_region'] = 'X9'
+    shadow = SH.ShadowChecker(fraction=0.05, seed=0)
+    PL.evaluate_sites(inputs, shadow=shadow)
+    assert 50 <= shadow.rows_checked <= 150
+    assert SH.ShadowChecker(fraction=0.0).sample(1000).size == 0
+
+
+def test_shadow_records_mismatches_with_inputs():
+    inputs = site_inputs(20)
+    batch = PL.evaluate_sites(inputs)
+    batch.results.loc[3, 'M_zcat'] += 0.01
+    shadow = SH.ShadowChecker(fraction=1.0, seed=0)
+    assert shadow.check_sites(inputs, batch) == 1
+    assert shadow.counters['mismatches'] == {'M_zcat': 1}
+    report = shadow.mismatch_report()
+    assert report.loc[0, 'Row'] == 3
+    assert report.loc[0, 'Column'] == 'M_zcat'
+    assert np.isclose(report.loc[0, 'Batch'] - report.loc[0, 'Scalar'], 0.01)
+    assert report.loc[0, 'height'] == inputs.loc[3, 'height']
+
+
+def test_shadow_counts_scalar_errors(monkeypatch):
+    def fail(*args):
+        raise KeyError('table')
+    monkeypatch.setattr(SH, 'terrain_height_multiplier', fail)
+    shadow = SH.ShadowChecker(fraction=1.0, max_records=1)
+    batch = PL.evaluate_sites(site_inputs(5), shadow=shadow)
+    assert shadow.scalar_errors == batch.stats['valid_rows']
+    assert len(shadow.records) == 1
+    assert shadow.mismatch_report().loc[0, 'Column'] == 'error'
+    assert shadow.mismatch_report().loc[0, 'Message'] == "KeyError: 'table'"
+
+
+def test_shadow_treats_n_s_zero_as_unshielded():
+    inputs = site_inputs(4).assign(
+        height=10.0, hill_height=0.0, h_s=[12.0, 12.0, 0.0, 0.0], b_s=[10.0, 10.0, 0.0, 0.0], n_s=[2.0, 1.0, 0.0, 0.0]
+    )
+    shadow = SH.ShadowChecker(fraction=1.0, seed=0)
+    batch = PL.evaluate_sites(inputs, shadow=shadow)
+    assert (batch.errors == 0).all()
+    assert batch.stats['shadow'] == {'rows_checked': 4, 'failed_rows': 0}
+
+
+def test_shadow_checks_pressure_coefficients():
+    rng = np.random.default_rng(2)
+    h = rng.uniform(3, 40, 300).round(1)
+    d = rng.uniform(5, 60, 300).round(1)
+    b = rng.uniform(5, 60, 300).round(1)
+    pitch = rng.choice([0.0, 5.0, 10.0, 17.0, 22.5, 30.0, 50.0], 300)
+    vary = rng.choice([True, False], 300)
+    shadow = SH.ShadowChecker(fraction=1.0, seed=0)
+    assert shadow.check_pressure_coefficients(h, d, b, pitch, vary) == 0
+    assert shadow.counters['rows_checked'] == 300
+
+    C_pe = B.ext_pressure_coeff_all_directions_batch(h, d, b, pitch, vary)
+    C_pe[7, 1, B.SURFACES.index('leeward'), 0] += 0.05
+    assert shadow.check_pressure_coefficients(h, d, b, pitch, vary, C_pe=C_pe) == 1
+    assert shadow.counters['mismatches'] == {'C_pe_90_leeward_min': 1}
+    report = shadow.mismatch_report()
+    assert report.loc[0, 'Row'] == 7
+    assert report.loc[0, 'h'] == h[7]
+
+
+def test_shadow_checks_net_pressures():
+    q = np.array([0.8, 1.0, 1.2])
+    C_pe = np.array([0.7, -0.5, -0.9])
+    C_pi = np.array([-0.3, 0.2])
+    K_a = np.array([1.0, 0.9, 0.8])
+    shadow = SH.ShadowChecker(fraction=1.0, seed=0)
+    assert shadow.check_net_pressures(q, C_pe, C_pi, K_a=K_a, K_ce=0.9) == 0
+    p = B.net_pressure_batch(q, C_pe, C_pi, K_a=K_a, K_ce=0.9)
+    p[2, 1] *= 1.01
+    assert shadow.check_net_pressures(q, C_pe, C_pi, K_a=K_a, K_ce=0.9, p=p) == 1
+    assert shadow.counters['mismatches'] == {'p_1': 1}
+    assert shadow.mismatch_report().loc[0, 'C_pe'] == -0.9
@@ -0,0 +1,35 @@
+import numpy as np
+from windactionsAU import storey_loads as SL
+from windactionsAU import wind_speed as WS
+from windactionsAU import aerodynamic_shape_factors as ASF
+
+
+def test_storey_wind_loads_single_building():
+    elevations = [[4.0, 8.0, 12.0, 16.0, 20.0]]
+    V_des = [[50.0, 45.0, 40.0, 35.0]]
+    loads = SL.storey_wind_loads(elevations, 30.0, 20.0, V_des, 'TC2', 'C')
+
+    M_zcat_h = WS.terrain_height_multiplier('TC2', 'C', 20.0)
+    M_zcat_8 = WS.terrain_height_multiplier('TC2', 'C', 8.0)
+    C_pe_w = ASF.ext_pressure_coeff_windward_wall(8.0, vary_with_height=True)
+    p_w = 0.6e-3 * (50.0 * M_zcat_8 / M_zcat_h) ** 2 * C_pe_w
+    p_l = 0.6e-3 * 50.0 ** 2 * ASF.ext_pressure_coeff_leeward_wall(20.0, 30.0, 0.0)
+    assert np.isclose(loads['p_windward'][0, 0, 1], p_w)
+    assert np.isclose(loads['p_leeward'][0, 0], p_l)
+    assert np.isclose(loads['force'][0, 0, 1], (p_w - p_l) * 30.0 * 4.0)
+
+    force = loads['force'][0, 0]
+    assert np.isclose(loads['shear'][0, 0, 0], force.sum())
+    base_moment = np.sum(force * np.array(elevations[0]))
+    assert np.isclose(loads['overturning_moment'][0, 0, 0], base_moment)
+    assert np.isclose(loads['overturning_moment'][0, 0, -1], force[-1] * 4.0)
+
+
+def test_storey_wind_loads_vectorised():
+    elevations = np.array([[3.0, 6.0, 9.0], [5.0, 10.0, 10.0]])
+    loads = SL.storey_wind_loads(elevations, [20.0, 40.0], [10.0, 15.0], 45.0, ['TC2', 'TC3'], ['A2', 'B1'])
+    assert loads['force'].shape == (2, 4, 3)
+    # Padding by repeating the roof level adds no load
+    assert loads['force'][1, 0, 2] == 0.0
+    single = SL.storey_wind_loads(elevations[1:, :2], 40.0, 15.0, 45.0, 'TC3', 'B1')
+    assert np.allclose(single['shear'][0, :, 0], loads['shear'][1, :, 0])
@@ -0,0 +1,46 @@
+import numpy as np
+from windactionsAU import topography as TP
+from windactionsAU import wind_speed as WS
+
+
+def ridge_raster(tile_size=16):
+    # North-south ridge of height 50 m centred on easting 500 m
+    easting = (np.arange(100) + 0.5) * 10.0
+    ridge = 50.0 * np.exp(-((easting - 500.0) / 150.0) ** 2)
+    data = np.tile(ridge, (100, 1))
+    return TP.ElevationRaster(data, cell_size=10.0, origin=(0.0, 1000.0), tile_size=tile_size)
+
+
+def test_raster_sample_and_tile_cache():
+    raster = ridge_raster()
+    assert np.isclose(raster.sample(505.0, 500.0), 50.0, atol=0.1)
+    raster.sample(np.array([505.0, 505.0]), np.array([500.0, 510.0]))
+    assert raster.tile_hits > 0
+
+
+def test_hill_parameters_west_wind():
+    raster = ridge_raster()
+    # Site on the crest, wind from the west (index 6)
+    params = TP.hill_parameters_from_dem(raster, [505.0], [500.0], upwind_length=450.0, downwind_length=450.0, chunk_size=1)
+    assert np.isclose(params['hill_height'][0, 6], 50.0, atol=1.0)
+    assert np.isclose(params['x'][0, 6], 0.0)
+    assert not params['escarpment'][0, 6]
+    # No hill along the ridge line (wind from the north)
+    assert np.isclose(params['hill_height'][0, 0], 0.0)
+
+
+def test_topographic_multipliers_match_scalar():
+    raster = ridge_raster()
+    M_t = TP.topographic_multipliers_from_dem(raster, [505.0, 305.0], [500.0, 500.0], z=[10.0, 10.0], wind_region=['C', 'C'], upwind_length=450.0, downwind_length=450.0)
+    params = TP.hill_parameters_from_dem(raster, [505.0, 305.0], [500.0, 500.0], upwind_length=450.0, downwind_length=450.0)
+    assert M_t.shape == (2, 8)
+    for i in range(2):
+        for j in range(8):
+            if params['hill_height'][i, j] > 0:
+                expected = WS.topographic_multiplier(
+                    'C', 10.0, params['hill_height'][i, j], params['L_u'][i, j],
+                    params['x'][i, j], params['escarpment'][i, j], params['E'][i, j]
+                )
+                assert np.isclose(M_t[i, j], expected)
+    assert M_t[0, 6] > 1.0
+    assert M_t[0, 0] == 1.0
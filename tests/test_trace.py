@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+from windactionsAU import batch as B
+from windactionsAU import pipeline as PL
+from windactionsAU import trace as T
+
+
+def test_topographic_multiplier_trace():
+    M_t, codes = B.topographic_multiplier_batch(
+        ['A2', 'A0', 'A4', 'A2'], 10.0, [0.0, 50.0, 50.0, 100.0], [100.0, 200.0, 200.0, 100.0],
+        [0.0, 100.0, 100.0, 10.0], [False, True, False, False], [0.0, 0.0, 600.0, 0.0], trace=True
+    )
+    assert np.array_equal(M_t, B.topographic_multiplier_batch(
+        ['A2', 'A0', 'A4', 'A2'], 10.0, [0.0, 50.0, 50.0, 100.0], [100.0, 200.0, 200.0, 100.0],
+        [0.0, 100.0, 100.0, 10.0], [False, True, False, False], [0.0, 0.0, 600.0, 0.0]
+    ))
+    assert list(codes) == [
+        T.M_H_FLAT | T.M_T_GENERAL,
+        T.M_H_GENERAL | T.M_H_ESCARPMENT | T.M_T_A0,
+        T.M_H_GENERAL | T.M_T_A4_ELEVATION,
+        T.M_H_STEEP | T.M_T_GENERAL,
+    ]
+
+
+def test_shielding_and_leeward_trace():
+    _, codes = B.shielding_multiplier_batch([20.0, 30.0, 10.0, 3.0], 20.0, 20.0, [1.0, 1.0, 10.0, 100.0], trace=True)
+    assert list(codes) == [T.M_S_SPACING, T.M_S_HEIGHT, T.M_S_INTERPOLATED, T.M_S_CLOSE]
+    _, codes = B.ext_pressure_coeff_leeward_wall_batch(20.0, 40.0, [5.0, 15.0, 22.0, 30.0], trace=True)
+    assert list(codes) == [T.C_PE_LEEWARD_FLAT, T.C_PE_LEEWARD_MID, T.C_PE_LEEWARD_TRANSITION, T.C_PE_LEEWARD_STEEP]
+
+
+def test_evaluate_sites_trace():
+    inputs = pd.DataFrame({
+        'wind_region': ['A0', 'C', 'X9'],
+        'terrain_category': ['TC2', 'TC3', 'TC2'],
+        'height': [10.0, 10.0, 10.0],
+        'importance_level': [1, 2, 2],
+        'cyclonic': [False, True, False],
+    })
+    batch = PL.evaluate_sites(inputs, trace=True)
+    assert list(batch.trace) == [
+        T.ARI_IL1_NON_CYCLONIC | T.M_H_FLAT | T.M_T_A0,
+        T.ARI_TABLE_F2 | T.M_H_FLAT | T.M_T_GENERAL,
+        0,
+    ]
+    assert PL.evaluate_sites(inputs).trace is None
+    assert len(T.decode_trace(batch.trace[0])) == 3
+    report = T.trace_report(batch.trace, inputs.index)
+    assert report.set_index('Code').loc[T.M_T_A0, 'Rows'] == 1
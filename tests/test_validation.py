@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+from windactionsAU import validation as VA
+
+
+def test_validate_inputs():
+    inputs = pd.DataFrame({
+        'wind_region': ['A2', 'Z', 'C', 'C', 'B1', 'A1'],
+        'terrain_category': ['TC2', 'TC2', 'TC5', 'TC3', 'TC3', 'TC1'],
+        'height': [10, 10, 10, 'ten', 12, 8],
+        'design_life': ['50 Years', '50 Years', '50 Years', '50 Years', '100 Years', '50 Years'],
+        'importance_level': [2, 2, 2, 2, 4, 2],
+        'orientation': [0, 45, 90, 100, 10, 10],
+        'h_s': [12, 12, 12, 12, 12, 4],
+        'b_s': [10, 10, 10, 10, 10, 10],
+        'n_s': [2, 2, 2, 2, 2, 2],
+    })
+    codes = VA.validate_inputs(inputs)
+    assert codes[0] == VA.VALID
+    assert codes[1] == VA.INVALID_REGION
+    assert codes[2] == VA.INVALID_TERRAIN_CATEGORY
+    assert codes[3] == VA.INVALID_HEIGHT | VA.INVALID_ORIENTATION | VA.INVALID_SHIELDING
+    assert codes[4] == VA.ARI_NOT_DEFINED
+    assert codes[5] == VA.INVALID_SHIELDING
+    assert len(VA.decode_errors(codes[3])) == 3
+
+    report = VA.validation_report(codes, inputs.index)
+    assert report.set_index('Code').loc[VA.INVALID_SHIELDING, 'Rows'] == 2
+    assert report.set_index('Code').loc[VA.INVALID_SHIELDING, 'First Row'] == 3
+
+
+def test_validate_boolean_and_position_columns():
+    inputs = pd.DataFrame({
+        'wind_region': ['A2'] * 4,
+        'terrain_category': ['TC2'] * 4,
+        'height': [10] * 4,
+        'cyclonic': ['False', 'yes', 'maybe', 1],
+        'escarpment': [False, 0, 'TRUE', None],
+        'x': [0.0, 'near', 10.0, 5.0],
+        'E': [0.0, 100.0, np.inf, 5.0],
+    })
+    codes = VA.validate_inputs(inputs)
+    assert codes[0] == VA.VALID
+    assert codes[1] == VA.INVALID_POSITION
+    assert codes[2] == VA.INVALID_BOOLEAN | VA.INVALID_POSITION
+    assert codes[3] == VA.INVALID_BOOLEAN
+    values, valid = VA.parse_boolean(inputs['cyclonic'].to_numpy())
+    assert list(values) == [False, True, False, True]
+    assert list(valid) == [True, True, False, True]
+
+
+def test_validate_unshielded_rows():
+    inputs = pd.DataFrame({
+        'wind_region': ['A2'] * 4,
+        'terrain_category': ['TC2'] * 4,
+        'height': [10] * 4,
+        'h_s': [12, 0, 4, 12],
+        'b_s': [10, 0, 10, 10],
+        'n_s': [2, 0, 0, -1],
+    })
+    codes = VA.validate_inputs(inputs)
+    assert list(codes) == [0, 0, 0, VA.INVALID_SHIELDING]
@@ -1,5 +1,6 @@
 import math
 import pandas as pd
+import pytest
 from windactionsAU import wind_speed as WS
 
 
@@ -9,6 +10,15 @@ def test_average_recurrence_interval():
     assert WS.average_recurrence_interval('50 Years', 4, False) == 2500
 
 
+def test_average_recurrence_interval_errors():
+    with pytest.raises(ValueError):
+        WS.average_recurrence_interval('5 Years', 4, False)
+    with pytest.raises(ValueError):
+        WS.average_recurrence_interval('100 Years', 4, False)
+    with pytest.raises(KeyError):
+        WS.average_recurrence_interval('7 Years', 2, False)
+
+
 def test_regional_wind_speed():
     assert WS.regional_wind_speed("A0", 500) == 45
     assert WS.regional_wind_speed("A2", 250) == 43
@@ -101,6 +111,15 @@ def test_design_wind_speed():
     assert WS.design_wind_speed(angle_3, V_sit_beta) == {'0 Deg': 45.36, '90 Deg': 47.88, '180 Deg': 50.4, '270 Deg': 47.88}
 
 
+def test_design_wind_speed_sector_past_north():
+    # The 270 degree sector of a building at 60 degrees spans 285 to 375 degrees
+    V_sit_beta = pd.Series(
+        data=[40.0, 60.0, 40.0, 40.0, 40.0, 40.0, 40.0, 40.0],
+        index=["N", "NE", "E", "SE", "S", "SW", "W", "NW"]
+    )
+    assert WS.design_wind_speed(60, V_sit_beta)['270 Deg'] == 46.67
+
+
 def test_wind_direction_multiplier():
     data_1 = {
         "N": 0.90,
@@ -152,6 +171,11 @@ def test_terrain_height_multiplier():
 
 
 def test_shielding_multiplier():
-    assert WS.shielding_multiplier(height=10, h_s=4, b_s=10, n_s=2) == 1.0
-    assert math.isclose(WS.shielding_multiplier(height=10, h_s=10, b_s=10, n_s=4), 0.996, abs_tol=1e-3)
+    # Shielding buildings lower than the building are rejected
+    with pytest.raises(ValueError):
+        WS.shielding_multiplier(height=10, h_s=4, b_s=10, n_s=2)
+    with pytest.raises(ZeroDivisionError):
+        WS.shielding_multiplier(height=10, h_s=10, b_s=10, n_s=0)
+    # s = 10 (10/4 + 5) / sqrt(10 x 10) = 7.5, interpolated in Table 4.3
+    assert math.isclose(WS.shielding_multiplier(height=10, h_s=10, b_s=10, n_s=4), 0.925, abs_tol=1e-3)
     # assert math.isclose(WS.shielding_multiplier(height=10, h_s=4, b_s=10, n_s=4), 0.996, abs_tol=1e-3)
\ No newline at end of file
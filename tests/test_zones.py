@@ -0,0 +1,41 @@
+import numpy as np
+from windactionsAU import zones as Z
+from windactionsAU import aerodynamic_shape_factors as ASF
+
+
+def test_side_wall_cpe_at():
+    h = 6.0
+    zones = ASF.ext_pressure_coeff_side_walls(h, 40.0)
+    distance = np.array([0.0, 3.0, 6.5, 13.0, 30.0])
+    expected = []
+    for x in distance:
+        for start, end, C_pe in zones.values():
+            if start <= x < end or (x >= end and end == max(3 * h, 40.0)):
+                expected.append(C_pe)
+                break
+    assert np.allclose(Z.side_wall_cpe_at(distance, h), expected)
+
+
+def test_side_wall_cpe_span_average():
+    # Span from 0.5h to 2.5h: 0.5h at -0.65, 1h at -0.5 and 0.5h at -0.3
+    expected = (0.5 * -0.65 + 1.0 * -0.5 + 0.5 * -0.3) / 2.0
+    assert np.isclose(Z.side_wall_cpe_span_average(3.0, 15.0, 6.0), expected)
+    assert np.isclose(Z.side_wall_cpe_span_average(15.0, 3.0, 6.0), expected)
+    assert np.isclose(Z.side_wall_cpe_span_average(3.0, 3.0, 6.0), -0.65)
+
+    # Vectorised over buildings and members
+    start = np.array([[0.0, 10.0], [0.0, 30.0]])
+    end = start + 5.0
+    result = Z.side_wall_cpe_span_average(start, end, np.array([[5.0], [10.0]]))
+    assert np.allclose(result, [[-0.65, -0.3], [-0.65, -0.2]])
+
+
+def test_roof_cpe_at_and_span_average():
+    h, d = 5.0, 20.0
+    zones = list(ASF.ext_pressure_coeff_roof_shallow(h, d, 5.0).values())
+    assert np.allclose(Z.roof_cpe_at([1.0, 4.0, 7.0, 12.0, 18.0], h, d), zones)
+
+    average = Z.roof_cpe_span_average(0.0, 10.0, h, d)
+    expected = (2.5 * np.array(zones[0]) + 2.5 * np.array(zones[1]) + 5.0 * np.array(zones[2])) / 10.0
+    assert np.allclose(average, expected)
+    assert Z.roof_cpe_span_average(np.zeros((3, 4)), 10.0, h, [[10.0], [20.0], [40.0]]).shape == (3, 4, 2)